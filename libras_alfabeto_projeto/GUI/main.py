@@ -1,18 +1,40 @@
+import time
+INICIO_PROCESSO = time.perf_counter()  # Referência para o tempo até a primeira tela interativa
+
+import argparse
 import tkinter as tk
 from tkinter import ttk, messagebox
 import cv2
-import mediapipe as mp
-from PIL import Image, ImageTk
 import random
+import sys
 import numpy as np
-from collections import deque, defaultdict
-import time
-import joblib
-from tensorflow.keras.models import load_model
 from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from app.nucleo import config
+from app.nucleo.adaptativo import ControladorAdaptativo
+from app.nucleo.carregamento import CarregadorRecursos
+from app.nucleo.estatico import carregar_estatico
+from app.nucleo.fontes import adicionar_argumentos_fonte, fonte_dos_argumentos
+from app.nucleo.imagens import GerenciadorImagens
+from app.nucleo.inferencia import carregar_rotulador, criar_motor
+from app.nucleo.landmarks import ExtratorLandmarks
+from app.nucleo.mascara import MascaraClasses
+from app.nucleo.metricas import MetricasEstagios
+from app.nucleo.pipeline import PipelineReconhecimento
+from app.nucleo.renderizacao import RenderizadorQuadros, desenhar_maos_leve
+from app.nucleo.roi import RastreadorROI
+from app.nucleo.secoes import SECOES
+from app.nucleo.suavizacao import DecisorAlvo, criar_suavizador, nome_sem_mao
+
 class AplicativoLibras:
-    def __init__(self, root):
+    # O que a tela de carregamento do nível espera ficar pronto
+    RECURSOS_NIVEL = (('camera', "Câmera"), ('detector', "Detector de mãos"), ('modelo', "Modelo"))
+
+    def __init__(self, root, opcoes_fonte=None):
+        # Fonte de quadros (câmera por padrão; ver app/nucleo/fontes.py)
+        self.opcoes_fonte = opcoes_fonte or adicionar_argumentos_fonte(argparse.ArgumentParser()).parse_args([])
+
         # Configuração de cores e estilo
         self.configurar_cores()
         
@@ -22,76 +44,20 @@ class AplicativoLibras:
         self.root.state('zoomed')
         self.root.configure(bg=self.COR_FUNDO)
         
-        # Configuração do MediaPipe
-        self.configurar_mediapipe()
-        
         # Estado do aplicativo
         self.inicializar_estado()
-        # Pré-carrega modelo e rótulos logo no início
-        if not self.modelo_gestos or not self.le_gestos:
-            self.modelo_gestos, self.le_gestos = self.carregar_modelo_gestos()
-        
-        # Estrutura de seções e níveis
-        self.secoes = {
-            "Alfabeto": {
-                1: ["A", "E", "I", "O", "U"],
-                2: ["B", "C", "D", "G", "L"],
-                3: ["M", "N", "P", "Q", "R"],
-                4: ["S", "T", "V", "W"],
-                5: ["H", "J", "K", "X"],
-                6: ["W", "Y", "Z"]
-            },
-            "Números": {
-                1: ["1", "2", "3", "4", "5"],
-                2: ["6", "7", "8", "9", "10"]
-            },
-            "Dias da Semana": {
-                1: ["SEGUNDA-FEIRA", "TERÇA-FEIRA", "QUARTA-FEIRA"],
-                2: ["QUINTA-FEIRA", "SEXTA-FEIRA", "SABADO", "DOMINGO"]
-            },
-            "Tempo": {
-                1: ["HORAS", "MINUTOS"],
-                2: ["ONTEM","AMANHA", "AGORA"],
-                3: ["MES", "ANO"]
-            },
-            "Perguntas": {
-                1: ["QUANDO", "ONDE"],
-                2: ["O QUE", "POR QUE"]
-            },
-            "Saudações": {
-                1: ["OI", "TCHAU", "TUDO BEM"],
-                2: ["POR FAVOR", "OBRIGADO", "DESCULPA"]
-            },
-            "Família": {
-                1: ["PAI", "MÃE", "IRMÃO", "IRMÃ"],
-                2: ["AVÔ", "AVÓ", "PADRASTO", "MADRASTA"],
-                3: ["TIO", "TIA", "PRIMO", "PRIMA"],
-                4: ["CUNHADA", "CUNHADO", "SOGRO", "SOGRA"],
-                5: ["NAMORADO", "NAMORADA", "NOIVO", "NOIVA"],
-                6: ["ESPOSO", "ESPOSA", "FILHO", "FILHA"]
-            },
-            "Alimentos": {
-                1: ["MAÇÃ", "LARANJA", "UVA", "MELANCIA"],
-                2: ["LIMÃO", "MELÃO", "TOMATE", "ABACAXI"],
-                3: ["BATATA", "CENOURA", "BETERRABA", "CEBOLA"],
-                4: ["ABOBRINHA", "PEPINO", "ALHO", "MANDIOCA"],
-                5: ["ÁGUA", "SUCO", "LEITE", "CAFÉ", "REFRIGERANTE"]
-            },
-            "Cores": {
-                1: ["AZUL", "AMARELO", "VERDE", "VERMELHO"],
-                2: ["ROSA", "ROXO", "LARANJA", "BRANCO", "PRETO"]
-            },
-            "Animais": {
-                1: ["CÃO", "GATO", "PEIXE", "CAVALO", "PÁSSARO"],
-                2: ["MACACO", "LEÃO", "BALEIA"],
-                3: ["FORMIGA", "ABELHA", "BORBOLETA", "MINHOCA"]
-            },
-            "Adjetivos": {
-                1: ["BONITO", "FEIO", "ALTO", "BAIXO"],
-                2: ["GRANDE", "PEQUENO", "VELHO", "NOVO"],
-                3: ["RÁPIDO", "DEVAGAR", "QUENTE", "FRIO"]
-            }
-        }
+
+        # MediaPipe e modelo (TensorFlow) carregam uma vez, em segundo plano,
+        # enquanto o splash e o menu já respondem
+        self.carregador = CarregadorRecursos()
+        self.carregador.adicionar('detector', self.criar_detector)
+        self.carregador.adicionar('modelo', self.carregar_modelo_gestos)
+        self.root.after(100, self.acompanhar_carregamento)
+        # Imagens de referência dos gestos (pré-carregadas por seção em iniciar_nivel)
+        self.imagens = GerenciadorImagens(Path(__file__).resolve().parents[1] / 'imagens')
+        
+        # Estrutura de seções e níveis (ver nucleo/secoes.py)
+        self.secoes = SECOES
 
         self.icones_secoes = {
             "Alfabeto": "🔤", "Números": "🔢", "Dias da Semana": "📅",
@@ -108,6 +74,11 @@ class AplicativoLibras:
         
         self.mostrar_tela_inicial()
 
+    def registrar_tela_interativa(self):
+        """Mede o tempo do início do processo até o menu de seções responder"""
+        self.tempo_interativo = time.perf_counter() - INICIO_PROCESSO
+        print(f"⏱️ Primeira tela interativa em {self.tempo_interativo:.2f}s")
+
     def configurar_cores(self):
         """Define as cores padrão do aplicativo"""
         self.COR_PRIMARIA = "#6A0DAD"  # Roxo
@@ -122,61 +93,106 @@ class AplicativoLibras:
         self.COR_BORDA = "#E0E0E0"  # Cinza claro para bordas
         self.COR_SOMBRA = "#DDDDDD"  # Cor para sombra
 
-    def configurar_mediapipe(self):
-        """Configura o MediaPipe para detecção de mãos - criado uma vez só"""
-        self.mp_hands = mp.solutions.hands
-        if not hasattr(self, 'hands') or self.hands is None:
-            self.hands = self.mp_hands.Hands(
-                static_image_mode=False,
-                max_num_hands=2,
-                min_detection_confidence=0.7,
-                min_tracking_confidence=0.5
-            )
-        self.mp_drawing = mp.solutions.drawing_utils
-        self.mp_drawing_styles = mp.solutions.drawing_styles
+    def criar_detector(self):
+        """Importa o MediaPipe e cria o detector de mãos - uma vez só (thread de carregamento)"""
+        import mediapipe as mp
+        hands = mp.solutions.hands.Hands(
+            static_image_mode=False,
+            max_num_hands=2,
+            min_detection_confidence=0.7,
+            min_tracking_confidence=0.5
+        )
+        return mp, hands
+
+    def aplicar_recursos(self):
+        """Passa ao app o que já terminou de carregar e avisa falhas (thread do Tk)"""
+        c = self.carregador
+        if self.hands is None and c.estado('detector') == c.PRONTO:
+            mp, self.hands = c.resultado('detector')
+            self.mp_hands = mp.solutions.hands
+            self.mp_drawing = mp.solutions.drawing_utils
+            self.mp_drawing_styles = mp.solutions.drawing_styles
+        if self.modelo_gestos is None and c.estado('modelo') == c.PRONTO:
+            self.modelo_gestos, self.le_gestos, self.estatico = c.resultado('modelo')
+
+        for nome, erro in list(c.erros.items()):
+            if nome in self.erros_avisados:
+                continue
+            self.erros_avisados.add(nome)
+            if nome == 'modelo':
+                texto = str(erro) if isinstance(erro, FileNotFoundError) else f"Falha ao carregar modelo: {erro}"
+            elif nome == 'detector':
+                texto = f"Falha ao iniciar o detector de mãos: {erro}"
+            else:
+                texto = f"Falha ao iniciar câmera: {erro}"
+            messagebox.showerror("Erro", texto)
+
+    def acompanhar_carregamento(self):
+        """Aplica detector e modelo assim que ficam prontos e registra os tempos"""
+        c = self.carregador
+        if not (c.concluido('detector') and c.concluido('modelo')):
+            self.root.after(100, self.acompanhar_carregamento)
+            return
+        self.aplicar_recursos()
+        print(f"⏱️ Em segundo plano: detector {c.tempos['detector']:.2f}s | "
+              f"modelo {c.tempos['modelo']:.2f}s | "
+              f"{time.perf_counter() - INICIO_PROCESSO:.2f}s desde o início")
 
     def inicializar_estado(self):
         """Inicializa o estado do aplicativo"""
         self.cap = None
+        self.pipeline = None
+        self.controlador = None
+        self.hands = None
+        self.mp_hands = self.mp_drawing = self.mp_drawing_styles = None
+        self.extrator_landmarks = ExtratorLandmarks()
+        self.modelo_gestos, self.le_gestos = None, None
+        self.estatico = None  # Classificador de um frame para gestos parados (config.ESTATICO)
+        self.erros_avisados = set()
+        self.tempo_interativo = None
         self.running = False
-        self.frame_count = 0
-        self.skip_frames = 1  # Reduzido para melhor performance
+        self.ultimo_log_metricas = 0
+        self.INTERVALO_LOG_METRICAS = 5  # Segundos entre logs de desempenho
+        self.renderizador = None
+        self.tempo_ui_ocupado = 0.0  # Tempo gasto em atualizar_frame desde o último log
         self.nivel_atual = 1
         self.pontuacao = 0
         self.gesto_alvo = None
-        self.buffer_gestos = deque(maxlen=30)
-        self.historico_predicoes = deque(maxlen=15)
-        self.frames_sem_maos = 0
+        self.suavizador = None  # Criado com as classes do modelo (ver iniciar_camera)
+        self.decisor = None     # Aceite rápido do gesto alvo (config.DECISAO_ALVO)
+        self.mascara = None     # Só os gestos do nível concorrem (config.MASCARA_NIVEL)
+        self.decisor_estatico = None  # Aceite do alvo estático frame a frame
         self.RESET_THRESHOLD = 10
         self.niveis_completos = {}
         self.secoes_liberadas = ["Alfabeto"]
         self.tempo_inicio = 0
         self.tempo_gasto = 0
         self.ultimo_gesto_reconhecido = None
-        self.modelo_gestos, self.le_gestos = self.carregar_modelo_gestos()
         self.camera_timeout = 5  # Timeout de 5 segundos para inicialização da câmera
 
     def carregar_modelo_gestos(self):
-        """Carrega o modelo de gestos e o rotulador"""
-        try:
-            modelos_dir = Path("modelos")
-            modelo_path = modelos_dir / "modelo_gestos.h5"
-            rotulador_path = modelos_dir / "rotulador_gestos.pkl"
-            
-            if not modelo_path.exists() or not rotulador_path.exists():
-                messagebox.showerror("Erro", 
-                    "Modelo de gestos não encontrado!\n\n"
-                    "Verifique se os arquivos estão em:\n"
-                    f"{modelo_path}\n{rotulador_path}")
-                return None, None
-            
-            modelo = load_model(modelo_path)
-            le = joblib.load(rotulador_path)
-            print(f"Modelo carregado. Classes: {list(le.classes_)}")
-            return modelo, le
-        except Exception as e:
-            messagebox.showerror("Erro", f"Falha ao carregar modelo: {str(e)}")
-            return None, None
+        """Carrega o modelo de gestos e o rotulador (thread de carregamento; erros
+        são exibidos por aplicar_recursos)"""
+        modelo_path = config.MODEL_PATH
+        rotulador_path = config.LABEL_PATH
+        # No backend remoto o modelo fica no servidor de reconhecimento; o índice
+        # de gestos traz as próprias classes (e avisa se faltar o arquivo)
+        remoto = config.BACKEND_INFERENCIA == 'remoto'
+        indice = config.BACKEND_INFERENCIA == 'indice'
+        
+        if not indice and (not (remoto or modelo_path.exists()) or not rotulador_path.exists()):
+            raise FileNotFoundError(
+                "Modelo de gestos não encontrado!\n\n"
+                "Verifique se os arquivos estão em:\n"
+                f"{modelo_path}\n{rotulador_path}")
+        
+        modelo = criar_motor(caminho_modelo=modelo_path)
+        le = carregar_rotulador(modelo, rotulador_path)
+        print(f"Modelo carregado ({modelo.nome}). Classes: {list(le.classes_)}")
+        estatico = carregar_estatico(le.classes_)
+        if estatico is not None:
+            print(f"Classificador estático: {', '.join(sorted(estatico.estaticos))}")
+        return modelo, le, estatico
 
     # Métodos de interface
     def mostrar_tela_inicial(self):
@@ -206,6 +222,8 @@ class AplicativoLibras:
         """Tela com seções e níveis"""
         self.limpar_tela()
         self.configurar_estilo_progressbar()
+        if self.tempo_interativo is None:
+            self.root.after_idle(self.registrar_tela_interativa)
         
         main_frame = tk.Frame(self.root, bg=self.COR_FUNDO)
         main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
@@ -477,30 +495,38 @@ class AplicativoLibras:
         """Inicia um nível com tela de carregamento"""
         self.limpar_tela()
         self.criar_tela_carregamento(secao, nivel)
-        self.root.after(100, lambda: self.carregar_nivel_background(secao, nivel, 0))
-
-    def carregar_nivel_background(self, secao, nivel, progresso):
-        """Atualiza o progresso em background con estágios específicos"""
-        if progresso <= 33:
-            self.loading_stage.config(text="Inicializando câmera...")
-            if progresso == 10:
-                self.pre_iniciar_camera()
-        elif progresso <= 66:
-            self.loading_stage.config(text="Carregando modelo de reconhecimento...")
-        else:
-            self.loading_stage.config(text="Preparando interface...")
+        # A câmera abre em segundo plano; detector e modelo já vêm carregando desde o início
+        self.inicio_carregamento = time.perf_counter()
+        self.carregador.descartar('camera')
+        self.carregador.adicionar('camera', self.abrir_camera)
+        # Imagens da seção (nível atual primeiro); não seguram a tela de carregamento
+        gestos = self.secoes[secao][nivel] + [g for n, letras in self.secoes[secao].items()
+                                              if n != nivel for g in letras]
+        self.carregador.descartar('imagens')
+        self.carregador.adicionar('imagens', lambda: self.imagens.pre_carregar(gestos))
+        self.root.after(50, lambda: self.carregar_nivel_background(secao, nivel))
+
+    def carregar_nivel_background(self, secao, nivel):
+        """Acompanha a prontidão real de câmera, detector e modelo"""
+        c = self.carregador
+        icones = {c.PRONTO: "✅", c.ERRO: "❌"}
+        self.loading_stage.config(text="   ".join(
+            f"{icones.get(c.estado(nome), '⏳')} {rotulo}" for nome, rotulo in self.RECURSOS_NIVEL))
+        
+        concluidos = sum(c.concluido(nome) for nome, _ in self.RECURSOS_NIVEL)
+        progresso = round(100 * concluidos / len(self.RECURSOS_NIVEL))
+        self.loading_progress['value'] = progresso
+        self.loading_percent.config(text=f"{progresso}%")
+        
+        if concluidos < len(self.RECURSOS_NIVEL):
+            self.root.after(50, lambda: self.carregar_nivel_background(secao, nivel))
+            return
         
-        if progresso <= 100:
-            self.loading_progress['value'] = progresso
-            self.loading_percent.config(text=f"{progresso}%")
-            self.root.update_idletasks()
-            
-            incremento = 1 if progresso > 90 else 2 if progresso > 50 else 5
-            self.root.after(50, lambda: self.carregar_nivel_background(
-                secao, nivel, progresso + incremento))
-        else:
-            self.loading_frame.destroy()
-            self.iniciar_nivel_real(secao, nivel)
+        self.aplicar_recursos()
+        self.cap = c.resultado('camera')
+        print(f"⏱️ Nível pronto em {time.perf_counter() - self.inicio_carregamento:.2f}s")
+        self.loading_frame.destroy()
+        self.iniciar_nivel_real(secao, nivel)
 
     def criar_tela_carregamento(self, secao, nivel):
         """Cria a tela de carregamento com mais informações"""
@@ -542,24 +568,6 @@ class AplicativoLibras:
             self.loading_spinner.config(text=spinners[idx])
             self.root.after(300, self.animar_spinner)
 
-    def pre_iniciar_camera(self):
-        """Pré-inicia a câmera em modo leve para reduzir tempo de espera"""
-        try:
-            # Configuração leve para inicialização rápida
-            self.cap = cv2.VideoCapture(0, cv2.CAP_DSHOW)
-            if self.cap.isOpened():
-                self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)  # Resolução menor inicial
-                self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
-                self.cap.set(cv2.CAP_PROP_FPS, 15)
-                
-                # Lê um frame para "aquecer" a câmera
-                ret, frame = self.cap.read()
-                if ret:
-                    self.cap.release()  # Libera para ser reiniciada corretamente depois
-                    self.cap = None
-        except Exception as e:
-            print(f"Erro na pré-inicialização da câmera: {e}")
-
     def iniciar_nivel_real(self, secao, nivel):
         """Inicia o nível após o carregamento"""
         self.secao_atual = secao
@@ -688,6 +696,11 @@ class AplicativoLibras:
         self.video_label = tk.Label(video_container, bg="white")
         self.video_label.pack(fill=tk.BOTH, expand=True)
         
+        # FPS e ajustes atuais do controle adaptativo
+        self.desempenho_label = tk.Label(frame, text="", font=("Helvetica", 9),
+                                         bg=self.COR_CARD, fg="gray")
+        self.desempenho_label.grid(row=2, column=0, sticky="e", padx=10, pady=(0, 5))
+        
         return frame
 
     def criar_controles_inferiores(self, parent):
@@ -752,6 +765,7 @@ class AplicativoLibras:
             self.gesto_alvo = self.letras_nivel[self.letra_atual_idx]
             self.gesto_alvo_label.config(text=self.gesto_alvo)
             self.letra_atual_idx += 1
+            self.rotear_alvo()
             self.feedback_label.config(text="Mostre o gesto para a câmera", fg=self.COR_TEXTO_ESCURO)
             self.atualizar_progresso()
             
@@ -777,6 +791,7 @@ class AplicativoLibras:
                     if proxima_secao not in self.secoes_liberadas:
                         self.secoes_liberadas.append(proxima_secao)
             
+            print(f"[imagens] {self.imagens.formatar()}")
             self.mostrar_tela_parabens()
 
     def atualizar_imagem_letra(self):
@@ -784,25 +799,20 @@ class AplicativoLibras:
         if not hasattr(self, 'gesto_alvo') or not self.gesto_alvo:
             return
         
-        # Caminho para a pasta com as imagens das letras
-        letra = self.gesto_alvo.lower()  # Assumindo que as imagens estão em minúsculo
-        caminho_imagem = f"libras_alfabeto_projeto/imagens/{letra}.png"  # Ajuste o caminho conforme necessário
-        
         try:
-            # Carrega la imagem e redimensiona
-            img = Image.open(caminho_imagem)
-            img = img.resize((200, 200), Image.LANCZOS)  # Tamanho ajustável
-            img = ImageTk.PhotoImage(img)
+            # Já reduzida a 200x200 (e em geral pré-carregada com o nível)
+            img = self.imagens.obter(self.gesto_alvo)
+            if img is None:
+                # Se a imagem não existir, mostra um placeholder
+                self.imagem_letra_label.config(image="", text="Imagem não disponível",
+                                            font=("Helvetica", 14),
+                                            fg=self.COR_ERRO)
+                return
             
             # Atualiza o label da imagem
             self.imagem_letra_label.config(image=img)
             self.imagem_letra_label.image = img  # Mantém uma referência
             
-        except FileNotFoundError:
-            # Se a imagem não existir, mostra um placeholder
-            self.imagem_letra_label.config(text="Imagem não disponível", 
-                                        font=("Helvetica", 14),
-                                        fg=self.COR_ERRO)
         except Exception as e:
             print(f"Erro ao carregar imagem: {e}")
             self.imagem_letra_label.config(text="Erro ao carregar imagem",
@@ -824,29 +834,54 @@ class AplicativoLibras:
         if self.running:
             return
             
-        try:
-            start_time = time.time()
-            self.cap = cv2.VideoCapture(0, cv2.CAP_DSHOW)
-            
-            # Configura timeout para inicialização
-            while not self.cap.isOpened() and (time.time() - start_time) < self.camera_timeout:
-                time.sleep(0.1)
-                
-            if not self.cap.isOpened():
-                messagebox.showerror("Erro", "Timeout ao acessar a câmera")
-                return
-            
-            # Configurações con tamanho fixo que corresponde ao display
-            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)  # Resolução fixa
-            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
-            self.cap.set(cv2.CAP_PROP_FPS, 20)  # FPS reduzido para melhor performance
+        if self.hands is None:
+            self.feedback_label.config(text="Detector de mãos ainda carregando...")
+            return
             
-            # Configurações de buffer para reduzir latência
-            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        try:
+            if self.cap is None:  # Já vem aberta da tela de carregamento
+                self.cap = self.abrir_camera()
             
+            # Captura, MediaPipe e LSTM rodam fora da thread do Tk; a janela
+            # (frames por predição) vem dos metadados do modelo
+            streaming = getattr(self.modelo_gestos, 'streaming', False)
+            tamanho_sequencia = getattr(self.modelo_gestos, 'tamanho_sequencia', config.SEQUENCE_LENGTH)
+            parcial = config.MIN_FRAMES_PARCIAL if config.DECISAO_ALVO and not streaming else None
+            metricas = MetricasEstagios()
+            # Gravações no modo rápido não podem perder quadros: sem adaptação
+            self.controlador = ControladorAdaptativo(
+                metricas, ativo=config.ADAPTATIVO and not getattr(self.cap, 'deterministico', False))
+            self.pipeline = PipelineReconhecimento(
+                self.cap,
+                detectar=self.criar_detectar(),
+                extrair_landmarks=self.extrator_landmarks.extrair,
+                inferir=self.inferir_gesto if self.modelo_gestos else None,
+                desenhar=self.desenhar_landmarks,
+                tamanho_sequencia=tamanho_sequencia,
+                reset_threshold=self.RESET_THRESHOLD,
+                metricas=metricas,
+                streaming=self.modelo_gestos if streaming else None,
+                controlador=self.controlador,
+                min_frames_parcial=parcial,
+                estatico=self.estatico
+            )
+            self.pipeline.iniciar()
             self.running = True
-            self.frame_count = 0
-            self.skip_frames = 1  # Processa mais frames
+            self.ultimo_log_metricas = time.time()
+            self.tempo_ui_ocupado = 0.0
+            self.renderizador = RenderizadorQuadros(self.video_label, metricas=metricas)
+            if self.le_gestos is not None:
+                self.suavizador = criar_suavizador(self.le_gestos.classes_)
+                self.decisor = DecisorAlvo(self.le_gestos.classes_) if config.DECISAO_ALVO else None
+                self.mascara = MascaraClasses(self.le_gestos.classes_,
+                                              permitidas=self.letras_nivel if config.MASCARA_NIVEL else None)
+                if self.mascara.ausentes:
+                    print(f"⚠️ Gestos do nível sem classe no modelo: {', '.join(self.mascara.ausentes)}")
+                if self.estatico is not None:
+                    self.decisor_estatico = DecisorAlvo(self.le_gestos.classes_,
+                                                        confianca=config.ESTATICO_CONFIANCA,
+                                                        estabilidade=config.ESTATICO_ESTABILIDADE)
+            self.rotear_alvo()
             
             # Feedback visual
             self.feedback_label.config(text="Câmera iniciada - Ajustando...")
@@ -856,30 +891,99 @@ class AplicativoLibras:
             messagebox.showerror("Erro", f"Falha ao iniciar câmera: {str(e)}")
             self.cap = None
 
+    def criar_detectar(self):
+        """Detector do pipeline: quadro inteiro ou recorte nas mãos (LIA_ROI=1)"""
+        if config.ROI:
+            return RastreadorROI(self.hands.process, resetar=self.hands.reset)
+        return self.hands.process
+
+    def abrir_camera(self):
+        """Abre e configura a fonte de quadros (também roda na thread de carregamento)"""
+        start_time = time.time()
+        cap = self.abrir_fonte()
+        
+        # Configura timeout para inicialização
+        while not cap.isOpened() and (time.time() - start_time) < self.camera_timeout:
+            time.sleep(0.1)
+            
+        if not cap.isOpened():
+            raise TimeoutError("Timeout ao acessar a câmera")
+        
+        # Configurações con tamanho fixo que corresponde ao display
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)  # Resolução fixa
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+        cap.set(cv2.CAP_PROP_FPS, 20)  # FPS reduzido para melhor performance
+        
+        # Configurações de buffer para reduzir latência
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        
+        if not cap.offline:
+            cap.read()  # Primeiro quadro "aquece" a câmera
+        return cap
+
+    def abrir_fonte(self):
+        """Abre a câmera (DirectShow no Windows) ou a gravação escolhida na linha de comando"""
+        api = cv2.CAP_DSHOW if sys.platform == 'win32' else None
+        return fonte_dos_argumentos(self.opcoes_fonte, api_camera=api)
+
     def atualizar_frame(self):
-        """Atualiza o frame da câmera con tratamento de erros"""
+        """Consome o último frame e os eventos do pipeline (thread do Tk)"""
         if not self.running:
             return
+        inicio_ui = time.perf_counter()
             
         try:
-            self.frame_count += 1
-            ret, frame = self.cap.read()
+            for evento in self.pipeline.coletar_eventos():
+                if evento['tipo'] == 'erro_captura':
+                    print("Erro ao capturar frame - tentando reiniciar câmera")
+                    self.reiniciar_camera()
+                    return
+                elif evento['tipo'] == 'fim_fonte':
+                    print(f"[pipeline] Fim da gravação: {self.pipeline.metricas.formatar()}")
+                    self.parar_camera()
+                    self.btn_camera.config(text="▶️ Iniciar Câmera")
+                    self.feedback_label.config(text="Fim da gravação")
+                    return
+                elif evento['tipo'] == 'sem_maos':
+                    self.feedback_label.config(text="Mãos não detectadas", fg=self.COR_ERRO)
+                elif evento['tipo'] == 'erro_inferencia':
+                    self.feedback_label.config(
+                        text="Erro no reconhecimento. Tente novamente",
+                        foreground=self.COR_ERRO
+                    )
+                elif evento['tipo'] == 'predicao':
+                    self.reconhecer_gesto(evento['preds'], evento.get('parcial', False),
+                                          evento.get('estatico', False))
             
-            if not ret:
-                print("Erro ao capturar frame - tentando reiniciar câmera")
-                self.reiniciar_camera()
-                return
-                
-            if self.frame_count % (self.skip_frames + 1) == 0:
-                frame = self.processar_frame(frame)
+            item = self.pipeline.frame_mais_recente()
+            if item is not None:
+                frame, t_captura = item
                 self.mostrar_frame(frame)
+                self.pipeline.metricas.registrar_exibicao(t_captura)
+            
+            self.controlador.atualizar()
+            self.tempo_ui_ocupado += time.perf_counter() - inicio_ui
+            decorrido = time.time() - self.ultimo_log_metricas
+            if decorrido > self.INTERVALO_LOG_METRICAS:
+                self.ultimo_log_metricas = time.time()
+                self.mostrar_desempenho()
+                print(f"[pipeline] {self.pipeline.metricas.formatar()} | {self.controlador.descrever()} | "
+                      f"thread do Tk ocupada {self.tempo_ui_ocupado / decorrido:.0%}")
+                self.tempo_ui_ocupado = 0.0
                 
         except Exception as e:
             print(f"Erro no loop da câmera: {e}")
             self.reiniciar_camera()
-        finally:
-            if self.running:
-                self.root.after(30, self.atualizar_frame)
+            return
+        
+        if self.running:
+            self.root.after(self.controlador.atraso_ui, self.atualizar_frame)
+
+    def mostrar_desempenho(self):
+        """Mostra o FPS e os ajustes do controle adaptativo abaixo da câmera"""
+        if hasattr(self, "desempenho_label") and self.desempenho_label.winfo_exists():
+            modo = self.controlador.descrever() if self.controlador.ativo else "adaptação desligada"
+            self.desempenho_label.config(text=f"{self.pipeline.metricas.fps():.0f} FPS | {modo}")
 
     def reiniciar_camera(self):
         """Tenta reiniciar a câmera em caso de falha"""
@@ -887,71 +991,78 @@ class AplicativoLibras:
         time.sleep(0.5)
         self.iniciar_camera()
 
-    def processar_frame(self, frame):
-        """Processa o frame para detecção de mãos"""
-        frame = cv2.flip(frame, 1)
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = self.hands.process(frame_rgb)
-        
-        if results.multi_hand_landmarks:
-            self.frames_sem_maos = 0
-            for hand_landmarks in results.multi_hand_landmarks:
-                self.mp_drawing.draw_landmarks(
-                    frame_rgb,
-                    hand_landmarks,
-                    self.mp_hands.HAND_CONNECTIONS,
-                    self.mp_drawing_styles.get_default_hand_landmarks_style(),
-                    self.mp_drawing_styles.get_default_hand_connections_style()
-                )
-            
-            landmarks = self.processar_landmarks(results)
-            self.buffer_gestos.append(landmarks)
-            
-            # Reconhece o gesto quando o buffer estiver cheio
-            if len(self.buffer_gestos) == 30:
-                self.reconhecer_gesto()
-        else:
-            self.frames_sem_maos += 1
-            if self.frames_sem_maos > self.RESET_THRESHOLD and self.buffer_gestos:
-                self.buffer_gestos.clear()
-                self.feedback_label.config(text="Mãos não detectadas", fg=self.COR_ERRO)
-        
-        return frame_rgb
+    def desenhar_landmarks(self, frame_rgb, results):
+        """Desenha os landmarks das mãos (executado na thread de landmarks)"""
+        if config.DESENHO == 'leve':
+            desenhar_maos_leve(frame_rgb, results)
+            return
+        for hand_landmarks in results.multi_hand_landmarks:
+            self.mp_drawing.draw_landmarks(
+                frame_rgb,
+                hand_landmarks,
+                self.mp_hands.HAND_CONNECTIONS,
+                self.mp_drawing_styles.get_default_hand_landmarks_style(),
+                self.mp_drawing_styles.get_default_hand_connections_style()
+            )
+
+    def inferir_gesto(self, entrada):
+        """Executa o modelo sobre a janela (executado na thread de inferência)"""
+        return self.modelo_gestos.prever(entrada)
+
+    def alvo_estatico(self):
+        """True se o gesto alvo é decidido pelo classificador de um frame"""
+        return (self.estatico is not None and self.gesto_alvo is not None
+                and self.estatico.eh_estatico(self.gesto_alvo))
+
+    def rotear_alvo(self):
+        """Alvo estático: só o classificador de um frame; dinâmico: modelo de sequência"""
+        if self.pipeline is not None:
+            self.pipeline.usar_sequencia = not self.alvo_estatico()
 
-    def reconhecer_gesto(self):
-        """Reconhece o gesto usando o modelo carregado"""
-        if not self.modelo_gestos or not self.le_gestos or not self.gesto_alvo:
-            self.reconhecer_gesto_simulado()
+    def reconhecer_gesto(self, preds, parcial=False, estatico=False):
+        """Aplica a predição do pipeline ao jogo (thread do Tk).
+
+        O decisor do alvo aceita o gesto esperado já em janelas parciais; a
+        suavização só recebe janelas completas. Predições `estatico` (um
+        frame) só contam quando o alvo é um gesto estático.
+        """
+        if not self.le_gestos or not self.gesto_alvo or self.suavizador is None:
             return
+        if estatico != self.alvo_estatico():
+            return  # Predição do outro nível de reconhecimento (ex.: janela já na fila)
     
         try:
-            entrada = np.array(self.buffer_gestos).reshape(1, 30, 126)
-            preds = self.modelo_gestos.predict(entrada, verbose=0)[0]
+            preds = self.mascara.aplicar(preds)
             classe_idx = np.argmax(preds)
-            confianca = preds[classe_idx]
             gesto_reconhecido = self.le_gestos.classes_[classe_idx]
 
-            # 🔹 Normaliza para ignorar mão esquerda/direita
-            gesto_normalizado = gesto_reconhecido.replace("_DIR", "").replace("_ESQ", "")
-            alvo_normalizado = self.gesto_alvo.replace("_DIR", "").replace("_ESQ", "")
-
-            self.historico_predicoes.append(gesto_normalizado)
-            
-            contagem = defaultdict(int)
-            for g in self.historico_predicoes:
-                contagem[g] += 1
-            gesto_final = max(contagem.items(), key=lambda x: x[1])[0]
+            alvo_normalizado = nome_sem_mao(self.gesto_alvo)
+            if estatico:
+                aceito = self.decisor_estatico.atualizar(preds, self.gesto_alvo)
+            else:
+                aceito = self.decisor is not None and self.decisor.atualizar(preds, self.gesto_alvo)
+            if not parcial and not estatico:
+                # 🔹 Suavização por gesto, ignorando mão esquerda/direita
+                gesto_final, confianca = self.suavizador.atualizar(preds)
+                aceito = aceito or (confianca > 0.7 and gesto_final == alvo_normalizado)
             
-            if confianca > 0.7 and gesto_final == alvo_normalizado:
+            if aceito:
                 self.pontuacao += 10 * self.nivel_atual
                 self.pontuacao_label.config(text=f"{self.pontuacao}")
                 self.feedback_label.config(
-                    text=f"✅ Correto! {gesto_final}",
+                    text=f"✅ Correto! {alvo_normalizado}",
                     foreground=self.COR_SUCESSO
                 )
                 self.root.after(1500, self.proxima_letra)
-                self.buffer_gestos.clear()
-                self.historico_predicoes.clear()
+                # Sem alvo até a próxima letra: o aceite rápido não pontua duas vezes
+                self.gesto_alvo = None
+                self.pipeline.limpar_buffer()
+                self.suavizador.limpar()
+                for decisor in (self.decisor, self.decisor_estatico):
+                    if decisor is not None:
+                        decisor.limpar()
+            elif parcial:
+                return  # Janela incompleta: sem feedback de outro gesto
             elif gesto_reconhecido != self.ultimo_gesto_reconhecido:
                 self.feedback_label.config(
                     text=f"Reconhecido: {gesto_reconhecido} (Mostre: {self.gesto_alvo})",
@@ -967,47 +1078,23 @@ class AplicativoLibras:
                 foreground=self.COR_ERRO
             )
 
-    def processar_landmarks(self, results):
-        """Processa os landmarks das mãos"""
-        landmarks = []
-        if results.multi_hand_landmarks:
-            for hand in results.multi_hand_landmarks:
-                landmarks.extend([[lm.x, lm.y, lm.z] for lm in hand.landmark])
-        
-        landmarks = landmarks[:42]  # Limita a 2 mãos
-        if len(landmarks) < 42:
-            landmarks.extend([[0, 0, 0]] * (42 - len(landmarks)))
-        
-        return np.array(landmarks).flatten()
-
     def mostrar_frame(self, frame):
-        """Mostra o frame na interface con tamanho fixo"""
-        img = Image.fromarray(frame)
-        
-        # Tamanho fixo para a imagem (pode ajustar conforme necessário)
-        new_width = 640
-        new_height = 480
-        
-        img = img.resize((new_width, new_height), Image.LANCZOS)
-        img = ImageTk.PhotoImage(image=img)
-        
-        self.video_label.imgtk = img
-        self.video_label.config(image=img)
+        """Mostra o frame na interface con tamanho fixo (640x480, mesma PhotoImage)"""
+        self.renderizador.mostrar(frame)
 
     def parar_camera(self):
         """Para a câmera"""
         self.running = False
+        if self.pipeline:
+            self.pipeline.parar()
+            self.pipeline = None
         if self.cap:
             self.cap.release()
         self.cap = None
         # Se o widget ainda existir, mostra tela preta
-        if hasattr(self, "video_label") and self.video_label.winfo_exists():
+        if self.renderizador and self.renderizador.label.winfo_exists():
             try:
-                img = np.zeros((480, 640, 3), dtype=np.uint8)  # imagem preta
-                img = Image.fromarray(img)
-                img = ImageTk.PhotoImage(image=img)
-                self.video_label.config(image=img)
-                self.video_label.image = img  # manter referência
+                self.renderizador.limpar()  # imagem preta
             except Exception as e:
                 print("Aviso ao parar câmera:", e)
 
@@ -1023,7 +1110,9 @@ class AplicativoLibras:
         self.root.destroy()
 
 if __name__ == "__main__":
+    parser = adicionar_argumentos_fonte(argparse.ArgumentParser(description="LIA - Aprendizado de Libras"))
+    args = parser.parse_args()
     root = tk.Tk()
-    app = AplicativoLibras(root)
+    app = AplicativoLibras(root, args)
     root.protocol("WM_DELETE_WINDOW", app.sair)
     root.mainloop()
\ No newline at end of file
@@ -0,0 +1,143 @@
+import argparse
+import json
+import sys
+import time
+from collections import defaultdict, deque
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from app.nucleo import config
+from app.nucleo.dataset import ArmazemGestos
+from app.nucleo.suavizacao import SUAVIZADORES, criar_suavizador, nome_sem_mao
+
+MIN_CONFIDENCE = 0.7  # Mesmo limiar do jogo para aceitar um gesto
+LOTE = 256
+
+
+class VotacaoAntiga:
+    """Implementação anterior (deque + defaultdict refeito a cada predição), para referência"""
+
+    nome = 'antes'
+
+    def __init__(self, classes):
+        self.classes = [str(c) for c in classes]
+        self.historico = deque(maxlen=15)
+
+    def limpar(self):
+        self.historico.clear()
+
+    def atualizar(self, preds):
+        classe_idx = int(np.argmax(preds))
+        self.historico.append(nome_sem_mao(self.classes[classe_idx]))
+        contagem = defaultdict(int)
+        for g in self.historico:
+            contagem[g] += 1
+        return max(contagem.items(), key=lambda x: x[1])[0], float(preds[classe_idx])
+
+
+def montar_sequencias(frames, nomes, num_sequencias, segmentos, quadros_segmento, semente=0):
+    """Gravações sintéticas: amostras do dataset em sequência, cada uma repetida
+    até `quadros_segmento` quadros (como quem mantém o gesto)"""
+    rng = np.random.default_rng(semente)
+    sequencias = []
+    for _ in range(num_sequencias):
+        escolhidas = rng.choice(len(nomes), segmentos, replace=False)
+        trechos, rotulos = [], []
+        for i in escolhidas:
+            repeticoes = -(-quadros_segmento // len(frames[i]))
+            trechos.append(np.tile(frames[i], (repeticoes, 1))[:quadros_segmento])
+            rotulos.append(nome_sem_mao(str(nomes[i])))
+        sequencias.append((np.concatenate(trechos), rotulos))
+    return sequencias
+
+
+def prever_quadros(motor, fluxo):
+    """Probabilidades da janela que termina em cada quadro (a partir do primeiro cheio)"""
+    passos = motor.tamanho_sequencia
+    janelas = np.lib.stride_tricks.sliding_window_view(fluxo, passos, axis=0).transpose(0, 2, 1)
+    saidas = [motor.prever_lote(np.ascontiguousarray(janelas[i:i + LOTE]))
+              for i in range(0, len(janelas), LOTE)]
+    return np.concatenate(saidas)
+
+
+def avaliar(suavizador, sequencias, quadros_segmento, passos):
+    """Latência (quadros desde o início do segmento até aceitar o gesto certo) e cintilação"""
+    latencias, tempos = [], []
+    segmentos = reconhecidos = trocas = quadros = 0
+    for probs, rotulos in sequencias:
+        suavizador.limpar()
+        anterior = None
+        aceito_em = {}
+        for i, preds in enumerate(probs):
+            quadro = i + passos - 1  # Último quadro da janela
+            segmento = quadro // quadros_segmento
+            inicio = time.perf_counter()
+            gesto, confianca = suavizador.atualizar(preds)
+            tempos.append(time.perf_counter() - inicio)
+            exibido = gesto if confianca >= MIN_CONFIDENCE else None
+            trocas += exibido != anterior and anterior is not None
+            anterior = exibido
+            quadros += 1
+            if exibido == rotulos[segmento] and segmento not in aceito_em:
+                aceito_em[segmento] = quadro - segmento * quadros_segmento
+        segmentos += len(rotulos)
+        reconhecidos += len(aceito_em)
+        latencias.extend(aceito_em.values())
+
+    latencias = np.array(latencias)
+    return {
+        'segmentos': segmentos,
+        'reconhecidos': reconhecidos / segmentos,
+        'latencia_media_quadros': float(latencias.mean()) if len(latencias) else None,
+        'latencia_p95_quadros': float(np.percentile(latencias, 95)) if len(latencias) else None,
+        # Trocas do gesto exibido a cada 100 quadros; o mínimo é uma por troca de segmento
+        'trocas_100_quadros': trocas / quadros * 100,
+        'trocas_necessarias_100_quadros': (segmentos - len(sequencias)) / quadros * 100,
+        'custo_us': float(np.mean(tempos) * 1e6),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compara as estratégias de suavização em gravações do dataset")
+    parser.add_argument('--dataset', type=Path, default=config.DATASET_PATH)
+    parser.add_argument('--modelo', type=Path, default=config.MODEL_PATH)
+    parser.add_argument('--rotulos', type=Path, default=config.LABEL_PATH)
+    parser.add_argument('--sequencias', type=int, default=20)
+    parser.add_argument('--segmentos', type=int, default=6, help="Gestos por sequência")
+    parser.add_argument('--quadros-segmento', type=int, default=60, help="Quadros que cada gesto é mantido")
+    parser.add_argument('--saida', type=Path, default=None, help="Salva os resultados em JSON")
+    args = parser.parse_args()
+
+    import joblib
+    from app.nucleo.inferencia import MotorLote
+    print("=== AVALIAÇÃO DA SUAVIZAÇÃO ===")
+    frames, nomes, _ = ArmazemGestos(args.dataset).carregar()
+    motor = MotorLote(args.modelo)
+    classes = joblib.load(args.rotulos).classes_
+
+    sequencias = [(prever_quadros(motor, fluxo), rotulos)
+                  for fluxo, rotulos in montar_sequencias(frames, nomes, args.sequencias, args.segmentos,
+                                                          args.quadros_segmento)]
+    suavizadores = [VotacaoAntiga(classes)] + [criar_suavizador(classes, nome) for nome in SUAVIZADORES]
+
+    resultados = {}
+    print(f"{'estratégia':<10} {'reconhecidos':>12} {'latência':>9} {'p95':>5} {'trocas/100':>11} {'custo':>8}")
+    for suavizador in suavizadores:
+        r = avaliar(suavizador, sequencias, args.quadros_segmento, motor.tamanho_sequencia)
+        resultados[suavizador.nome] = r
+        latencia = f"{r['latencia_media_quadros']:.1f}" if r['latencia_media_quadros'] is not None else '-'
+        p95 = f"{r['latencia_p95_quadros']:.0f}" if r['latencia_p95_quadros'] is not None else '-'
+        print(f"{suavizador.nome:<10} {r['reconhecidos']:>12.1%} {latencia:>9} {p95:>5} "
+              f"{r['trocas_100_quadros']:>11.2f} {r['custo_us']:>6.1f}µs")
+    print(f"(mínimo de trocas: {r['trocas_necessarias_100_quadros']:.2f}/100 quadros; latência em quadros "
+          f"desde o início do gesto, a janela só enche após {motor.tamanho_sequencia - 1})")
+
+    if args.saida:
+        args.saida.write_text(json.dumps(resultados, indent=2))
+        print(f"\n✅ Resultados salvos em {args.saida}")
+
+
+if __name__ == "__main__":
+    main()
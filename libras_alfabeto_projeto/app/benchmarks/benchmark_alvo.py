@@ -0,0 +1,207 @@
+import argparse
+import json
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from app.nucleo import config
+from app.nucleo.dataset import ArmazemGestos
+from app.nucleo.estatico import ClassificadorEstatico
+from app.nucleo.mascara import MascaraClasses
+from app.nucleo.secoes import secao_do_gesto
+from app.nucleo.suavizacao import DecisorAlvo, criar_suavizador, nome_sem_mao
+
+MIN_CONFIDENCE = 0.7  # Aceite do jogo pela suavização
+LOTE = 256
+
+
+def fluxo_da_amostra(amostra, quadros):
+    """Frames da amostra repetida até somar `quadros` (gesto mantido)"""
+    repeticoes = -(-quadros // len(amostra))
+    return np.tile(amostra, (repeticoes, 1))[:quadros]
+
+
+def janelas_da_amostra(amostra, quadros, passos, min_frames):
+    """Janelas vistas pelo pipeline enquanto o gesto é mantido por `quadros` frames:
+    parciais (completadas com zeros) a partir de `min_frames`, depois deslizantes.
+    Retorna (janelas, frames vistos em cada uma, se é parcial)."""
+    fluxo = fluxo_da_amostra(amostra, quadros)
+    janelas, vistos = [], []
+    for t in range(min_frames, quadros + 1):
+        if t < passos:
+            janela = np.zeros((passos, fluxo.shape[1]), dtype=np.float32)
+            janela[:t] = fluxo[:t]
+        else:
+            janela = fluxo[t - passos:t]
+        janelas.append(janela)
+        vistos.append(t)
+    vistos = np.array(vistos)
+    return np.stack(janelas), vistos, vistos < passos
+
+
+def prever(motor, janelas):
+    return np.concatenate([motor.prever_lote(janelas[i:i + LOTE]) for i in range(0, len(janelas), LOTE)])
+
+
+def primeiros_aceites(probs, vistos, parciais, classes, gestos, decisor_args, estrategia):
+    """Frame em que cada gesto seria aceito como alvo: (só suavização, com decisor do alvo)"""
+    suavizador = criar_suavizador(classes, estrategia)
+    base = {}
+    for preds, t, parcial in zip(probs, vistos, parciais):
+        if parcial:
+            continue
+        gesto, confianca = suavizador.atualizar(preds)
+        if confianca > MIN_CONFIDENCE and gesto not in base:
+            base[gesto] = t
+
+    rapido = {}
+    for alvo in gestos:
+        decisor = DecisorAlvo(classes, **decisor_args)
+        for preds, t in zip(probs, vistos):
+            if decisor.atualizar(preds, alvo):
+                rapido[alvo] = t
+                break
+        if alvo in base:
+            rapido[alvo] = min(rapido.get(alvo, base[alvo]), base[alvo])
+    return base, rapido
+
+
+def aceites_estaticos(probs, classes, gestos, decisor_args):
+    """Frame em que cada gesto estático seria aceito como alvo pelas predições de um frame"""
+    aceites = {}
+    for alvo in gestos:
+        decisor = DecisorAlvo(classes, **decisor_args)
+        for t, preds in enumerate(probs, start=1):
+            if decisor.atualizar(preds, alvo):
+                aceites[alvo] = t
+                break
+    return aceites
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tempo até aceitar o gesto alvo e falsos aceites, por gesto")
+    parser.add_argument('--dataset', type=Path, default=config.DATASET_PATH)
+    parser.add_argument('--modelo', type=Path, default=config.MODEL_PATH)
+    parser.add_argument('--rotulos', type=Path, default=config.LABEL_PATH)
+    parser.add_argument('--amostras', type=int, default=10, help="Amostras por gesto")
+    parser.add_argument('--quadros', type=int, default=60, help="Quadros que cada gesto é mantido")
+    parser.add_argument('--fps', type=float, default=20, help="FPS da câmera do jogo (converte quadros em ms)")
+    parser.add_argument('--min-frames', type=int, default=config.MIN_FRAMES_PARCIAL)
+    parser.add_argument('--confianca', type=float, default=config.ALVO_CONFIANCA)
+    parser.add_argument('--margem', type=float, default=config.ALVO_MARGEM)
+    parser.add_argument('--estabilidade', type=int, default=config.ALVO_ESTABILIDADE)
+    parser.add_argument('--estatico', type=Path, default=config.ESTATICO_PATH,
+                        help="Classificador de um frame (ver treinar_estatico.py); ignorado se não existir")
+    parser.add_argument('--estatico-confianca', type=float, default=config.ESTATICO_CONFIANCA)
+    parser.add_argument('--estatico-estabilidade', type=int, default=config.ESTATICO_ESTABILIDADE)
+    parser.add_argument('--permitidas', nargs='+', default=None,
+                        help="Simula um nível: só estes gestos, com a máscara de classes aplicada")
+    parser.add_argument('--saida', type=Path, default=None, help="Salva os resultados em JSON")
+    args = parser.parse_args()
+
+    import joblib
+    from app.nucleo.inferencia import MotorLote
+    print("=== BENCHMARK DO ACEITE DO ALVO ===")
+    frames, nomes, _ = ArmazemGestos(args.dataset).carregar()
+    motor = MotorLote(args.modelo)
+    classes = joblib.load(args.rotulos).classes_
+    mascara = MascaraClasses(classes, permitidas=args.permitidas, excluidas=())
+    gestos = list(dict.fromkeys(nome_sem_mao(c) for c in mascara.permitidas))
+    decisor_args = {'confianca': args.confianca, 'margem': args.margem, 'estabilidade': args.estabilidade}
+    # Dois níveis: alvo estático pelo classificador de um frame, os demais pela sequência
+    estatico = ClassificadorEstatico(args.estatico, classes) if args.estatico.exists() else None
+    estaticos = [g for g in gestos if estatico is not None and estatico.eh_estatico(g)]
+    estatico_args = {'confianca': args.estatico_confianca, 'margem': args.margem,
+                     'estabilidade': args.estatico_estabilidade}
+    if estatico is not None:
+        print(f"Estáticos (um frame): {', '.join(estaticos) or 'nenhum'}")
+
+    rng = np.random.default_rng(0)
+    por_gesto = defaultdict(list)
+    for i in rng.permutation(len(nomes)):
+        gesto = nome_sem_mao(str(nomes[i]))
+        if gesto in gestos and len(por_gesto[gesto]) < args.amostras:
+            por_gesto[gesto].append(i)
+
+    ms = 1000 / args.fps
+    resultados = {}
+    print(f"{'gesto':<14} {'n':>3} {'antes ms':>9} {'rápido ms':>10} {'2 níveis ms':>12} "
+          f"{'aceitos':>15} {'falsos aceites':>17}")
+    for gesto in sorted(por_gesto):
+        tempos = {'antes': [], 'rapido': [], 'dois_niveis': []}
+        falsos = {'antes': 0, 'rapido': 0, 'dois_niveis': 0}
+        for i in por_gesto[gesto]:
+            amostra = np.asarray(frames[i])
+            janelas, vistos, parciais = janelas_da_amostra(amostra, args.quadros,
+                                                           motor.tamanho_sequencia, args.min_frames)
+            probs = mascara.aplicar(prever(motor, janelas))
+            base, rapido = primeiros_aceites(probs, vistos, parciais, classes, gestos,
+                                             decisor_args, config.SUAVIZACAO)
+            dois_niveis = {alvo: t for alvo, t in rapido.items() if alvo not in estaticos}
+            if estaticos:
+                fluxo = fluxo_da_amostra(amostra, args.quadros)
+                com_maos = fluxo[np.any(fluxo != 0, axis=-1)]
+                probs_frame = mascara.aplicar(np.stack([estatico.prever(f) for f in com_maos]))
+                dois_niveis.update(aceites_estaticos(probs_frame, classes, estaticos, estatico_args))
+            for nome, aceites in (('antes', base), ('rapido', rapido), ('dois_niveis', dois_niveis)):
+                if gesto in aceites:
+                    tempos[nome].append(aceites[gesto])
+                falsos[nome] += sum(1 for alvo in aceites if alvo != gesto)
+        n = len(por_gesto[gesto])
+        outros = n * (len(gestos) - 1)
+        r = {
+            'amostras': n,
+            **{f'aceitos_{nome}': len(tempos[nome]) / n for nome in tempos},
+            **{f'tempo_{nome}_ms': float(np.mean(tempos[nome]) * ms) if tempos[nome] else None for nome in tempos},
+            **{f'falsos_aceites_{nome}': falsos[nome] / outros if outros else 0.0 for nome in falsos},
+        }
+        resultados[gesto] = r
+        formatar = lambda v: f"{v:.0f}" if v is not None else '-'
+        marca = '*' if gesto in estaticos else ''
+        print(f"{gesto + marca:<14} {n:>3} {formatar(r['tempo_antes_ms']):>9} {formatar(r['tempo_rapido_ms']):>10} "
+              f"{formatar(r['tempo_dois_niveis_ms']):>12} "
+              f"{r['aceitos_antes']:>6.0%} -> {r['aceitos_dois_niveis']:<5.0%} "
+              f"{r['falsos_aceites_antes']:>7.1%} -> {r['falsos_aceites_dois_niveis']:<6.1%}")
+
+    def media(chave, nomes=None):
+        valores = [resultados[g][chave] for g in nomes or resultados if resultados[g][chave] is not None]
+        return float(np.mean(valores)) if valores else None
+    geral = {chave: media(chave) for chave in next(iter(resultados.values())) if chave != 'amostras'}
+    print(f"(* estático: aceito pelo classificador de um frame nos dois níveis; aceitos e falsos aceites: "
+          f"antes -> dois níveis)")
+    print(f"\nMédia: {geral['tempo_antes_ms'] or 0:.0f}ms -> {geral['tempo_rapido_ms'] or 0:.0f}ms -> "
+          f"{geral['tempo_dois_niveis_ms'] or 0:.0f}ms até aceitar | falsos aceites "
+          f"{geral['falsos_aceites_antes']:.2%} -> {geral['falsos_aceites_rapido']:.2%} -> "
+          f"{geral['falsos_aceites_dois_niveis']:.2%} (tempo desde o primeiro frame com mãos, {args.fps:g} FPS)")
+
+    # Tempo até aceitar por seção do jogo (gestos fora das seções ficam em "-")
+    por_secao = defaultdict(list)
+    for gesto in resultados:
+        por_secao[secao_do_gesto(gesto) or '-'].append(gesto)
+    secoes = {}
+    print(f"\n{'seção':<16} {'gestos':>6} {'estáticos':>9} {'antes ms':>9} {'rápido ms':>10} {'2 níveis ms':>12}")
+    for secao, nomes in por_secao.items():
+        secoes[secao] = {'gestos': nomes, 'estaticos': [g for g in nomes if g in estaticos],
+                         **{f'tempo_{nome}_ms': media(f'tempo_{nome}_ms', nomes)
+                            for nome in ('antes', 'rapido', 'dois_niveis')}}
+        s = secoes[secao]
+        formatar = lambda v: f"{v:.0f}" if v is not None else '-'
+        print(f"{secao:<16} {len(nomes):>6} {len(s['estaticos']):>9} {formatar(s['tempo_antes_ms']):>9} "
+              f"{formatar(s['tempo_rapido_ms']):>10} {formatar(s['tempo_dois_niveis_ms']):>12}")
+
+    if args.saida:
+        args.saida.write_text(json.dumps({'parametros': vars(args) | {'dataset': str(args.dataset),
+                                                                       'modelo': str(args.modelo),
+                                                                       'rotulos': str(args.rotulos),
+                                                                       'estatico': str(args.estatico),
+                                                                       'saida': str(args.saida)},
+                                          'geral': geral, 'secoes': secoes, 'gestos': resultados},
+                                         indent=2, ensure_ascii=False))
+        print(f"\n✅ Resultados salvos em {args.saida}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+import argparse
+import ast
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from app.nucleo import config
+from app.nucleo.dataset import ArmazemGestos
+
+LOTE = 1000
+
+
+def gerar_lotes(n, rng):
+    """Amostras sintéticas com a forma do dataset, em lotes de até LOTE"""
+    for inicio in range(0, n, LOTE):
+        tamanho = min(LOTE, n - inicio)
+        janelas = rng.random((tamanho, config.SEQUENCE_LENGTH, 126), dtype=np.float32)
+        nomes = [f"G{(inicio + i) % 60}" for i in range(tamanho)]
+        yield nomes, janelas
+
+
+def medir_csv(pasta, n, rng):
+    """Grava no formato antigo e lê como o treinamento fazia (ast.literal_eval)"""
+    caminho = pasta / 'gestos.csv'
+    for nomes, janelas in gerar_lotes(n, rng):
+        pd.DataFrame({
+            'nome': nomes,
+            'frames': [janela.astype(np.float64).tolist() for janela in janelas],
+            'timestamp': ['2025-01-01 00:00:00'] * len(nomes),
+        }).to_csv(caminho, mode='a', header=not caminho.exists(), index=False)
+
+    inicio = time.perf_counter()
+    df = pd.read_csv(caminho)
+    df['frames'] = df['frames'].apply(ast.literal_eval)
+    X = np.array([np.array(frames) for frames in df['frames']])
+    tempo = time.perf_counter() - inicio
+    return {'tamanho_mb': caminho.stat().st_size / 2**20, 'carga_s': tempo, 'dtype': str(X.dtype)}
+
+
+def medir_armazem(pasta, n, rng):
+    """Grava pelo appender e mede abertura (memmap) e leitura completa"""
+    armazem = ArmazemGestos(pasta / 'gestos')
+    inicio = time.perf_counter()
+    for nomes, janelas in gerar_lotes(n, rng):
+        armazem.adicionar_lote(nomes, janelas)
+    escrita = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    frames, nomes, _ = ArmazemGestos(pasta / 'gestos').carregar()
+    abertura = time.perf_counter() - inicio
+    X = np.array(frames)
+    leitura = time.perf_counter() - inicio
+    assert X.shape == (n, config.SEQUENCE_LENGTH, 126) and len(nomes) == n
+
+    return {
+        'tamanho_mb': armazem.caminho_frames.stat().st_size / 2**20,
+        'escrita_amostras_s': n / escrita,
+        'abertura_s': abertura,
+        'carga_s': leitura,
+        'dtype': str(X.dtype),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compara carga do CSV antigo com o dataset binário")
+    parser.add_argument('--tamanhos', nargs='+', type=int, default=[10_000, 100_000])
+    parser.add_argument('--limite-csv', type=int, default=10_000,
+                        help="Maior tamanho medido no formato CSV (muito lento acima disso)")
+    parser.add_argument('--pasta', type=Path, default=None, help="Diretório temporário (padrão: do sistema)")
+    args = parser.parse_args()
+
+    print("=== BENCHMARK DE DATASET ===")
+    rng = np.random.default_rng(0)
+    for n in args.tamanhos:
+        with tempfile.TemporaryDirectory(dir=args.pasta) as pasta:
+            pasta = Path(pasta)
+            binario = medir_armazem(pasta, n, rng)
+            print(f"\n{n} amostras")
+            print(f"  binário: {binario['tamanho_mb']:8.1f}MB | abertura {binario['abertura_s'] * 1000:7.1f}ms | "
+                  f"carga completa {binario['carga_s']:7.2f}s | escrita {binario['escrita_amostras_s']:,.0f} amostras/s")
+            if n <= args.limite_csv:
+                antigo = medir_csv(pasta, n, rng)
+                print(f"  csv:     {antigo['tamanho_mb']:8.1f}MB | carga {antigo['carga_s']:7.2f}s "
+                      f"({antigo['carga_s'] / binario['carga_s']:.0f}x mais lento, {antigo['dtype']})")
+            else:
+                print(f"  csv:     não medido (acima de --limite-csv {args.limite_csv})")
+
+
+if __name__ == "__main__":
+    main()
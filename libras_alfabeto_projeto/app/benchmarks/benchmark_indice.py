@@ -0,0 +1,134 @@
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from app.nucleo import config
+from app.nucleo.dataset import ArmazemGestos
+from app.nucleo.indice import EMBEDDINGS, EmbeddingLandmarks, IndiceGestos, criar_embedding, embutir
+from app.nucleo.metricas import mediana_ms
+
+
+def indice_com(vetores, rotulos, classes, dimensao):
+    indice = IndiceGestos(dimensao, capacidade=max(len(vetores), 1024))
+    for i, classe in enumerate(classes):
+        indice.adicionar(classe, vetores[rotulos == i])
+    return indice
+
+
+def acuracia_poucas_amostras(treino, y_treino, teste, y_teste, classes, amostras, k, rng):
+    """Acurácia top-1 com só `amostras` cadastradas por gesto (None: todas)"""
+    if amostras is None:
+        escolhidas = np.arange(len(treino))
+    else:
+        escolhidas = np.concatenate([rng.permutation(np.flatnonzero(y_treino == i))[:amostras]
+                                     for i in range(len(classes))])
+    indice = indice_com(treino[escolhidas], y_treino[escolhidas], classes, treino.shape[1])
+    return float(np.mean(np.argmax(indice.probabilidades(teste, k), axis=1) == y_teste))
+
+
+def escalar(vetores, rotulos, total, rng, ruido=0.05):
+    """`total` amostras sintéticas: cópias das reais com ruído, mesmas classes"""
+    origem = rng.integers(0, len(vetores), total)
+    copias = vetores[origem] + rng.normal(0, ruido, (total, vetores.shape[1])).astype(np.float32)
+    return copias, rotulos[origem]
+
+
+def medir_escala(vetores, rotulos, classes, consultas, total, k, repeticoes, lote, rng):
+    """Latência da busca, cadastro e remoção com `total` amostras no índice"""
+    base, y_base = escalar(vetores, rotulos, total, rng)
+    indice = indice_com(base, y_base, classes, vetores.shape[1])
+    novas = consultas[:20]
+
+    def cadastrar_e_remover(_):
+        indice.adicionar('NOVO', novas)
+        indice.remover('NOVO')
+
+    tempos_remocao = []
+    for _ in range(min(repeticoes, 50)):
+        indice.adicionar('NOVO', novas)
+        inicio = time.perf_counter()
+        indice.remover('NOVO')
+        tempos_remocao.append(time.perf_counter() - inicio)
+
+    lotes = [consultas[i:i + lote] for i in range(0, len(consultas) - lote + 1, lote)] or [consultas[:lote]]
+    return {
+        'amostras': len(indice),
+        'memoria_mb': indice.vetores.nbytes / 2**20,
+        'consulta_ms': mediana_ms(lambda q: indice.probabilidades(q, k), consultas[:, None], repeticoes),
+        'lote_ms_por_consulta': mediana_ms(lambda q: indice.probabilidades(q, k), lotes, repeticoes) / lote,
+        'cadastrar_e_remover_ms': mediana_ms(cadastrar_e_remover, [None], min(repeticoes, 50)),
+        'remover_ms': float(np.median(tempos_remocao) * 1000),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Índice de gestos: acurácia com poucas amostras por gesto e "
+                                                 "latência de busca, cadastro e remoção conforme o tamanho")
+    parser.add_argument('--dataset', type=Path, default=config.DATASET_PATH)
+    parser.add_argument('--modelo', type=Path, default=config.MODEL_PATH)
+    parser.add_argument('--embeddings', nargs='+', default=list(EMBEDDINGS), choices=EMBEDDINGS)
+    parser.add_argument('--tamanhos', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--amostras', type=int, nargs='+', default=[1, 3, 5],
+                        help="Amostras cadastradas por gesto na medida de acurácia")
+    parser.add_argument('--k', type=int, default=config.INDICE_K)
+    parser.add_argument('--repeticoes', type=int, default=200)
+    parser.add_argument('--lote', type=int, default=32, help="Consultas por chamada na medida em lote")
+    parser.add_argument('--semente', type=int, default=0)
+    parser.add_argument('--saida', type=Path, default=None, help="Salva os resultados em JSON")
+    args = parser.parse_args()
+
+    from sklearn.model_selection import train_test_split
+    print("=== BENCHMARK DO ÍNDICE DE GESTOS ===")
+    frames, nomes, _ = ArmazemGestos(args.dataset).carregar()
+    classes, rotulos = np.unique(nomes, return_inverse=True)
+    classes = [str(c) for c in classes]
+    idx_treino, idx_teste = train_test_split(np.arange(len(nomes)), test_size=0.2,
+                                             random_state=args.semente, stratify=rotulos)
+    idx_treino, idx_teste = np.sort(idx_treino), np.sort(idx_teste)  # Leitura do memmap em ordem
+    print(f"Amostras: {len(nomes)} | gestos: {len(classes)} | k: {args.k}")
+
+    resultados = {}
+    for nome in args.embeddings:
+        rng = np.random.default_rng(args.semente)
+        embedding = criar_embedding(nome, args.modelo)
+        if isinstance(embedding, EmbeddingLandmarks):
+            embedding.ajustar(frames[idx_treino])  # PCA só com as amostras cadastradas
+        treino, teste = embutir(embedding, frames[idx_treino]), embutir(embedding, frames[idx_teste])
+        y_treino, y_teste = rotulos[idx_treino], rotulos[idx_teste]
+        janelas = np.asarray(frames[idx_teste[:50]])[:, None, :embedding.tamanho_sequencia]
+
+        r = {
+            'dimensao': embedding.dimensao,
+            'embedding_ms': mediana_ms(embedding, janelas, args.repeticoes),
+            'acuracia': {str(a): acuracia_poucas_amostras(treino, y_treino, teste, y_teste, classes, a, args.k, rng)
+                         for a in args.amostras + [None]},
+            'escala': {},
+        }
+        print(f"\n[{nome}] {embedding.dimensao} valores | embedding de uma janela: {r['embedding_ms']:.3f}ms")
+        print("Acurácia: " + " | ".join(f"{a if a != 'None' else 'todas'} por gesto {v:.1%}"
+                                        for a, v in r['acuracia'].items()))
+        print(f"{'amostras':>9} {'memória':>9} {'consulta':>10} {f'lote {args.lote}':>10} "
+              f"{'+20 -gesto':>11} {'remover':>9}")
+        for total in args.tamanhos:
+            e = medir_escala(treino, y_treino, classes, teste, total, args.k, args.repeticoes, args.lote, rng)
+            r['escala'][total] = e
+            print(f"{e['amostras']:>9,} {e['memoria_mb']:>7.1f}MB {e['consulta_ms']:>8.3f}ms "
+                  f"{e['lote_ms_por_consulta']:>8.3f}ms {e['cadastrar_e_remover_ms']:>9.3f}ms {e['remover_ms']:>7.3f}ms")
+        resultados[nome] = r
+
+    print(f"\n(medianas; consulta: busca de uma janela já embutida, sem o embedding; lote: por consulta com "
+          f"{args.lote} de uma vez; +20 -gesto: cadastrar 20 amostras de um gesto novo e removê-lo; "
+          f"índices maiores que o dataset usam cópias das amostras com ruído)")
+
+    if args.saida:
+        args.saida.write_text(json.dumps(resultados, indent=2, ensure_ascii=False))
+        print(f"\n✅ Resultados salvos em {args.saida}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from app.nucleo import config
+from app.nucleo.inferencia import MOTORES, criar_motor
+
+
+def medir(motor, entradas, repeticoes):
+    """Latência por chamada (ms) de `motor.prever` sobre janelas aleatórias"""
+    tempos = []
+    for i in range(repeticoes):
+        inicio = time.perf_counter()
+        motor.prever(entradas[i % len(entradas)])
+        tempos.append((time.perf_counter() - inicio) * 1000)
+    return np.array(tempos)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compara a latência por chamada dos backends de inferência")
+    parser.add_argument('--modelo', type=Path, default=config.MODEL_PATH)
+    # remoto exige o servidor; indice, um índice cadastrado (indexar_gestos.py)
+    locais = [backend for backend in MOTORES if backend not in ('remoto', 'indice')]
+    parser.add_argument('--backends', nargs='+', default=locais, choices=list(MOTORES))
+    parser.add_argument('--repeticoes', type=int, default=500)
+    parser.add_argument('--aquecimento', type=int, default=20)
+    args = parser.parse_args()
+
+    print("=== BENCHMARK DE INFERÊNCIA ===")
+    rng = np.random.default_rng(0)
+    referencia = None
+    entradas = None
+
+    for backend in args.backends:
+        inicio = time.perf_counter()
+        motor = criar_motor(backend, args.modelo)
+        tempo_carga = time.perf_counter() - inicio
+
+        if entradas is None:
+            forma = (1, motor.tamanho_sequencia, motor.largura)
+            entradas = [rng.random(forma, dtype=np.float32) for _ in range(32)]
+
+        medir(motor, entradas, args.aquecimento)
+        tempos = medir(motor, entradas, args.repeticoes)
+
+        # Diferença máxima de probabilidade em relação ao primeiro backend; o
+        # índice tem as classes dos gestos cadastrados, sem comparação possível
+        diferenca = '-'
+        if backend != 'indice':
+            saidas = np.array([motor.prever(e) for e in entradas])
+            if referencia is None:
+                referencia = saidas
+            diferenca = f"{np.abs(saidas - referencia).max():.2e}"
+
+        print(f"{backend:>12}: carga {tempo_carga:6.2f}s | "
+              f"média {tempos.mean():7.3f}ms | p50 {np.percentile(tempos, 50):7.3f}ms | "
+              f"p95 {np.percentile(tempos, 95):7.3f}ms | dif. máx {diferenca}")
+
+        if getattr(motor, 'streaming', False):
+            # Custo real por frame no modo streaming: um passo (com ressincronizações)
+            quadros = rng.random((args.repeticoes, motor.largura), dtype=np.float32)
+            motor.resetar()
+            tempos_passo = []
+            for vetor in quadros:
+                inicio = time.perf_counter()
+                motor.passo(vetor)
+                tempos_passo.append((time.perf_counter() - inicio) * 1000)
+            tempos_passo = np.array(tempos_passo)
+            print(f"{'por frame':>12}: média {tempos_passo.mean():7.3f}ms | "
+                  f"p50 {np.percentile(tempos_passo, 50):7.3f}ms | "
+                  f"p95 {np.percentile(tempos_passo, 95):7.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
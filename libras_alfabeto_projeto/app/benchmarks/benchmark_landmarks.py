@@ -0,0 +1,63 @@
+import argparse
+import sys
+import timeit
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from app.nucleo.landmarks import LANDMARKS_POR_MAO, ExtratorLandmarks
+
+
+def processar_landmarks_antigo(results):
+    """Implementação anterior (listas aninhadas + np.array float64), para referência"""
+    landmarks = []
+    if results.multi_hand_landmarks:
+        for hand in results.multi_hand_landmarks:
+            landmarks.extend([[lm.x, lm.y, lm.z] for lm in hand.landmark])
+
+    landmarks = landmarks[:42]
+    if len(landmarks) < 42:
+        landmarks.extend([[0, 0, 0]] * (42 - len(landmarks)))
+
+    return np.array(landmarks).flatten()
+
+
+def criar_mao(rng):
+    """Mão com 21 landmarks; usa o protobuf real do MediaPipe quando disponível"""
+    try:
+        from mediapipe.framework.formats import landmark_pb2
+        mao = landmark_pb2.NormalizedLandmarkList()
+        for x, y, z in rng.random((LANDMARKS_POR_MAO, 3)):
+            ponto = mao.landmark.add()
+            ponto.x, ponto.y, ponto.z = x, y, z
+        return mao
+    except ImportError:
+        return SimpleNamespace(landmark=[SimpleNamespace(x=x, y=y, z=z)
+                                         for x, y, z in rng.random((LANDMARKS_POR_MAO, 3))])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Custo por frame do empacotamento de landmarks")
+    parser.add_argument('--repeticoes', type=int, default=20000)
+    args = parser.parse_args()
+
+    print("=== BENCHMARK DE LANDMARKS ===")
+    rng = np.random.default_rng(0)
+    extrator = ExtratorLandmarks()
+
+    for num_maos in (1, 2):
+        results = SimpleNamespace(multi_hand_landmarks=[criar_mao(rng) for _ in range(num_maos)])
+        assert np.allclose(processar_landmarks_antigo(results), extrator.extrair(results), atol=1e-6)
+
+        medidas = {}
+        for nome, funcao in (('antes', processar_landmarks_antigo), ('depois', extrator.extrair)):
+            tempos = timeit.repeat(lambda: funcao(results), number=args.repeticoes, repeat=5)
+            medidas[nome] = min(tempos) / args.repeticoes * 1e6
+        print(f"{num_maos} mão(s): antes {medidas['antes']:6.1f}µs | depois {medidas['depois']:6.1f}µs "
+              f"| {medidas['antes'] / medidas['depois']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
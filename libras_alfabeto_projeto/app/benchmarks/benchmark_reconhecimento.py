@@ -0,0 +1,213 @@
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import cv2
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from app.nucleo import config
+from app.nucleo.fontes import TIPOS_FONTE, criar_fonte
+from app.nucleo.inferencia import MOTORES, carregar_rotulador, criar_motor
+from app.nucleo.janela import JanelaCircular
+from app.nucleo.landmarks import ExtratorLandmarks
+from app.nucleo.metricas import MetricasEstagios, pico_memoria_mb
+from app.nucleo.suavizacao import SUAVIZADORES, criar_suavizador
+
+PERCENTIS = (50, 95, 99)
+ESTAGIOS = ('leitura', 'conversao', 'deteccao', 'desenho', 'empacotamento',
+            'inferencia', 'votacao', 'total')
+RESET_THRESHOLD = 10
+
+
+def commit_atual():
+    """Hash curto do commit do repositório, ou None fora do git"""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=Path(__file__).parent,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def executar(fonte, motor, classes, desenhar=True, aquecimento=30, max_frames=None, suavizacao=None):
+    """Reproduz a fonte pelos mesmos estágios do reconhecimento, um frame por vez"""
+    import mediapipe as mp
+    mp_hands = mp.solutions.hands
+    hands = mp_hands.Hands(static_image_mode=False, max_num_hands=2,
+                           min_detection_confidence=0.7, min_tracking_confidence=0.5)
+    mp_drawing = mp.solutions.drawing_utils
+
+    metricas = MetricasEstagios(janela=None)
+    extrator = ExtratorLandmarks()
+    buffer = JanelaCircular(motor.tamanho_sequencia, motor.largura, RESET_THRESHOLD)
+    suavizador = criar_suavizador(classes, suavizacao)  # Mesma suavização do AplicativoLibras
+    streaming = getattr(motor, 'streaming', False)
+    frames = predicoes = 0
+    inicio_medicao = None
+
+    while max_frames is None or frames < max_frames:
+        medir = frames >= aquecimento
+        if medir and inicio_medicao is None:
+            inicio_medicao = time.perf_counter()
+        tempos = {}
+
+        t0 = time.perf_counter()
+        ret, frame = fonte.read()
+        tempos['leitura'] = time.perf_counter() - t0
+        if not ret:
+            break
+        frames += 1
+
+        t = time.perf_counter()
+        frame = cv2.flip(frame, 1)
+        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        tempos['conversao'] = time.perf_counter() - t
+
+        t = time.perf_counter()
+        results = fonte.resultado if fonte.resultado is not None else hands.process(frame_rgb)
+        tempos['deteccao'] = time.perf_counter() - t
+
+        preds = None
+        if results.multi_hand_landmarks:
+            if desenhar:
+                t = time.perf_counter()
+                for mao in results.multi_hand_landmarks:
+                    mp_drawing.draw_landmarks(frame_rgb, mao, mp_hands.HAND_CONNECTIONS)
+                tempos['desenho'] = time.perf_counter() - t
+
+            t = time.perf_counter()
+            landmarks = extrator.extrair(results)
+            buffer.adicionar(landmarks)
+            tempos['empacotamento'] = time.perf_counter() - t
+
+            t = time.perf_counter()
+            if streaming:
+                preds = motor.passo(landmarks)
+            elif buffer.cheia:
+                preds = motor.prever(buffer.janela())
+            if preds is not None:
+                tempos['inferencia'] = time.perf_counter() - t
+        elif buffer.registrar_sem_maos() and streaming:
+            motor.resetar()
+
+        if preds is not None:
+            predicoes += medir
+            t = time.perf_counter()
+            suavizador.atualizar(preds)
+            tempos['votacao'] = time.perf_counter() - t
+
+        tempos['total'] = time.perf_counter() - t0
+        if medir:
+            for estagio, duracao in tempos.items():
+                metricas.registrar(estagio, duracao)
+
+    duracao = time.perf_counter() - inicio_medicao if inicio_medicao else 0.0
+    hands.close()
+    medidos = max(frames - aquecimento, 0)
+    return {
+        'frames': frames,
+        'frames_medidos': medidos,
+        'predicoes': predicoes,
+        'duracao_s': duracao,
+        'fps': medidos / duracao if duracao > 0 else 0.0,
+        'memoria_pico_mb': pico_memoria_mb(),
+        'estagios': {estagio: valores for estagio, valores in metricas.resumo(PERCENTIS).items()
+                     if estagio in ESTAGIOS},
+    }
+
+
+def imprimir(resultado):
+    print(f"Frames: {resultado['frames_medidos']} medidos | predições: {resultado['predicoes']} | "
+          f"FPS {resultado['fps']:.1f} | pico de RSS: {resultado['memoria_pico_mb'] or 0:.0f}MB")
+    for estagio in ESTAGIOS:
+        valores = resultado['estagios'].get(estagio)
+        if valores:
+            print(f"{estagio:>14}: " + " | ".join(f"p{p} {valores[f'p{p}_ms']:7.3f}ms" for p in PERCENTIS)
+                  + f" | n={valores['n']}")
+
+
+def comparar(base, atual, limite):
+    """Imprime a variação contra um resultado anterior; retorna as regressões acima do limite (%)"""
+    print(f"\n=== COMPARAÇÃO com {base.get('commit') or 'base'} ===")
+    regressoes = []
+    variacao_fps = (atual['fps'] / base['fps'] - 1) * 100 if base['fps'] else 0.0
+    print(f"{'FPS':>14}: {base['fps']:7.1f} -> {atual['fps']:7.1f} ({variacao_fps:+.1f}%)")
+    if variacao_fps < -limite:
+        regressoes.append('fps')
+    for estagio in ESTAGIOS:
+        antes, depois = base['estagios'].get(estagio), atual['estagios'].get(estagio)
+        if not antes or not depois:
+            continue
+        partes = []
+        for p in PERCENTIS:
+            chave = f'p{p}_ms'
+            variacao = (depois[chave] / antes[chave] - 1) * 100 if antes[chave] else 0.0
+            marca = ''
+            if variacao > limite:
+                marca = ' ⚠️'
+                regressoes.append(f'{estagio} p{p}')
+            partes.append(f"p{p} {antes[chave]:.3f}->{depois[chave]:.3f}ms ({variacao:+.0f}%){marca}")
+        print(f"{estagio:>14}: " + " | ".join(partes))
+    return regressoes
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Vazão ponta a ponta do reconhecimento sobre uma gravação (sem janela)")
+    parser.add_argument('--fonte', choices=TIPOS_FONTE, default='landmarks')
+    parser.add_argument('--caminho', default=str(config.DATASET_PATH),
+                        help="Vídeo, pasta de imagens ou landmarks gravados")
+    parser.add_argument('--modelo', type=Path, default=config.MODEL_PATH)
+    parser.add_argument('--rotulos', type=Path, default=config.LABEL_PATH)
+    parser.add_argument('--backend', choices=list(MOTORES), default=config.BACKEND_INFERENCIA)
+    parser.add_argument('--max-frames', type=int, default=None)
+    parser.add_argument('--aquecimento', type=int, default=30, help="Frames iniciais fora da medição")
+    parser.add_argument('--sem-desenho', action='store_true')
+    parser.add_argument('--suavizacao', choices=list(SUAVIZADORES), default=config.SUAVIZACAO)
+    parser.add_argument('--saida', type=Path, default=None,
+                        help="JSON de resultado (padrão: resultados/reconhecimento_<commit>.json)")
+    parser.add_argument('--comparar', type=Path, default=None, help="JSON anterior para comparação")
+    parser.add_argument('--limite', type=float, default=10.0,
+                        help="Variação (%%) acima da qual a comparação acusa regressão")
+    args = parser.parse_args()
+
+    print("=== BENCHMARK DE RECONHECIMENTO ===")
+    motor = criar_motor(args.backend, args.modelo)
+    classes = list(carregar_rotulador(motor, args.rotulos).classes_)
+    fonte = criar_fonte(args.fonte, args.caminho, rapido=True)
+
+    resultado = executar(fonte, motor, classes, desenhar=not args.sem_desenho,
+                         aquecimento=args.aquecimento, max_frames=args.max_frames,
+                         suavizacao=args.suavizacao)
+    fonte.release()
+    resultado = {
+        'commit': commit_atual(),
+        'data': datetime.now().isoformat(timespec='seconds'),
+        'plataforma': platform.platform(),
+        'python': platform.python_version(),
+        'backend': args.backend,
+        'suavizacao': args.suavizacao,
+        'fonte': args.fonte,
+        'caminho': str(args.caminho),
+        **resultado,
+    }
+    imprimir(resultado)
+
+    saida = args.saida or Path('resultados') / f"reconhecimento_{resultado['commit'] or 'local'}.json"
+    saida.parent.mkdir(parents=True, exist_ok=True)
+    saida.write_text(json.dumps(resultado, indent=2, ensure_ascii=False))
+    print(f"\n✅ Resultado salvo em {saida}")
+
+    if args.comparar:
+        regressoes = comparar(json.loads(args.comparar.read_text()), resultado, args.limite)
+        if regressoes:
+            print(f"\n⚠️ Regressões acima de {args.limite:.0f}%: {', '.join(regressoes)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
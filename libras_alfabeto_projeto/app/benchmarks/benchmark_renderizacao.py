@@ -0,0 +1,104 @@
+import argparse
+import sys
+import timeit
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+from PIL import Image
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from app.nucleo.renderizacao import RenderizadorQuadros, desenhar_maos_leve
+
+LARGURA, ALTURA = 640, 480
+
+
+def criar_results(rng, num_maos=2):
+    from mediapipe.framework.formats import landmark_pb2
+    maos = []
+    for _ in range(num_maos):
+        mao = landmark_pb2.NormalizedLandmarkList()
+        for x, y in 0.2 + 0.6 * rng.random((21, 2)):
+            ponto = mao.landmark.add()
+            ponto.x, ponto.y = x, y
+        maos.append(mao)
+    return SimpleNamespace(multi_hand_landmarks=maos)
+
+
+def medir(funcao, repeticoes):
+    """Menor tempo médio por chamada (ms) em 5 rodadas"""
+    return min(timeit.repeat(funcao, number=repeticoes, repeat=5)) / repeticoes * 1000
+
+
+def desenho(frame, results, repeticoes):
+    import mediapipe as mp
+    mp_hands = mp.solutions.hands
+    mp_drawing = mp.solutions.drawing_utils
+    mp_drawing_styles = mp.solutions.drawing_styles
+
+    def antes():
+        for mao in results.multi_hand_landmarks:
+            mp_drawing.draw_landmarks(frame, mao, mp_hands.HAND_CONNECTIONS,
+                                      mp_drawing_styles.get_default_hand_landmarks_style(),
+                                      mp_drawing_styles.get_default_hand_connections_style())
+
+    return medir(antes, repeticoes), medir(lambda: desenhar_maos_leve(frame, results), repeticoes)
+
+
+def exibicao(frame, repeticoes):
+    """Custo na thread do Tk; sem display mede só a parte sem Tk (conversão e resize)"""
+    try:
+        import tkinter as tk
+        from PIL import ImageTk
+        root = tk.Tk()
+    except Exception as e:
+        print(f"⚠️ Tk indisponível ({e}); medindo sem criar PhotoImage")
+        antes = medir(lambda: Image.fromarray(frame).resize((LARGURA, ALTURA), Image.LANCZOS), repeticoes)
+        return antes, medir(lambda: Image.fromarray(frame), repeticoes), False
+
+    label = tk.Label(root)
+    label.pack()
+
+    def mostrar_antigo():
+        img = ImageTk.PhotoImage(image=Image.fromarray(frame).resize((LARGURA, ALTURA), Image.LANCZOS))
+        label.imgtk = img
+        label.config(image=img)
+        root.update_idletasks()
+
+    renderizador = RenderizadorQuadros(label, LARGURA, ALTURA)
+
+    def mostrar_novo():
+        renderizador.mostrar(frame)
+        root.update_idletasks()
+
+    resultado = medir(mostrar_antigo, repeticoes), medir(mostrar_novo, repeticoes), True
+    root.destroy()
+    return resultado
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Custo por quadro do desenho e da exibição do vídeo")
+    parser.add_argument('--repeticoes', type=int, default=200)
+    parser.add_argument('--fps', type=float, default=20, help="FPS usado para estimar a ocupação da thread do Tk")
+    args = parser.parse_args()
+
+    print("=== BENCHMARK DE RENDERIZAÇÃO ===")
+    rng = np.random.default_rng(0)
+    frame = rng.integers(0, 255, (ALTURA, LARGURA, 3), dtype=np.uint8)
+    results = criar_results(rng)
+
+    desenho_antes, desenho_depois = desenho(frame, results, args.repeticoes)
+    print(f"Desenho (2 mãos):  antes {desenho_antes:6.2f}ms | depois {desenho_depois:6.2f}ms "
+          f"| {desenho_antes / desenho_depois:.1f}x")
+
+    exibicao_antes, exibicao_depois, com_tk = exibicao(frame, args.repeticoes)
+    rotulo = "Exibição" if com_tk else "Exibição (sem Tk)"
+    print(f"{rotulo}: antes {exibicao_antes:6.2f}ms | depois {exibicao_depois:6.2f}ms "
+          f"| {exibicao_antes / exibicao_depois:.1f}x")
+    # O desenho roda na thread de landmarks; na thread do Tk fica só a exibição
+    print(f"Ocupação da thread do Tk a {args.fps:g} FPS: antes {exibicao_antes * args.fps / 10:.0f}% "
+          f"| depois {exibicao_depois * args.fps / 10:.0f}%")
+
+
+if __name__ == "__main__":
+    main()
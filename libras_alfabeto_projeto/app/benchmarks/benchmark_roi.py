@@ -0,0 +1,140 @@
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from app.nucleo import config
+from app.nucleo.fontes import adicionar_argumentos_fonte, fonte_dos_argumentos
+from app.nucleo.janela import JanelaCircular
+from app.nucleo.landmarks import ExtratorLandmarks
+from app.nucleo.roi import RastreadorROI
+
+
+def criar_hands():
+    import mediapipe as mp
+    return mp.solutions.hands.Hands(static_image_mode=False, max_num_hands=2,
+                                    min_detection_confidence=0.7, min_tracking_confidence=0.5)
+
+
+def comparar(fonte, rastreador_args, motor=None, max_frames=None, aquecimento=10):
+    """Detecta cada quadro inteiro e pelo rastreador ROI (detectores separados) e compara"""
+    hands_inteiro, hands_roi = criar_hands(), criar_hands()
+    rastreador = RastreadorROI(hands_roi.process, resetar=hands_roi.reset, **rastreador_args)
+    extratores = ExtratorLandmarks(), ExtratorLandmarks()
+    janelas = None
+    if motor is not None:
+        janelas = (JanelaCircular(motor.tamanho_sequencia, motor.largura),
+                   JanelaCircular(motor.tamanho_sequencia, motor.largura))
+
+    tempos_inteiro, tempos_roi, erros = [], [], []
+    quadros = concordancia = predicoes = predicoes_iguais = 0
+    while max_frames is None or quadros < max_frames:
+        ret, frame = fonte.read()
+        if not ret:
+            break
+        quadros += 1
+        frame_rgb = cv2.cvtColor(cv2.flip(frame, 1), cv2.COLOR_BGR2RGB)
+
+        inicio = time.perf_counter()
+        results_inteiro = hands_inteiro.process(frame_rgb)
+        meio = time.perf_counter()
+        results_roi = rastreador(frame_rgb)
+        fim = time.perf_counter()
+        if quadros > aquecimento:  # Primeiras chamadas inicializam o grafo do MediaPipe
+            tempos_inteiro.append(meio - inicio)
+            tempos_roi.append(fim - meio)
+
+        maos_inteiro = len(results_inteiro.multi_hand_landmarks or [])
+        maos_roi = len(results_roi.multi_hand_landmarks or [])
+        concordancia += maos_inteiro == maos_roi
+        if not maos_inteiro or maos_inteiro != maos_roi:
+            continue
+        vetores = [extrator.extrair(r) for extrator, r in zip(extratores, (results_inteiro, results_roi))]
+        erros.append(np.abs(vetores[0] - vetores[1])[:maos_inteiro * 63].mean())
+
+        if janelas is not None:
+            for janela, vetor in zip(janelas, vetores):
+                janela.adicionar(vetor)
+            if janelas[0].cheia:
+                preds = [np.argmax(motor.prever(janela.janela())) for janela in janelas]
+                predicoes += 1
+                predicoes_iguais += preds[0] == preds[1]
+
+    medidos = len(tempos_inteiro)
+    tempos_inteiro = np.array(tempos_inteiro) * 1000
+    tempos_roi = np.array(tempos_roi) * 1000
+    return {
+        'quadros': quadros,
+        'deteccao_inteiro_ms': float(tempos_inteiro.mean()) if medidos else 0.0,
+        'deteccao_roi_ms': float(tempos_roi.mean()) if medidos else 0.0,
+        'deteccao_inteiro_p95_ms': float(np.percentile(tempos_inteiro, 95)) if medidos else 0.0,
+        'deteccao_roi_p95_ms': float(np.percentile(tempos_roi, 95)) if medidos else 0.0,
+        'taxa_recorte': rastreador.taxa_recorte(),
+        'perdas': rastreador.perdas,
+        'concordancia_maos': concordancia / quadros if quadros else 0.0,
+        'erro_medio_landmarks': float(np.mean(erros)) if erros else None,
+        'erro_max_landmarks': float(np.max(erros)) if erros else None,
+        'predicoes_comparadas': predicoes,
+        'predicoes_iguais': predicoes_iguais / predicoes if predicoes else None,
+    }
+
+
+def main():
+    parser = adicionar_argumentos_fonte(argparse.ArgumentParser(
+        description="Tempo de detecção e desvio dos landmarks com o rastreador ROI"))
+    parser.add_argument('--max-frames', type=int, default=None)
+    parser.add_argument('--aquecimento', type=int, default=10, help="Quadros iniciais fora da medição")
+    parser.add_argument('--margem', type=float, default=0.3)
+    parser.add_argument('--tamanho-minimo', type=int, default=160)
+    parser.add_argument('--intervalo-completo', type=int, default=30)
+    parser.add_argument('--modelo', type=Path, default=config.MODEL_PATH,
+                        help="Compara também as predições do modelo (se o arquivo existir)")
+    parser.add_argument('--backend', default='tf_function')
+    parser.add_argument('--saida', type=Path, default=None, help="Salva os resultados em JSON")
+    args = parser.parse_args()
+    # Gravações: todos os quadros, sem esperar o FPS original
+    args.rapido = args.rapido or args.fonte != 'camera'
+
+    print("=== BENCHMARK DO RASTREADOR ROI ===")
+    motor = None
+    if args.modelo.exists():
+        from app.nucleo.inferencia import criar_motor
+        motor = criar_motor(args.backend, args.modelo)
+
+    fonte = fonte_dos_argumentos(args)
+    try:
+        resultado = comparar(fonte, {'margem': args.margem, 'tamanho_minimo': args.tamanho_minimo,
+                                     'intervalo_completo': args.intervalo_completo},
+                             motor, args.max_frames, args.aquecimento)
+    finally:
+        fonte.release()
+
+    if resultado['quadros'] <= args.aquecimento:
+        print("❌ Quadros insuficientes na fonte")
+        return
+    economia = 1 - resultado['deteccao_roi_ms'] / resultado['deteccao_inteiro_ms']
+    print(f"{resultado['quadros']} quadros | recorte em {resultado['taxa_recorte']:.0%} "
+          f"({resultado['perdas']} perdas)")
+    print(f"Detecção: inteiro {resultado['deteccao_inteiro_ms']:.2f}ms "
+          f"(p95 {resultado['deteccao_inteiro_p95_ms']:.2f}) | ROI {resultado['deteccao_roi_ms']:.2f}ms "
+          f"(p95 {resultado['deteccao_roi_p95_ms']:.2f}) | economia {economia:.0%}")
+    print(f"Mesmo número de mãos em {resultado['concordancia_maos']:.1%} dos quadros")
+    if resultado['erro_medio_landmarks'] is not None:
+        print(f"Desvio dos landmarks: médio {resultado['erro_medio_landmarks']:.4f} | "
+              f"máximo {resultado['erro_max_landmarks']:.4f} (coordenadas normalizadas)")
+    if resultado['predicoes_iguais'] is not None:
+        print(f"Predição igual em {resultado['predicoes_iguais']:.1%} de "
+              f"{resultado['predicoes_comparadas']} janelas")
+
+    if args.saida:
+        args.saida.write_text(json.dumps(resultado, indent=2))
+        print(f"\n✅ Resultados salvos em {args.saida}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+import argparse
+import json
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from app.nucleo import config
+from app.nucleo.remoto import ROTA_METRICAS, MotorRemoto
+
+SERVIDOR = Path(__file__).resolve().parents[1] / 'servidor' / 'servidor_reconhecimento.py'
+
+
+def iniciar_servidor(args):
+    """Sobe o servidor em outro processo e espera ele responder"""
+    processo = subprocess.Popen([sys.executable, str(SERVIDOR), '--porta', str(args.porta),
+                                 '--modelo', str(args.modelo), '--lote-maximo', str(args.lote_maximo),
+                                 '--espera-ms', str(args.espera_ms)])
+    url = f'http://127.0.0.1:{args.porta}'
+    limite = time.time() + 120
+    while time.time() < limite:
+        if processo.poll() is not None:
+            raise RuntimeError("O servidor terminou antes de ficar pronto")
+        try:
+            MotorRemoto(url=url).fechar()
+            return processo, url
+        except OSError:
+            time.sleep(0.5)
+    processo.terminate()
+    raise TimeoutError("Servidor não respondeu a tempo")
+
+
+def cliente(url, janelas, prazo, latencias):
+    """Cliente em laço fechado: manda a próxima janela assim que recebe a resposta"""
+    motor = MotorRemoto(url=url)
+    motor.prever(janelas[0])
+    i = 0
+    while time.perf_counter() < prazo:
+        inicio = time.perf_counter()
+        motor.prever(janelas[i % len(janelas)])
+        latencias.append(time.perf_counter() - inicio)
+        i += 1
+    motor.fechar()
+
+
+def medir(url, num_clientes, duracao, janelas):
+    # Conexão do monitor fechada durante a carga: o servidor conta clientes conectados
+    monitor = MotorRemoto(url=url)
+    antes = monitor.requisitar('GET', ROTA_METRICAS)
+    monitor.fechar()
+    latencias = [[] for _ in range(num_clientes)]
+    prazo = time.perf_counter() + duracao
+    threads = [threading.Thread(target=cliente, args=(url, janelas, prazo, latencias[i]))
+               for i in range(num_clientes)]
+    inicio = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    decorrido = time.perf_counter() - inicio
+    monitor = MotorRemoto(url=url)
+    depois = monitor.requisitar('GET', ROTA_METRICAS)
+    monitor.fechar()
+
+    todas = np.concatenate([np.array(l) for l in latencias]) * 1000
+    lotes = depois['lotes'] - antes['lotes']
+    pedidos = depois['pedidos'] - antes['pedidos']
+    return {
+        'clientes': num_clientes,
+        'pedidos_s': len(todas) / decorrido,
+        'p50_ms': float(np.percentile(todas, 50)),
+        'p95_ms': float(np.percentile(todas, 95)),
+        'tamanho_medio_lote': pedidos / lotes if lotes else 0.0,
+    }
+
+
+def referencia_local(modelo, janelas, duracao):
+    """Um processo com lote 1 (como cada aplicativo fazia): janelas por segundo"""
+    from app.nucleo.inferencia import MotorTFFunction
+    motor = MotorTFFunction(modelo)
+    n = 0
+    prazo = time.perf_counter() + duracao
+    inicio = time.perf_counter()
+    while time.perf_counter() < prazo:
+        motor.prever(janelas[n % len(janelas)][None])
+        n += 1
+    return n / (time.perf_counter() - inicio)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Vazão do servidor de reconhecimento por número de clientes")
+    parser.add_argument('--url', default=None, help="Servidor já em execução (senão sobe um local)")
+    parser.add_argument('--porta', type=int, default=8765)
+    parser.add_argument('--modelo', type=Path, default=config.MODEL_PATH)
+    parser.add_argument('--lote-maximo', type=int, default=config.LOTE_MAXIMO)
+    parser.add_argument('--espera-ms', type=float, default=config.ESPERA_LOTE_MS)
+    parser.add_argument('--clientes', type=int, nargs='+', default=[1, 2, 4, 8, 16, 32])
+    parser.add_argument('--duracao', type=float, default=5.0, help="Segundos por medição")
+    parser.add_argument('--sem-referencia', action='store_true', help="Pula a medição local com lote 1")
+    parser.add_argument('--saida', type=Path, default=None, help="Salva os resultados em JSON")
+    args = parser.parse_args()
+
+    print("=== BENCHMARK DO SERVIDOR ===")
+    processo = None
+    url = args.url
+    if url is None:
+        processo, url = iniciar_servidor(args)
+
+    try:
+        info = MotorRemoto(url=url)
+        forma = (info.tamanho_sequencia, info.largura)
+        info.fechar()
+        janelas = np.random.default_rng(0).random((64,) + forma, dtype=np.float32)
+
+        resultados = {'url': url, 'lote_maximo': args.lote_maximo, 'espera_ms': args.espera_ms, 'medicoes': []}
+        if not args.sem_referencia:
+            resultados['referencia_local_s'] = referencia_local(args.modelo, janelas, args.duracao)
+            print(f"Referência local (lote 1, 1 processo): {resultados['referencia_local_s']:.0f} janelas/s")
+
+        for num_clientes in args.clientes:
+            medicao = medir(url, num_clientes, args.duracao, janelas)
+            resultados['medicoes'].append(medicao)
+            print(f"{num_clientes:>3} clientes: {medicao['pedidos_s']:7.0f} janelas/s | "
+                  f"p50 {medicao['p50_ms']:6.2f}ms | p95 {medicao['p95_ms']:6.2f}ms | "
+                  f"lote médio {medicao['tamanho_medio_lote']:5.1f}")
+    finally:
+        if processo is not None:
+            processo.terminate()
+            processo.wait()
+
+    if args.saida:
+        args.saida.write_text(json.dumps(resultados, indent=2))
+        print(f"\n✅ Resultados salvos em {args.saida}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from app.nucleo import config
+from app.nucleo.caracteristicas import TIPOS, largura_caracteristicas
+from app.nucleo.dataset import ArmazemGestos
+from app.nucleo.metricas import mediana_ms
+
+# Representação:unidades das LSTMs; a primeira é a referência (modelo atual)
+CONFIGURACOES = ['brutas:128,64', 'normalizadas:128,64', 'normalizadas:64', 'normalizadas:32', 'completas:32']
+
+
+def ler_configuracao(texto):
+    tipo, _, unidades = texto.partition(':')
+    if tipo not in TIPOS:
+        raise argparse.ArgumentTypeError(f"Características desconhecidas: {tipo}")
+    return tipo, tuple(int(n) for n in unidades.split(',')) if unidades else (128, 64)
+
+
+def medir_latencia(motor, janelas, repeticoes):
+    """Por janela, chamando `prever` (inclui a conversão das características)"""
+    return mediana_ms(motor.prever, janelas[:, None], repeticoes)
+
+
+def medir_passo(motor, janelas, repeticoes):
+    """Por frame no modo streaming"""
+    motor.resetar()
+    return mediana_ms(motor.passo, janelas.reshape(-1, janelas.shape[-1]), repeticoes)
+
+
+def treinar(frames, divisao, num_classes, tipo, unidades, epocas, alvo, pasta, semente):
+    """Treina uma configuração; retorna o modelo salvo (com metadados) e o histórico"""
+    import tensorflow as tf
+    from app.nucleo.metadados import salvar_metadados
+    from app.nucleo.treino import criar_modelo, criar_tf_dataset
+
+    idx_treino, idx_teste, y_treino, y_teste = divisao
+    tf.keras.utils.set_random_seed(semente)
+    modelo = criar_modelo(frames.shape[1], largura_caracteristicas(tipo), num_classes, unidades)
+    inicio = time.perf_counter()
+    historico = modelo.fit(
+        criar_tf_dataset(frames, idx_treino, y_treino, caracteristicas=tipo),
+        validation_data=criar_tf_dataset(frames, idx_teste, y_teste, embaralhar=False, caracteristicas=tipo),
+        epochs=epocas, verbose=0).history
+    duracao = time.perf_counter() - inicio
+
+    caminho = pasta / f"{tipo}_{'_'.join(map(str, unidades))}.h5"
+    modelo.save(caminho)
+    salvar_metadados(caminho, caracteristicas=tipo)
+    acuracias = historico['val_accuracy']
+    convergiu = next((i + 1 for i, a in enumerate(acuracias) if a >= alvo), None)
+    return caminho, {
+        'parametros': modelo.count_params(),
+        'acuracia_final': float(acuracias[-1]),
+        'acuracia_maxima': float(max(acuracias)),
+        'epocas_ate_alvo': convergiu,
+        'treino_s_epoca': duracao / epocas,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compara representações de entrada e tamanhos de modelo: "
+                                                 "convergência, acurácia e latência de inferência")
+    parser.add_argument('--dataset', type=Path, default=config.DATASET_PATH)
+    parser.add_argument('--configuracoes', nargs='+', type=ler_configuracao,
+                        default=[ler_configuracao(c) for c in CONFIGURACOES],
+                        help="tipo:unidades (ex.: brutas:128,64 normalizadas:32)")
+    parser.add_argument('--epocas', type=int, default=30)
+    parser.add_argument('--alvo', type=float, default=0.95, help="Acurácia de validação que conta como convergência")
+    parser.add_argument('--repeticoes', type=int, default=300)
+    parser.add_argument('--semente', type=int, default=0)
+    parser.add_argument('--saida', type=Path, default=None, help="Salva os resultados em JSON")
+    args = parser.parse_args()
+
+    from sklearn.model_selection import train_test_split
+    from sklearn.preprocessing import LabelEncoder
+    from app.nucleo.inferencia import MotorTFFunction
+    from app.nucleo.streaming import MotorStreaming
+
+    print("=== COMPARAÇÃO DE CARACTERÍSTICAS ===")
+    frames, nomes, _ = ArmazemGestos(args.dataset).carregar()
+    le = LabelEncoder()
+    rotulos = le.fit_transform(nomes)
+    divisao = train_test_split(np.arange(len(nomes)), rotulos, test_size=0.2,
+                               random_state=args.semente, stratify=rotulos)
+    janelas = np.asarray(frames[divisao[1][:200]])
+    print(f"Amostras: {len(nomes)} | classes: {len(le.classes_)} | épocas: {args.epocas}")
+
+    resultados = {}
+    with tempfile.TemporaryDirectory() as pasta:
+        for tipo, unidades in args.configuracoes:
+            nome = f"{tipo}:{','.join(map(str, unidades))}"
+            print(f"Treinando {nome}...")
+            caminho, r = treinar(frames, divisao, len(le.classes_), tipo, unidades,
+                                 args.epocas, args.alvo, Path(pasta), args.semente)
+            r['inferencia_ms'] = medir_latencia(MotorTFFunction(caminho), janelas, args.repeticoes)
+            r['streaming_passo_ms'] = medir_passo(MotorStreaming(caminho), janelas, args.repeticoes)
+            resultados[nome] = r
+
+    print(f"\n{'configuração':<22} {'parâmetros':>10} {'acurácia':>9} {'máx':>6} {f'épocas≥{args.alvo:.0%}':>10} "
+          f"{'s/época':>8} {'janela':>8} {'passo':>8}")
+    for nome, r in resultados.items():
+        epocas = r['epocas_ate_alvo'] if r['epocas_ate_alvo'] is not None else '-'
+        print(f"{nome:<22} {r['parametros']:>10,} {r['acuracia_final']:>9.1%} {r['acuracia_maxima']:>6.1%} "
+              f"{epocas:>10} {r['treino_s_epoca']:>8.2f} {r['inferencia_ms']:>6.3f}ms {r['streaming_passo_ms']:>6.3f}ms")
+    print("(medianas; janela: tf_function com a conversão das características; passo: um frame no modo streaming)")
+
+    if args.saida:
+        args.saida.write_text(json.dumps(resultados, indent=2, ensure_ascii=False))
+        print(f"\n✅ Resultados salvos em {args.saida}")
+
+
+if __name__ == "__main__":
+    main()
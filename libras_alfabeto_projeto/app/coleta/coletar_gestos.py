@@ -1,16 +1,25 @@
+import argparse
 import cv2
 import mediapipe as mp
-import pandas as pd
 import numpy as np
 import os
-from datetime import datetime
+import sys
 from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from app.nucleo import config
+from app.nucleo.dataset import ArmazemGestos
+from app.nucleo.fontes import adicionar_argumentos_fonte, fonte_dos_argumentos
+from app.nucleo.landmarks import ExtratorLandmarks
+
 # Configurações
-CSV_PATH = Path('dados/gestos_libras.csv')
-CSV_PATH.parent.mkdir(exist_ok=True)
-SEQUENCE_LENGTH = 30  # Número fixo de frames
+DATASET_PATH = config.DATASET_PATH
+SEQUENCE_LENGTH = config.SEQUENCE_LENGTH  # Número fixo de frames
 MIN_FRAMES = 10       # Mínimo para salvar
+armazem = ArmazemGestos(DATASET_PATH, SEQUENCE_LENGTH)
+
+parser = adicionar_argumentos_fonte(argparse.ArgumentParser(description="Coletor de gestos"))
+args = parser.parse_args()
 
 # Inicialização do MediaPipe
 mp_hands = mp.solutions.hands
@@ -21,32 +30,14 @@ hands = mp_hands.Hands(
     min_tracking_confidence=0.5
 )
 mp_drawing = mp.solutions.drawing_utils
-
-def padronizar_frames(frames):
-    """Garante SEQUENCE_LENGTH frames com preenchimento/corte"""
-    if len(frames) > SEQUENCE_LENGTH:
-        return frames[:SEQUENCE_LENGTH]
-    elif len(frames) < SEQUENCE_LENGTH:
-        return np.pad(frames, ((0, SEQUENCE_LENGTH - len(frames)), (0, 0)), 
-                      mode='constant')
-    return frames
+extrator = ExtratorLandmarks()  # Buffer float32 (42, 3) reutilizado a cada frame
 
 def salvar_gesto(nome_gesto, frames):
-    """Salva no CSV com formatação consistente"""
-    frames_padrao = padronizar_frames(frames)
-    pd.DataFrame({
-        'nome': [nome_gesto],
-        'frames': [frames_padrao.tolist()],
-        'timestamp': [datetime.now().strftime('%Y-%m-%d %H:%M:%S')]
-    }).to_csv(
-        CSV_PATH,
-        mode='a',
-        header=not CSV_PATH.exists(),
-        index=False
-    )
-
-# Captura de vídeo
-cap = cv2.VideoCapture(0)
+    """Acrescenta a amostra ao dataset binário (padronizada para SEQUENCE_LENGTH frames)"""
+    armazem.adicionar(nome_gesto, frames)
+
+# Captura de vídeo (câmera, vídeo, imagens ou landmarks gravados)
+cap = fonte_dos_argumentos(args)
 if not cap.isOpened():
     print("❌ Câmera não disponível")
     exit()
@@ -54,7 +45,7 @@ if not cap.isOpened():
 print("=== COLETOR DE GESTOS ===")
 print("Instruções:\n1. Digite o nome do gesto\n2. Mostre as mãos\n3. Espaço: Gravar\n4. ESC: Cancelar")
 
-while True:
+while cap.isOpened():
     gesto_nome = input("\nNome do gesto (ou 'sair'): ").strip().upper()
     if gesto_nome.lower() == 'sair':
         break
@@ -66,14 +57,17 @@ while True:
     while True:
         ret, frame = cap.read()
         if not ret:
+            if not cap.isOpened():
+                print("⏹️ Fim da fonte de vídeo")
+                break
             continue
 
         frame = cv2.flip(frame, 1)
-        results = hands.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+        # Landmarks gravados já trazem o resultado da detecção
+        results = cap.resultado if cap.resultado is not None else hands.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
 
         # Detecção e visualização
         if results.multi_hand_landmarks:
-            landmarks = []
             for hand_landmarks in results.multi_hand_landmarks:
                 mp_drawing.draw_landmarks(
                     frame,
@@ -82,15 +76,12 @@ while True:
                     mp_drawing.DrawingSpec(color=(121, 22, 76), thickness=2, circle_radius=2),
                     mp_drawing.DrawingSpec(color=(121, 44, 250), thickness=2, circle_radius=2)
                 )
-                landmarks.extend([[lm.x, lm.y, lm.z] for lm in hand_landmarks.landmark])
 
             # Padroniza para 2 mãos (126 valores)
-            landmarks = landmarks[:42]  # Pega no máximo 2 mãos
-            if len(landmarks) < 42:
-                landmarks.extend([[0,0,0]] * (42 - len(landmarks)))
+            landmarks = extrator.extrair(results)
 
             if gravando:
-                buffer.append(np.array(landmarks).flatten())
+                buffer.append(landmarks.copy())
 
         # Interface
         status = f"{'GRAVANDO' if gravando else 'Aguardando'} | Frames: {len(buffer)}/{SEQUENCE_LENGTH}"
@@ -118,4 +109,4 @@ while True:
 
 cap.release()
 cv2.destroyAllWindows()
-print(f"\nDados salvos em: {CSV_PATH}")
\ No newline at end of file
+print(f"\nDados salvos em: {DATASET_PATH}")
\ No newline at end of file
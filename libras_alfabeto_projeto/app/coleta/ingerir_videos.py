@@ -0,0 +1,172 @@
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from app.nucleo import config
+from app.nucleo.dataset import ArmazemGestos, padronizar_frames
+from app.nucleo.landmarks import ExtratorLandmarks
+
+EXTENSOES_VIDEO = {'.mp4', '.avi', '.mov', '.mkv', '.webm'}
+MIN_FRAMES = 10       # Mesmo mínimo do coletor interativo
+RESET_THRESHOLD = 10  # Frames sem mãos que encerram um trecho
+
+# Estado de cada processo do pool (um detector por worker)
+_hands = None
+_extrator = None
+
+
+def listar_videos(raiz):
+    """(caminho, gesto) para cada vídeo: o gesto é a subpasta (ou o nome do arquivo na raiz)"""
+    raiz = Path(raiz)
+    videos = []
+    for caminho in sorted(raiz.rglob('*')):
+        if caminho.suffix.lower() not in EXTENSOES_VIDEO:
+            continue
+        gesto = caminho.stem if caminho.parent == raiz else caminho.parent.name
+        videos.append((caminho, gesto.strip().upper()))
+    return videos
+
+
+def segmentar(frames, tamanho_sequencia, passo, min_frames=MIN_FRAMES):
+    """Corta um trecho contínuo de frames com mãos em janelas de `tamanho_sequencia`.
+
+    A última janela incompleta é preenchida com zeros como em `padronizar_frames`
+    (igual às amostras do coletor) se tiver ao menos `min_frames` frames.
+    """
+    janelas = []
+    for inicio in range(0, len(frames), passo):
+        trecho = frames[inicio:inicio + tamanho_sequencia]
+        if len(trecho) < min_frames:
+            break
+        janelas.append(padronizar_frames(np.asarray(trecho), tamanho_sequencia))
+        if inicio + tamanho_sequencia >= len(frames):
+            break
+    return janelas
+
+
+def _iniciar_worker():
+    global _hands, _extrator
+    import mediapipe as mp
+    cv2.setNumThreads(1)  # O paralelismo vem dos processos
+    _hands = mp.solutions.hands.Hands(
+        static_image_mode=False,
+        max_num_hands=2,
+        min_detection_confidence=0.7,
+        min_tracking_confidence=0.5
+    )
+    _extrator = ExtratorLandmarks()
+
+
+def processar_video(tarefa):
+    """Roda o detector sobre um vídeo e devolve as janelas encontradas (em um worker)"""
+    caminho, gesto, tamanho_sequencia, passo = tarefa
+    inicio = time.perf_counter()
+    _hands.reset()  # O rastreamento não passa de um vídeo para outro
+
+    cap = cv2.VideoCapture(str(caminho))
+    trechos, trecho = [], []
+    frames_lidos = frames_sem_maos = 0
+    while True:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        frames_lidos += 1
+        # Mesmo pré-processamento do coletor: espelha e converte para RGB
+        frame = cv2.flip(frame, 1)
+        results = _hands.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+        if results.multi_hand_landmarks:
+            frames_sem_maos = 0
+            trecho.append(_extrator.extrair(results).copy())
+        else:
+            frames_sem_maos += 1
+            if frames_sem_maos > RESET_THRESHOLD and trecho:
+                trechos.append(trecho)
+                trecho = []
+    cap.release()
+    if trecho:
+        trechos.append(trecho)
+
+    janelas = [janela for t in trechos for janela in segmentar(t, tamanho_sequencia, passo)]
+    return {
+        'caminho': str(caminho),
+        'gesto': gesto,
+        'janelas': janelas,
+        'frames': frames_lidos,
+        'duracao': time.perf_counter() - inicio,
+    }
+
+
+def ingerir(videos, processos, tamanho_sequencia, passo, armazem=None, verboso=True):
+    """Processa os vídeos no pool; grava as janelas no armazém se informado"""
+    tarefas = [(caminho, gesto, tamanho_sequencia, passo) for caminho, gesto in videos]
+    total_janelas = total_frames = 0
+    inicio = time.perf_counter()
+    with multiprocessing.Pool(processos, initializer=_iniciar_worker) as pool:
+        for resultado in pool.imap_unordered(processar_video, tarefas):
+            janelas = resultado['janelas']
+            if armazem is not None and janelas:
+                # Só o processo principal escreve no dataset
+                armazem.adicionar_lote([resultado['gesto']] * len(janelas), janelas)
+            total_janelas += len(janelas)
+            total_frames += resultado['frames']
+            if verboso:
+                print(f"  {resultado['gesto']:>12}: {len(janelas):3d} janelas | "
+                      f"{resultado['frames']} frames em {resultado['duracao']:.1f}s | {resultado['caminho']}")
+    return {
+        'videos': len(videos),
+        'janelas': total_janelas,
+        'frames': total_frames,
+        'duracao': time.perf_counter() - inicio,
+    }
+
+
+def resumir(resultado, processos):
+    minutos = resultado['duracao'] / 60
+    return (f"{resultado['videos']} vídeos em {resultado['duracao']:.1f}s com {processos} processo(s): "
+            f"{resultado['videos'] / minutos:.1f} vídeos/min | "
+            f"{resultado['frames'] / resultado['duracao']:.0f} frames/s | {resultado['janelas']} janelas")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gera amostras do dataset a partir de vídeos rotulados")
+    parser.add_argument('pasta', type=Path, help="Pasta com uma subpasta por gesto (ou vídeos GESTO.mp4)")
+    parser.add_argument('--destino', type=Path, default=config.DATASET_PATH)
+    parser.add_argument('--processos', type=int, default=os.cpu_count())
+    parser.add_argument('--passo', type=int, default=config.SEQUENCE_LENGTH,
+                        help="Frames entre o início de janelas consecutivas (menor = janelas sobrepostas)")
+    parser.add_argument('--escalonamento', type=int, nargs='+', default=None,
+                        help="Só mede a vazão com cada número de processos, sem gravar")
+    args = parser.parse_args()
+
+    videos = listar_videos(args.pasta)
+    if not videos:
+        print(f"❌ Nenhum vídeo encontrado em {args.pasta}")
+        return
+    armazem = ArmazemGestos(args.destino)
+    tamanho_sequencia = armazem.tamanho_sequencia
+
+    if args.escalonamento:
+        print("=== ESCALONAMENTO DA INGESTÃO ===")
+        base = None
+        for processos in args.escalonamento:
+            resultado = ingerir(videos, processos, tamanho_sequencia, args.passo, verboso=False)
+            base = base or resultado['duracao']
+            print(f"{resumir(resultado, processos)} | {base / resultado['duracao']:.2f}x")
+        return
+
+    print("=== INGESTÃO DE VÍDEOS ===")
+    print(f"{len(videos)} vídeos, {len({g for _, g in videos})} gestos, {args.processos} processos")
+    resultado = ingerir(videos, args.processos, tamanho_sequencia, args.passo, armazem)
+    print(f"\n✅ {resumir(resultado, args.processos)}")
+    print(f"Dados salvos em: {args.destino}")
+
+
+if __name__ == "__main__":
+    main()
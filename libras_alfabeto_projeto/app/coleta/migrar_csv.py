@@ -0,0 +1,50 @@
+import argparse
+import ast
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from app.nucleo import config
+from app.nucleo.dataset import ArmazemGestos
+
+
+def interpretar_frames(texto):
+    """Lista aninhada salva como texto; json é bem mais rápido que ast quando possível"""
+    try:
+        return json.loads(texto)
+    except ValueError:
+        return ast.literal_eval(texto)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Migra dados/gestos_libras.csv para o dataset binário")
+    parser.add_argument('--csv', type=Path, default=config.CSV_PATH)
+    parser.add_argument('--destino', type=Path, default=config.DATASET_PATH)
+    parser.add_argument('--lote', type=int, default=1000, help="Linhas do CSV lidas por vez")
+    args = parser.parse_args()
+
+    armazem = ArmazemGestos(args.destino)
+    if len(armazem) > 0:
+        print(f"❌ {args.destino} já contém {len(armazem)} amostras; migração cancelada")
+        return
+
+    print("=== MIGRAÇÃO CSV -> DATASET BINÁRIO ===")
+    inicio = time.perf_counter()
+    total = 0
+    for bloco in pd.read_csv(args.csv, chunksize=args.lote):
+        janelas = [np.array(interpretar_frames(frames), dtype=np.float32) for frames in bloco['frames']]
+        armazem.adicionar_lote(bloco['nome'].tolist(), janelas, bloco['timestamp'].astype(str).tolist())
+        total += len(bloco)
+        print(f"  {total} amostras migradas...")
+
+    print(f"\n✅ {total} amostras migradas em {time.perf_counter() - inicio:.1f}s")
+    print(f"Dados salvos em: {args.destino}")
+
+
+if __name__ == "__main__":
+    main()
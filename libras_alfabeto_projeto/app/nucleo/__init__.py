@@ -0,0 +1 @@
+"""Componentes compartilhados entre coleta, treinamento, reconhecimento e GUI"""
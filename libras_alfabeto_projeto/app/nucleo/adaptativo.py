@@ -0,0 +1,94 @@
+import time
+
+from app.nucleo import config
+
+# Níveis do mais fiel ao mais leve: (escala da imagem no detector,
+# detecção a cada N quadros, atraso do laço da interface em ms)
+NIVEIS = (
+    (1.0, 1, 15),
+    (0.75, 1, 15),
+    (0.5, 1, 20),
+    (0.5, 2, 30),
+    (0.5, 3, 40),
+)
+
+
+class ControladorAdaptativo:
+    """Ajusta o custo do reconhecimento ao que a máquina aguenta.
+
+    A cada `periodo` segundos compara o custo medido por quadro (detecção
+    dividida pelo intervalo de detecção, mais o desenho) com o orçamento
+    1000 / `fps_alvo` ms, e a latência p95 captura -> tela com
+    `latencia_alvo_ms`. Estourou: desce um nível em NIVEIS (imagem menor no
+    MediaPipe, depois detecção intercalada, depois interface mais lenta).
+    Sobrou folga larga nos dois: sobe um nível. As faixas de folga e o mínimo
+    de amostras após cada troca evitam oscilação.
+    """
+
+    def __init__(self, metricas, fps_alvo=config.FPS_ALVO, latencia_alvo_ms=config.LATENCIA_ALVO_MS,
+                 ativo=config.ADAPTATIVO, periodo=1.0, min_amostras=15):
+        self.metricas = metricas
+        self.fps_alvo = fps_alvo
+        self.latencia_alvo_ms = latencia_alvo_ms
+        self.ativo = ativo
+        self.periodo = periodo
+        self.min_amostras = min_amostras
+        self.nivel = 0
+        self._ultima_avaliacao = time.perf_counter()
+
+    @property
+    def escala(self):
+        return NIVEIS[self.nivel][0]
+
+    @property
+    def intervalo_deteccao(self):
+        return NIVEIS[self.nivel][1]
+
+    @property
+    def atraso_ui(self):
+        return NIVEIS[self.nivel][2]
+
+    @property
+    def orcamento_ms(self):
+        return 1000 / self.fps_alvo
+
+    def custo_quadro_ms(self, resumo):
+        """Custo médio do estágio de landmarks por quadro capturado"""
+        deteccao = resumo.get('deteccao', {}).get('media_ms', 0.0)
+        desenho = resumo.get('desenho', {}).get('media_ms', 0.0)
+        return deteccao / self.intervalo_deteccao + desenho
+
+    def atualizar(self):
+        """Reavalia o nível (chamar periodicamente, ex.: no laço da interface).
+
+        Retorna True se o nível mudou.
+        """
+        agora = time.perf_counter()
+        if not self.ativo or agora - self._ultima_avaliacao < self.periodo:
+            return False
+        self._ultima_avaliacao = agora
+
+        resumo = self.metricas.resumo()
+        if resumo.get('deteccao', {}).get('n', 0) < self.min_amostras:
+            return False
+        custo = self.custo_quadro_ms(resumo)
+        latencia = resumo.get('ponta_a_ponta', {}).get('p95_ms', 0.0)
+
+        novo = self.nivel
+        if custo > self.orcamento_ms or latencia > self.latencia_alvo_ms:
+            novo = min(self.nivel + 1, len(NIVEIS) - 1)
+        elif custo < 0.5 * self.orcamento_ms and latencia < 0.6 * self.latencia_alvo_ms:
+            novo = max(self.nivel - 1, 0)
+        if novo == self.nivel:
+            return False
+
+        self.nivel = novo
+        self.metricas.limpar()  # Medidas do nível anterior não valem mais
+        print(f"[adaptativo] {self.descrever()} (custo {custo:.1f}ms/quadro, "
+              f"orçamento {self.orcamento_ms:.0f}ms, latência p95 {latencia:.0f}ms)")
+        return True
+
+    def descrever(self):
+        """Ajustes atuais em uma linha (interface e logs)"""
+        return (f"nível {self.nivel}: imagem {self.escala:.0%}, detecção 1/{self.intervalo_deteccao}, "
+                f"UI {self.atraso_ui}ms")
@@ -0,0 +1,128 @@
+import numpy as np
+
+from app.nucleo.landmarks import LANDMARKS_POR_MAO, LARGURA, MAX_MAOS
+from app.nucleo.metadados import carregar_metadados
+
+# Representações de entrada do modelo (gravadas nos metadados, ver nucleo/metadados.py):
+# - 'brutas': x/y/z da imagem como o MediaPipe entrega (modelos antigos)
+# - 'normalizadas': cada mão relativa ao punho e dividida pelo tamanho da palma
+# - 'completas': normalizadas + ângulos das articulações e distâncias entre pontas
+TIPOS = ('brutas', 'normalizadas', 'completas')
+
+PUNHO = 0
+BASE_MEDIO = 9  # Articulação MCP do dedo médio: punho -> MCP define a escala da mão
+PONTAS = np.array([4, 8, 12, 16, 20])
+
+# Triplas (anterior, articulação, próxima) das três articulações de cada dedo
+_BASES_DEDOS = (1, 5, 9, 13, 17)
+_ARTICULACOES = np.array([(b + i - 1 if i else PUNHO, b + i, b + i + 1)
+                          for b in _BASES_DEDOS for i in range(3)])
+_PARES_PONTAS = np.array([(a, b) for i, a in enumerate(PONTAS) for b in PONTAS[i + 1:]])
+
+EXTRAS_POR_MAO = len(_ARTICULACOES) + len(_PARES_PONTAS)  # 15 ângulos + 10 distâncias
+
+
+def largura_caracteristicas(tipo):
+    """Valores por frame que o modelo recebe com a representação `tipo`"""
+    if tipo not in TIPOS:
+        raise ValueError(f"Características desconhecidas: {tipo} (opções: {', '.join(TIPOS)})")
+    return LARGURA + (MAX_MAOS * EXTRAS_POR_MAO if tipo == 'completas' else 0)
+
+
+def _angulos_distancias(relativos):
+    """Cosseno do ângulo em cada articulação e distância entre cada par de pontas
+    dos dedos, a partir das coordenadas já relativas e em escala: (..., 2, 25)"""
+    anterior = relativos[..., _ARTICULACOES[:, 0], :] - relativos[..., _ARTICULACOES[:, 1], :]
+    proxima = relativos[..., _ARTICULACOES[:, 2], :] - relativos[..., _ARTICULACOES[:, 1], :]
+    normas = np.linalg.norm(anterior, axis=-1) * np.linalg.norm(proxima, axis=-1)
+    cossenos = np.einsum('...k,...k->...', anterior, proxima) / np.maximum(normas, 1e-6)
+    distancias = np.linalg.norm(relativos[..., _PARES_PONTAS[:, 0], :]
+                                - relativos[..., _PARES_PONTAS[:, 1], :], axis=-1)
+    return np.concatenate([cossenos, distancias], axis=-1)
+
+
+def transformar(frames, tipo='normalizadas'):
+    """Converte frames brutos (..., 126) na representação `tipo`, de uma vez
+    para qualquer número de amostras e passos (lote inteiro no treino, uma
+    janela ou um único frame na inferência).
+
+    Cada frame é tratado sozinho, então o resultado é o mesmo frame a frame
+    (streaming) ou janela a janela. Com duas mãos, a mais à esquerda na imagem
+    espelhada vem primeiro, então a ordem não depende de qual mão o MediaPipe
+    detectou antes. Os 20 pontos de cada mão ficam relativos ao punho e
+    divididos pela distância punho -> base do dedo médio; o punho guarda a
+    posição absoluta, para gestos com movimento (J, Z). Mão ausente continua
+    zerada.
+    """
+    frames = np.asarray(frames, dtype=np.float32)
+    largura_caracteristicas(tipo)
+    if tipo == 'brutas':
+        return frames
+    forma = frames.shape[:-1]
+    pontos = frames.reshape(forma + (MAX_MAOS, LANDMARKS_POR_MAO, 3))
+    presentes = np.any(pontos != 0, axis=(-2, -1))
+
+    trocar = presentes[..., 1] & (pontos[..., 1, PUNHO, 0] < pontos[..., 0, PUNHO, 0])
+    pontos = np.where(trocar[..., None, None, None], pontos[..., ::-1, :, :], pontos)
+
+    punhos = pontos[..., PUNHO, :]
+    relativos = pontos - punhos[..., None, :]
+    escala = np.linalg.norm(relativos[..., BASE_MEDIO, :], axis=-1)
+    relativos /= np.maximum(escala, 1e-6)[..., None, None]
+    relativos *= presentes[..., None, None]
+
+    saida = relativos.copy()
+    saida[..., PUNHO, :] = punhos
+    saida = saida.reshape(forma + (LARGURA,))
+    if tipo == 'normalizadas':
+        return saida
+    extras = _angulos_distancias(relativos) * presentes[..., None]
+    return np.concatenate([saida, extras.reshape(forma + (MAX_MAOS * EXTRAS_POR_MAO,))], axis=-1)
+
+
+def largura_bruta(tipo, largura_modelo):
+    """Largura dos frames que o motor recebe (sempre os 126 valores do extrator,
+    exceto em modelos brutos antigos); falha se os metadados não batem com o modelo"""
+    if tipo == 'brutas':
+        return largura_modelo
+    if largura_modelo != largura_caracteristicas(tipo):
+        raise ValueError(f"Modelo com entrada de {largura_modelo} valores, mas os metadados indicam "
+                         f"'{tipo}' ({largura_caracteristicas(tipo)})")
+    return LARGURA
+
+
+def reamostrar(frames, passos=None, passo=1):
+    """Frames (N, T, largura) que o modelo vê: dos `passos * passo` últimos
+    (sem `passos`, todos os que couberem), um a cada `passo` terminando no
+    mais recente, para a predição não atrasar um frame"""
+    passos = passos or frames.shape[1] // passo
+    return frames[:, frames.shape[1] - passos * passo + passo - 1::passo]
+
+
+class PreparadorEntrada:
+    """Entrada do modelo a partir de frames brutos, conforme os metadados do treino.
+
+    `tamanho_sequencia` e `largura` são o que os chamadores fornecem: os
+    últimos `passos * passo` frames do extrator. A janela é reamostrada (um
+    frame a cada `passo`) e convertida para as `caracteristicas` do modelo.
+    """
+
+    def __init__(self, caminho_modelo, passos_modelo, largura_modelo):
+        meta = carregar_metadados(caminho_modelo)
+        if meta.get('passos', passos_modelo) != passos_modelo:
+            raise ValueError(f"Modelo com entrada de {passos_modelo} frames, mas os metadados indicam "
+                             f"{meta['passos']}")
+        self.caracteristicas = meta['caracteristicas']
+        self.passo = int(meta['passo'])
+        self.passos_modelo = passos_modelo
+        self.tamanho_sequencia = passos_modelo * self.passo
+        self.largura = largura_bruta(self.caracteristicas, largura_modelo)
+
+    def __call__(self, entradas):
+        """(N, tamanho_sequencia, largura) brutos -> (N, passos_modelo, largura do modelo)"""
+        return transformar(reamostrar(np.asarray(entradas), self.passos_modelo, self.passo),
+                           self.caracteristicas)
+
+    def frame(self, vetor):
+        """Um frame (largura,) bruto na representação do modelo (modo streaming)"""
+        return transformar(vetor, self.caracteristicas)
@@ -0,0 +1,84 @@
+import queue
+import threading
+import time
+
+
+class CarregadorRecursos:
+    """Carrega recursos pesados (modelo, detector, câmera) em segundo plano.
+
+    Cada recurso é uma função sem argumentos executada uma única vez, em
+    ordem de chegada, por uma única thread: importar MediaPipe e TensorFlow
+    em threads paralelas pode travar no lock de import. A interface consulta
+    `estado`/`resultado` periodicamente (ex.: `root.after`) em vez de
+    bloquear a thread do Tk. Erros ficam guardados em `erros`.
+    """
+
+    PENDENTE, CARREGANDO, PRONTO, ERRO = 'pendente', 'carregando', 'pronto', 'erro'
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._fila = queue.Queue()
+        self._thread = None
+        self._eventos = {}
+        self.estados = {}
+        self.resultados = {}
+        self.erros = {}
+        self.tempos = {}
+
+    def adicionar(self, nome, funcao):
+        """Agenda o carregamento de `nome` (ignorado se já agendado)"""
+        with self._lock:
+            if nome in self.estados:
+                return
+            self.estados[nome] = self.PENDENTE
+            evento = self._eventos[nome] = threading.Event()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._trabalhar, daemon=True)
+                self._thread.start()
+        self._fila.put((nome, funcao, evento))
+
+    def _trabalhar(self):
+        while True:
+            nome, funcao, evento = self._fila.get()
+            with self._lock:
+                if self._eventos.get(nome) is not evento:
+                    continue  # Descartado antes de começar
+                self.estados[nome] = self.CARREGANDO
+            inicio = time.perf_counter()
+            try:
+                resultado, erro = funcao(), None
+            except Exception as e:
+                resultado, erro = None, e
+            with self._lock:
+                atual = self._eventos.get(nome) is evento
+                if atual:
+                    if erro is None:
+                        self.resultados[nome] = resultado
+                    else:
+                        self.erros[nome] = erro
+                    self.estados[nome] = self.PRONTO if erro is None else self.ERRO
+                    self.tempos[nome] = time.perf_counter() - inicio
+            if not atual and hasattr(resultado, 'release'):
+                resultado.release()  # Câmera aberta para um carregamento descartado
+            evento.set()
+
+    def estado(self, nome):
+        return self.estados.get(nome, self.PENDENTE)
+
+    def concluido(self, nome):
+        """True quando o carregamento terminou (com sucesso ou erro)"""
+        return self.estado(nome) in (self.PRONTO, self.ERRO)
+
+    def resultado(self, nome, padrao=None):
+        return self.resultados.get(nome, padrao)
+
+    def descartar(self, nome):
+        """Esquece um recurso (ex.: câmera liberada) para poder carregá-lo de novo"""
+        with self._lock:
+            for dicionario in (self.estados, self.resultados, self.erros, self.tempos, self._eventos):
+                dicionario.pop(nome, None)
+
+    def aguardar(self, nome, timeout=None):
+        """Bloqueia até `nome` concluir (uso fora da thread do Tk)"""
+        evento = self._eventos.get(nome)
+        return evento.wait(timeout) if evento is not None else False
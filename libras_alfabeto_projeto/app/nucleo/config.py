@@ -0,0 +1,88 @@
+import os
+from pathlib import Path
+
+# Caminhos (relativos à raiz do projeto, como nos demais scripts)
+MODEL_PATH = Path('modelos/modelo_gestos.h5')
+LABEL_PATH = Path('modelos/rotulador_gestos.pkl')
+TFLITE_PATH = Path('modelos/modelo_gestos.tflite')
+CSV_PATH = Path('dados/gestos_libras.csv')  # Formato antigo (ver migrar_csv.py)
+DATASET_PATH = Path('dados/gestos_libras')
+
+# Frames por amostra coletada. A janela da inferência (frames e passo entre
+# eles) vem dos metadados de cada modelo, ver nucleo/metadados.py
+SEQUENCE_LENGTH = 30
+
+# Backend de inferência: 'keras' (model.predict), 'tf_function', 'tflite', 'streaming',
+# 'lote', 'remoto' (servidor de reconhecimento em SERVIDOR_URL) ou 'indice'
+# (vizinhos mais próximos no índice de gestos, ver INDICE_PATH)
+BACKEND_INFERENCIA = os.environ.get('LIA_BACKEND', 'tf_function')
+
+# Variante do modelo TFLite: 'fp32', 'fp16' ou 'int8' (ver exportar_tflite.py)
+VARIANTE_TFLITE = os.environ.get('LIA_TFLITE', 'fp32')
+
+# Streaming: frames entre ressincronizações do estado da LSTM com a janela
+INTERVALO_RESSINCRONIZACAO = int(os.environ.get('LIA_RESSINCRONIZACAO', 30))
+
+# Fonte de quadros: 'camera', 'video', 'imagens' ou 'landmarks' (ver nucleo/fontes.py)
+FONTE = os.environ.get('LIA_FONTE', 'camera')
+FONTE_CAMINHO = os.environ.get('LIA_FONTE_CAMINHO')
+
+# Servidor de reconhecimento em lote (backend 'remoto'; ver app/servidor/)
+SERVIDOR_URL = os.environ.get('LIA_SERVIDOR', 'http://127.0.0.1:8765')
+LOTE_MAXIMO = int(os.environ.get('LIA_LOTE_MAXIMO', 32))
+ESPERA_LOTE_MS = float(os.environ.get('LIA_ESPERA_LOTE_MS', 5))
+
+# Controle adaptativo (ver nucleo/adaptativo.py): reduz a imagem do detector,
+# intercala a detecção e desacelera a interface para manter o FPS e a latência alvo
+ADAPTATIVO = os.environ.get('LIA_ADAPTATIVO', '1') != '0'
+FPS_ALVO = float(os.environ.get('LIA_FPS_ALVO', 20))
+LATENCIA_ALVO_MS = float(os.environ.get('LIA_LATENCIA_ALVO_MS', 150))
+
+# Detecção só na região das mãos do quadro anterior (ver nucleo/roi.py)
+ROI = os.environ.get('LIA_ROI', '0') == '1'
+
+# Desenho das mãos no vídeo: 'leve' (esqueleto simples, nucleo/renderizacao.py)
+# ou 'mediapipe' (estilos padrão do mp_drawing, mais caro)
+DESENHO = os.environ.get('LIA_DESENHO', 'leve')
+
+# Suavização das predições (ver nucleo/suavizacao.py): 'maioria' (votos
+# ponderados pela confiança), 'ema' ou 'histerese'
+SUAVIZACAO = os.environ.get('LIA_SUAVIZACAO', 'maioria')
+JANELA_SUAVIZACAO = int(os.environ.get('LIA_JANELA_SUAVIZACAO', 15))
+ALFA_SUAVIZACAO = float(os.environ.get('LIA_ALFA_SUAVIZACAO', 0.3))
+
+# Aceite rápido do gesto alvo no jogo (ver DecisorAlvo em nucleo/suavizacao.py):
+# janelas parciais a partir de MIN_FRAMES_PARCIAL frames, aceitas quando a
+# probabilidade do alvo e a margem sobre o segundo colocado se mantêm
+DECISAO_ALVO = os.environ.get('LIA_DECISAO_ALVO', '1') != '0'
+MIN_FRAMES_PARCIAL = int(os.environ.get('LIA_MIN_FRAMES_PARCIAL', 10))
+ALVO_CONFIANCA = float(os.environ.get('LIA_ALVO_CONFIANCA', 0.85))
+ALVO_MARGEM = float(os.environ.get('LIA_ALVO_MARGEM', 0.5))
+ALVO_ESTABILIDADE = int(os.environ.get('LIA_ALVO_ESTABILIDADE', 2))
+
+# Máscara de classes (ver nucleo/mascara.py): no jogo, só os gestos do nível
+# concorrem; LIA_CLASSES_EXCLUIDAS (separadas por vírgula) some em todo lugar
+MASCARA_NIVEL = os.environ.get('LIA_MASCARA_NIVEL', '1') != '0'
+CLASSES_EXCLUIDAS = tuple(c.strip() for c in os.environ.get('LIA_CLASSES_EXCLUIDAS', '').split(',') if c.strip())
+
+# Representação de entrada dos modelos treinados daqui em diante (ver
+# nucleo/caracteristicas.py): 'brutas', 'normalizadas' ou 'completas'. Modelos
+# já treinados usam a gravada nos seus metadados (modelos/modelo_gestos.json)
+CARACTERISTICAS = os.environ.get('LIA_CARACTERISTICAS', 'normalizadas')
+
+# Classificador estático por frame (ver nucleo/estatico.py): gestos parados
+# (letras e números) são aceitos em poucos frames sem esperar a janela do
+# modelo de sequência. LIA_GESTOS_DINAMICOS nunca vão para o estático
+ESTATICO_PATH = Path('modelos/classificador_estatico.pkl')
+ESTATICO = os.environ.get('LIA_ESTATICO', '1') != '0'
+ESTATICO_CONFIANCA = float(os.environ.get('LIA_ESTATICO_CONFIANCA', 0.9))
+ESTATICO_ESTABILIDADE = int(os.environ.get('LIA_ESTATICO_ESTABILIDADE', 3))
+GESTOS_DINAMICOS = tuple(g.strip() for g in os.environ.get('LIA_GESTOS_DINAMICOS', 'H,J,K,X,Z,Ç').split(',')
+                         if g.strip())
+
+# Índice de gestos (backend 'indice', ver nucleo/indice.py): reconhece pelos
+# vizinhos mais próximos entre as amostras cadastradas, que podem ser
+# acrescentadas ou removidas sem retreinar (indexar_gestos.py)
+INDICE_PATH = Path('modelos/indice_gestos.npz')
+INDICE_K = int(os.environ.get('LIA_INDICE_K', 5))
+EMBEDDING_INDICE = os.environ.get('LIA_EMBEDDING', 'modelo')  # 'modelo' ou 'landmarks'
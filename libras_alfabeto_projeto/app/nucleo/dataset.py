@@ -0,0 +1,141 @@
+import csv
+import io
+import json
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+from app.nucleo import config
+from app.nucleo.landmarks import LARGURA
+
+
+def padronizar_frames(frames, tamanho_sequencia=config.SEQUENCE_LENGTH):
+    """Garante `tamanho_sequencia` frames com preenchimento/corte"""
+    if len(frames) > tamanho_sequencia:
+        return frames[:tamanho_sequencia]
+    elif len(frames) < tamanho_sequencia:
+        return np.pad(frames, ((0, tamanho_sequencia - len(frames)), (0, 0)),
+                      mode='constant')
+    return frames
+
+
+class ArmazemGestos:
+    """Dataset binário de gestos, apenas com inclusão no final.
+
+    Layout do diretório:
+    - frames.f32: amostras float32 (tamanho_sequencia, largura) contíguas,
+      lidas como np.memmap sem cópia
+    - indice.csv: uma linha `nome,timestamp` por amostra, na mesma ordem
+    - meta.json: forma e dtype das amostras
+
+    Cada inclusão grava primeiro os frames e depois o índice; se o processo
+    cair no meio, a leitura considera apenas as amostras presentes nos dois
+    (uma última linha do índice sem quebra de linha conta como não gravada).
+    """
+
+    def __init__(self, raiz=config.DATASET_PATH, tamanho_sequencia=config.SEQUENCE_LENGTH, largura=LARGURA):
+        self.raiz = Path(raiz)
+        self.caminho_frames = self.raiz / 'frames.f32'
+        self.caminho_indice = self.raiz / 'indice.csv'
+        self.caminho_meta = self.raiz / 'meta.json'
+
+        if self.caminho_meta.exists():
+            meta = json.loads(self.caminho_meta.read_text())
+            self.tamanho_sequencia = meta['tamanho_sequencia']
+            self.largura = meta['largura']
+        else:
+            self.tamanho_sequencia = tamanho_sequencia
+            self.largura = largura
+        self._verificado = False
+
+    @property
+    def forma_amostra(self):
+        return (self.tamanho_sequencia, self.largura)
+
+    def existe(self):
+        return self.caminho_meta.exists()
+
+    def _criar(self):
+        self.raiz.mkdir(parents=True, exist_ok=True)
+        self.caminho_meta.write_text(json.dumps({
+            'tamanho_sequencia': self.tamanho_sequencia,
+            'largura': self.largura,
+            'dtype': 'float32',
+            'versao': 1,
+        }, indent=2))
+
+    def _preparar(self, frames):
+        janela = padronizar_frames(np.asarray(frames, dtype=np.float32), self.tamanho_sequencia)
+        if janela.shape != self.forma_amostra:
+            raise ValueError(f"Amostra com forma {janela.shape}, esperado {self.forma_amostra}")
+        return np.ascontiguousarray(janela)
+
+    def adicionar(self, nome, frames, timestamp=None):
+        """Acrescenta uma amostra (frames são padronizados para a forma do dataset)"""
+        self.adicionar_lote([nome], [frames], None if timestamp is None else [timestamp])
+
+    def adicionar_lote(self, nomes, janelas, timestamps=None):
+        """Acrescenta várias amostras com uma única escrita em cada arquivo"""
+        if not self.existe():
+            self._criar()
+        elif not self._verificado:
+            self._reparar()
+        if timestamps is None:
+            timestamps = [datetime.now().strftime('%Y-%m-%d %H:%M:%S')] * len(nomes)
+        dados = b''.join(self._preparar(janela).tobytes() for janela in janelas)
+
+        with open(self.caminho_frames, 'ab') as f:
+            f.write(dados)
+        with open(self.caminho_indice, 'a', newline='', encoding='utf-8') as f:
+            csv.writer(f).writerows(zip(nomes, timestamps))
+
+    def _reparar(self):
+        """Descarta a linha incompleta no fim do índice e os frames gravados
+        sem linha no índice (escrita interrompida)"""
+        self._verificado = True
+        if self.caminho_indice.exists():
+            with open(self.caminho_indice, 'r+b') as f:
+                conteudo = f.read()
+                if conteudo and not conteudo.endswith(b'\n'):
+                    f.truncate(conteudo.rfind(b'\n') + 1)
+        if not self.caminho_frames.exists():
+            return
+        esperado = len(self._ler_indice()[0]) * self.tamanho_sequencia * self.largura * 4
+        if self.caminho_frames.stat().st_size > esperado:
+            with open(self.caminho_frames, 'r+b') as f:
+                f.truncate(esperado)
+
+    def _ler_indice(self):
+        if not self.caminho_indice.exists():
+            return [], []
+        with open(self.caminho_indice, newline='', encoding='utf-8') as f:
+            conteudo = f.read()
+        if not conteudo.endswith('\n'):  # Última linha interrompida no meio da escrita
+            conteudo = conteudo[:conteudo.rfind('\n') + 1]
+        linhas = list(csv.reader(io.StringIO(conteudo)))
+        return [linha[0] for linha in linhas], [linha[1] for linha in linhas]
+
+    def _amostras_gravadas(self):
+        if not self.caminho_frames.exists():
+            return 0
+        bytes_amostra = self.tamanho_sequencia * self.largura * 4
+        return self.caminho_frames.stat().st_size // bytes_amostra
+
+    def __len__(self):
+        return min(self._amostras_gravadas(), len(self._ler_indice()[0]))
+
+    def frames(self, n=None):
+        """Todas as amostras como memmap somente leitura (N, tamanho_sequencia, largura)"""
+        n = len(self) if n is None else n
+        if n == 0:
+            return np.zeros((0,) + self.forma_amostra, dtype=np.float32)
+        return np.memmap(self.caminho_frames, dtype=np.float32, mode='r',
+                         shape=(n,) + self.forma_amostra)
+
+    def carregar(self):
+        """Retorna (frames memmap, nomes, timestamps) com o mesmo número de amostras"""
+        nomes, timestamps = self._ler_indice()
+        n = min(self._amostras_gravadas(), len(nomes))
+        frames = self.frames(n)
+        return frames, np.array(nomes[:n]), np.array(timestamps[:n])
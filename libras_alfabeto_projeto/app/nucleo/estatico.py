@@ -0,0 +1,95 @@
+import joblib
+import numpy as np
+
+from app.nucleo import config
+from app.nucleo.caracteristicas import transformar
+from app.nucleo.suavizacao import nome_sem_mao
+
+_ATIVACOES = {
+    'relu': lambda x: np.maximum(x, 0, out=x),
+    'tanh': np.tanh,
+    'logistic': lambda x: 1 / (1 + np.exp(-x)),
+    'identity': lambda x: x,
+}
+
+
+class ClassificadorEstatico:
+    """Classificador de um único frame para gestos parados (ver treinar_estatico.py).
+
+    Uma MLP pequena sobre as características do frame, calculada em NumPy
+    (sem a validação do predict_proba do scikit-learn) na própria thread de
+    landmarks. `prever(vetor)` devolve probabilidades na ordem das `classes`
+    do rotulador, como os motores de sequência, com zero para as classes que
+    o classificador não conhece. Só os gestos de `estaticos` (escolhidos no
+    treino pela acurácia por frame) devem ser aceitos a partir dele; os
+    demais continuam com o modelo de sequência.
+    """
+
+    def __init__(self, caminho=config.ESTATICO_PATH, classes=None):
+        dados = joblib.load(caminho)
+        modelo = dados['modelo']
+        self.caracteristicas = dados['caracteristicas']
+        self.estaticos = set(dados['estaticos'])
+        self._media = np.asarray(dados['media'], dtype=np.float32)
+        self._escala = np.asarray(dados['escala'], dtype=np.float32)
+        self._pesos = [np.asarray(w, dtype=np.float32) for w in modelo.coefs_]
+        self._vieses = [np.asarray(b, dtype=np.float32) for b in modelo.intercepts_]
+        self._ativacao = _ATIVACOES[modelo.activation]
+
+        classes_modelo = [str(c) for c in dados['classes']]
+        self.classes = classes_modelo if classes is None else [str(c) for c in classes]
+        indice = {c: i for i, c in enumerate(classes_modelo)}
+        # Coluna de cada classe do rotulador na saída do classificador (-1: ausente)
+        self._colunas = np.array([indice.get(c, -1) for c in self.classes])
+        self._conhecidas = self._colunas >= 0
+
+    def eh_estatico(self, gesto):
+        return nome_sem_mao(str(gesto)) in self.estaticos
+
+    def prever(self, vetor):
+        """Um frame (126,) bruto -> probabilidades (C,) na ordem das classes"""
+        x = (transformar(vetor, self.caracteristicas).reshape(1, -1) - self._media) / self._escala
+        for pesos, vies in zip(self._pesos[:-1], self._vieses[:-1]):
+            x = self._ativacao(x @ pesos + vies)
+        saida = (x @ self._pesos[-1] + self._vieses[-1])[0]
+        if len(saida) == 1:  # Duas classes: o scikit-learn usa uma saída logística
+            p = 1 / (1 + np.exp(-saida[0]))
+            probs = np.array([1 - p, p], dtype=np.float32)
+        else:
+            probs = np.exp(saida - saida.max())
+            probs /= probs.sum()
+        return np.where(self._conhecidas, probs[self._colunas], 0.0).astype(np.float32)
+
+
+class AceiteEstatico:
+    """Aceite sem alvo (reconhecer_gestos.py): o gesto estático mais provável
+    é aceito quando passa de `confianca` em `estabilidade` frames seguidos"""
+
+    def __init__(self, classificador, confianca=config.ESTATICO_CONFIANCA,
+                 estabilidade=config.ESTATICO_ESTABILIDADE):
+        self.classificador = classificador
+        self.confianca = confianca
+        self.estabilidade = estabilidade
+        self.limpar()
+
+    def limpar(self):
+        self._gesto = None
+        self._seguidas = 0
+
+    def atualizar(self, preds):
+        """Gesto aceito neste frame, ou None"""
+        classe = int(np.argmax(preds))
+        gesto = self.classificador.classes[classe]
+        if preds[classe] < self.confianca or not self.classificador.eh_estatico(gesto):
+            self.limpar()
+            return None
+        self._seguidas = self._seguidas + 1 if gesto == self._gesto else 1
+        self._gesto = gesto
+        return gesto if self._seguidas >= self.estabilidade else None
+
+
+def carregar_estatico(classes, caminho=config.ESTATICO_PATH):
+    """Classificador estático se ligado (LIA_ESTATICO) e treinado, senão None"""
+    if not config.ESTATICO or not caminho.exists():
+        return None
+    return ClassificadorEstatico(caminho, classes)
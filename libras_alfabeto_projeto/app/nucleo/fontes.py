@@ -0,0 +1,226 @@
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import cv2
+import numpy as np
+
+from app.nucleo import config
+from app.nucleo.landmarks import LANDMARKS_POR_MAO, MAX_MAOS
+
+TIPOS_FONTE = ('camera', 'video', 'imagens', 'landmarks')
+EXTENSOES_IMAGEM = {'.jpg', '.jpeg', '.png', '.bmp'}
+TAMANHO_QUADRO_VAZIO = (480, 640, 3)
+
+
+class FonteCamera:
+    """Câmera ao vivo com a mesma interface das fontes gravadas"""
+
+    offline = False
+    deterministico = False
+    resultado = None
+
+    def __init__(self, indice=0, api=None):
+        self.cap = cv2.VideoCapture(indice) if api is None else cv2.VideoCapture(indice, api)
+
+    def read(self):
+        return self.cap.read()
+
+    def isOpened(self):
+        return self.cap.isOpened()
+
+    def set(self, propriedade, valor):
+        return self.cap.set(propriedade, valor)
+
+    def get(self, propriedade):
+        return self.cap.get(propriedade)
+
+    def release(self):
+        self.cap.release()
+
+
+class FonteGravada:
+    """Base das fontes offline: entrega quadros no ritmo `fps` ou, com `rapido`,
+    o mais rápido possível.
+
+    No modo rápido nenhum quadro pode ser descartado (`deterministico`): o
+    pipeline passa a bloquear em vez de descartar, então duas execuções sobre
+    a mesma gravação veem exatamente os mesmos quadros.
+    """
+
+    offline = True
+    resultado = None
+
+    def __init__(self, fps=30, rapido=False):
+        self.fps = fps
+        self.rapido = rapido
+        self.deterministico = rapido
+        self.quadros_lidos = 0
+        self._aberta = True
+        self._proximo = None
+
+    def _ler(self):
+        """Próximo quadro BGR, ou None no fim da gravação"""
+        raise NotImplementedError
+
+    def read(self):
+        if not self._aberta:
+            return False, None
+        frame = self._ler()
+        if frame is None:
+            self._aberta = False
+            return False, None
+        if not self.rapido:
+            agora = time.perf_counter()
+            if self._proximo is None:
+                self._proximo = agora
+            elif self._proximo > agora:
+                time.sleep(self._proximo - agora)
+            self._proximo += 1 / self.fps
+        self.quadros_lidos += 1
+        return True, frame
+
+    def isOpened(self):
+        return self._aberta
+
+    def set(self, propriedade, valor):
+        return False  # Resolução/FPS vêm da gravação
+
+    def get(self, propriedade):
+        return self.fps if propriedade == cv2.CAP_PROP_FPS else 0
+
+    def release(self):
+        self._aberta = False
+
+
+class FonteVideo(FonteGravada):
+    """Arquivo de vídeo lido quadro a quadro (FPS do próprio arquivo)"""
+
+    def __init__(self, caminho, rapido=False, fps=None):
+        self.cap = cv2.VideoCapture(str(caminho))
+        if not self.cap.isOpened():
+            raise FileNotFoundError(f"Não foi possível abrir o vídeo {caminho}")
+        super().__init__(fps or self.cap.get(cv2.CAP_PROP_FPS) or 30, rapido)
+
+    def _ler(self):
+        ret, frame = self.cap.read()
+        return frame if ret else None
+
+    def release(self):
+        super().release()
+        self.cap.release()
+
+
+class FonteImagens(FonteGravada):
+    """Pasta de imagens tocada em ordem alfabética"""
+
+    def __init__(self, caminho, rapido=False, fps=None):
+        self.arquivos = sorted(p for p in Path(caminho).iterdir()
+                               if p.suffix.lower() in EXTENSOES_IMAGEM)
+        if not self.arquivos:
+            raise FileNotFoundError(f"Nenhuma imagem encontrada em {caminho}")
+        super().__init__(fps or 30, rapido)
+        self._indice = 0
+
+    def _ler(self):
+        while self._indice < len(self.arquivos):
+            frame = cv2.imread(str(self.arquivos[self._indice]))
+            self._indice += 1
+            if frame is not None:
+                return frame
+        return None
+
+
+class FonteLandmarks(FonteGravada):
+    """Sequências de landmarks já extraídas, tocadas frame a frame.
+
+    Aceita o dataset binário (pasta do ArmazemGestos) ou um .npy com shape
+    (..., 126). Cada `read` entrega um quadro preto e deixa em `resultado` o
+    equivalente ao `hands.process` daquele frame, então a detecção do
+    MediaPipe é pulada e os mesmos landmarks chegam ao modelo.
+    """
+
+    def __init__(self, caminho, rapido=False, fps=None):
+        caminho = Path(caminho)
+        if caminho.is_dir():
+            from app.nucleo.dataset import ArmazemGestos
+            armazem = ArmazemGestos(caminho)
+            if not armazem.existe():
+                raise FileNotFoundError(f"Dataset não encontrado em {caminho}")
+            sequencias = armazem.frames()
+        else:
+            sequencias = np.load(caminho, mmap_mode='r')
+        self.vetores = sequencias.reshape(-1, sequencias.shape[-1])
+        super().__init__(fps or 30, rapido)
+        self._indice = 0
+        self._quadro = np.zeros(TAMANHO_QUADRO_VAZIO, dtype=np.uint8)
+        self._criar_mao = _fabrica_maos()
+
+    def _ler(self):
+        if self._indice >= len(self.vetores):
+            return None
+        vetor = np.asarray(self.vetores[self._indice], dtype=np.float32)
+        self._indice += 1
+        self.resultado = self._resultado(vetor)
+        return self._quadro.copy()
+
+    def _resultado(self, vetor):
+        maos = []
+        for pontos in vetor.reshape(MAX_MAOS, LANDMARKS_POR_MAO, 3):
+            if pontos.any():  # Mão ausente foi gravada como zeros
+                maos.append(self._criar_mao(pontos))
+        return SimpleNamespace(multi_hand_landmarks=maos or None)
+
+
+def _fabrica_maos():
+    """Cria mãos no protobuf do MediaPipe (necessário para desenhar) quando disponível"""
+    try:
+        from mediapipe.framework.formats import landmark_pb2
+    except ImportError:
+        return lambda pontos: SimpleNamespace(
+            landmark=[SimpleNamespace(x=x, y=y, z=z) for x, y, z in pontos.tolist()])
+
+    def criar(pontos):
+        mao = landmark_pb2.NormalizedLandmarkList()
+        for x, y, z in pontos.tolist():
+            ponto = mao.landmark.add()
+            ponto.x, ponto.y, ponto.z = x, y, z
+        return mao
+    return criar
+
+
+FONTES = {
+    'video': FonteVideo,
+    'imagens': FonteImagens,
+    'landmarks': FonteLandmarks,
+}
+
+
+def criar_fonte(tipo=None, caminho=None, rapido=False, fps=None, indice_camera=0, api_camera=None):
+    """Abre a fonte de quadros escolhida (padrão: config.FONTE / LIA_FONTE)"""
+    tipo = tipo or config.FONTE
+    caminho = caminho or config.FONTE_CAMINHO
+    if tipo == 'camera':
+        return FonteCamera(indice_camera, api_camera)
+    if tipo not in FONTES:
+        raise ValueError(f"Fonte desconhecida: {tipo} (opções: {', '.join(TIPOS_FONTE)})")
+    if not caminho:
+        raise ValueError(f"A fonte '{tipo}' precisa de --caminho")
+    return FONTES[tipo](caminho, rapido=rapido, fps=fps)
+
+
+def adicionar_argumentos_fonte(parser):
+    """Flags comuns de fonte de quadros para os scripts de entrada"""
+    parser.add_argument('--fonte', choices=TIPOS_FONTE, default=config.FONTE,
+                        help="Origem dos quadros (padrão: câmera ou LIA_FONTE)")
+    parser.add_argument('--caminho', default=config.FONTE_CAMINHO,
+                        help="Vídeo, pasta de imagens ou landmarks gravados (.npy ou dataset)")
+    parser.add_argument('--rapido', action='store_true',
+                        help="Fontes gravadas: processa o mais rápido possível, sem descartar quadros")
+    parser.add_argument('--fps', type=float, default=None,
+                        help="Ritmo das fontes gravadas (padrão: FPS do vídeo ou 30)")
+    return parser
+
+
+def fonte_dos_argumentos(args, **kwargs):
+    return criar_fonte(args.fonte, args.caminho, args.rapido, args.fps, **kwargs)
@@ -0,0 +1,126 @@
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+
+from PIL import Image
+
+EXTENSOES_IMAGEM = ('.png', '.jpg', '.jpeg')
+
+
+def normalizar_nome(nome, sem_acentos=False):
+    """Chave de busca: maiúsculas, Unicode NFC (nomes de arquivo do macOS vêm em NFD)"""
+    nome = unicodedata.normalize('NFC', nome.strip().upper())
+    if sem_acentos:
+        nome = ''.join(c for c in unicodedata.normalize('NFD', nome) if unicodedata.category(c) != 'Mn')
+    return nome
+
+
+class GerenciadorImagens:
+    """Imagens de referência dos gestos, prontas para exibir.
+
+    A pasta é indexada uma vez (gesto -> arquivo, sem diferenciar maiúsculas
+    nem acentos). `pre_carregar` decodifica e reduz as imagens em segundo
+    plano; a `PhotoImage` é criada na thread do Tk no primeiro `obter` e fica
+    num cache LRU de até `capacidade` gestos. `estatisticas` informa acertos e
+    o tempo de cada `obter`.
+    """
+
+    def __init__(self, pasta, tamanho=(200, 200), capacidade=32):
+        self.pasta = Path(pasta)
+        self.tamanho = tamanho
+        self.capacidade = capacidade
+        self._lock = threading.Lock()
+        self._cache = OrderedDict()  # chave -> [imagem PIL reduzida, PhotoImage ou None]
+        self._indice = {}
+        self._indice_sem_acentos = {}
+        if self.pasta.is_dir():
+            for caminho in sorted(self.pasta.iterdir()):
+                if caminho.suffix.lower() in EXTENSOES_IMAGEM:
+                    self._indice.setdefault(normalizar_nome(caminho.stem), caminho)
+                    self._indice_sem_acentos.setdefault(normalizar_nome(caminho.stem, True), caminho)
+        self.acertos = 0          # PhotoImage já pronta
+        self.pre_carregadas = 0   # Decodificada em segundo plano, só faltou a PhotoImage
+        self.faltas = 0           # Lida do disco na thread do Tk
+        self.tempos_obter = []
+
+    def resolver(self, gesto):
+        """Arquivo da imagem do gesto, ou None"""
+        return (self._indice.get(normalizar_nome(gesto))
+                or self._indice_sem_acentos.get(normalizar_nome(gesto, True)))
+
+    def _decodificar(self, caminho):
+        with Image.open(caminho) as img:
+            img.load()
+            return img.resize(self.tamanho, Image.LANCZOS)
+
+    def _guardar(self, chave, entrada):
+        """Insere no LRU (com o lock) descartando os menos usados"""
+        self._cache[chave] = entrada
+        self._cache.move_to_end(chave)
+        while len(self._cache) > self.capacidade:
+            self._cache.popitem(last=False)
+
+    def pre_carregar(self, gestos):
+        """Decodifica e reduz as imagens dos gestos (pode rodar fora da thread do Tk)"""
+        carregadas = 0
+        for gesto in gestos:
+            caminho = self.resolver(gesto)
+            if caminho is None:
+                continue
+            chave = str(caminho)
+            with self._lock:
+                if chave in self._cache:
+                    continue
+            imagem = self._decodificar(caminho)
+            with self._lock:
+                if chave not in self._cache:
+                    self._guardar(chave, [imagem, None])
+                    carregadas += 1
+        return carregadas
+
+    def obter(self, gesto):
+        """PhotoImage do gesto (thread do Tk), ou None se não houver imagem"""
+        inicio = time.perf_counter()
+        caminho = self.resolver(gesto)
+        if caminho is None:
+            return None
+        chave = str(caminho)
+        with self._lock:
+            entrada = self._cache.get(chave)
+            if entrada is not None:
+                self._cache.move_to_end(chave)
+        if entrada is None:
+            self.faltas += 1
+            entrada = [self._decodificar(caminho), None]
+        elif entrada[1] is None:
+            self.pre_carregadas += 1
+        else:
+            self.acertos += 1
+        if entrada[1] is None:
+            from PIL import ImageTk
+            entrada[1] = ImageTk.PhotoImage(entrada[0])
+            with self._lock:
+                self._guardar(chave, entrada)
+        self.tempos_obter.append(time.perf_counter() - inicio)
+        return entrada[1]
+
+    def estatisticas(self):
+        total = self.acertos + self.pre_carregadas + self.faltas
+        return {
+            'pedidos': total,
+            'taxa_acerto': (self.acertos + self.pre_carregadas) / total if total else 0.0,
+            'acertos': self.acertos,
+            'pre_carregadas': self.pre_carregadas,
+            'faltas': self.faltas,
+            'obter_medio_ms': sum(self.tempos_obter) / total * 1000 if total else 0.0,
+            'obter_max_ms': max(self.tempos_obter) * 1000 if total else 0.0,
+            'em_cache': len(self._cache),
+        }
+
+    def formatar(self):
+        e = self.estatisticas()
+        return (f"imagens: {e['pedidos']} pedidos, {e['taxa_acerto']:.0%} em cache "
+                f"({e['acertos']} prontas, {e['pre_carregadas']} pré-carregadas, {e['faltas']} do disco) | "
+                f"obter {e['obter_medio_ms']:.1f}ms médio, {e['obter_max_ms']:.1f}ms máx")
@@ -0,0 +1,259 @@
+from pathlib import Path
+
+import numpy as np
+
+from app.nucleo import config
+from app.nucleo.caracteristicas import BASE_MEDIO, PUNHO, PreparadorEntrada, transformar
+from app.nucleo.landmarks import LANDMARKS_POR_MAO, LARGURA, MAX_MAOS
+
+# Origem dos vetores do índice: penúltima camada do modelo treinado ou a
+# própria sequência de landmarks normalizados (sem modelo)
+EMBEDDINGS = ('modelo', 'landmarks')
+TEMPERATURA = 0.05  # Peso de cada vizinho: exp((similaridade - melhor) / TEMPERATURA)
+MAX_AMOSTRAS_PCA = 5000
+
+
+def normalizar_linhas(x):
+    """Cada linha com norma 1: produto escalar = similaridade do cosseno"""
+    x = np.asarray(x, dtype=np.float32)
+    return x / np.maximum(np.linalg.norm(x, axis=-1, keepdims=True), 1e-6)
+
+
+class EmbeddingModelo:
+    """Saída da penúltima camada do modelo treinado (antes do softmax), numa
+    `tf.function` com lote variável como o MotorLote. Depende do modelo: ao
+    retreinar, o índice precisa ser reconstruído."""
+
+    nome = 'modelo'
+
+    def __init__(self, caminho_modelo=config.MODEL_PATH):
+        import tensorflow as tf
+        modelo = tf.keras.models.load_model(caminho_modelo, compile=False)
+        _, passos_modelo, largura_modelo = modelo.input_shape
+        self.preparar = PreparadorEntrada(caminho_modelo, passos_modelo, largura_modelo)
+        self.tamanho_sequencia, self.largura = self.preparar.tamanho_sequencia, self.preparar.largura
+        penultima = tf.keras.Model(modelo.inputs, modelo.layers[-2].output)
+        self.dimensao = int(penultima.output_shape[-1])
+        assinatura = tf.TensorSpec((None, passos_modelo, largura_modelo), tf.float32)
+        self._chamar = tf.function(lambda x: penultima(x, training=False), input_signature=[assinatura])
+
+    def estado(self):
+        return {}
+
+    def __call__(self, janelas):
+        """(N, tamanho_sequencia, 126) brutos -> (N, dimensao) com norma 1"""
+        return normalizar_linhas(self._chamar(self.preparar(janelas)).numpy())
+
+
+class EmbeddingLandmarks:
+    """Sequência de landmarks sem modelo: `passos` frames espaçados na janela,
+    mãos normalizadas (ver caracteristicas.transformar) e o punho relativo à
+    sua posição média, na escala da palma. Uma PCA ajustada na construção do
+    índice (`ajustar`) reduz o vetor a `dimensao` valores."""
+
+    nome = 'landmarks'
+
+    def __init__(self, passos=10, dimensao=64, tamanho_sequencia=config.SEQUENCE_LENGTH, media=None, projecao=None):
+        self.passos = int(passos)
+        self.tamanho_sequencia = int(tamanho_sequencia)
+        self.largura = LARGURA
+        self._frames = np.linspace(0, self.tamanho_sequencia - 1, self.passos).round().astype(np.int64)
+        self.media = None if media is None else np.asarray(media, dtype=np.float32)
+        self.projecao = None if projecao is None else np.asarray(projecao, dtype=np.float32)
+        self.dimensao = int(dimensao) if projecao is None else self.projecao.shape[1]
+
+    def estado(self):
+        return {'passos': self.passos, 'tamanho_sequencia': self.tamanho_sequencia,
+                'media': self.media, 'projecao': self.projecao}
+
+    def _vetores(self, janelas):
+        brutos = np.asarray(janelas, dtype=np.float32)[:, self._frames]
+        n = len(brutos)
+        pontos = transformar(brutos, 'normalizadas').reshape(n, self.passos, MAX_MAOS, LANDMARKS_POR_MAO, 3)
+        presentes = np.any(pontos[..., 1:, :] != 0, axis=(-2, -1))
+        # Trajetória do punho em unidades de palma: J e Z diferem de I e D só por ela
+        maos = brutos.reshape(n, self.passos, MAX_MAOS, LANDMARKS_POR_MAO, 3)
+        palma = np.linalg.norm(maos[..., BASE_MEDIO, :] - maos[..., PUNHO, :], axis=-1)
+        contagem = np.maximum(presentes.sum(axis=(1, 2)), 1)
+        escala = np.maximum((palma * presentes).sum(axis=(1, 2)) / contagem, 1e-6)
+        punhos = pontos[..., PUNHO, :]
+        media = (punhos * presentes[..., None]).sum(axis=1, keepdims=True) / \
+            np.maximum(presentes.sum(axis=1, keepdims=True), 1)[..., None]
+        pontos[..., PUNHO, :] = (punhos - media) / escala[:, None, None, None] * presentes[..., None]
+        return pontos.reshape(n, -1)
+
+    def ajustar(self, janelas, semente=0):
+        """PCA sobre (até MAX_AMOSTRAS_PCA) amostras da construção do índice"""
+        janelas = np.asarray(janelas)
+        if len(janelas) > MAX_AMOSTRAS_PCA:
+            janelas = janelas[np.sort(np.random.default_rng(semente).choice(len(janelas), MAX_AMOSTRAS_PCA,
+                                                                            replace=False))]
+        x = self._vetores(janelas)
+        self.media = x.mean(axis=0)
+        _, _, componentes = np.linalg.svd(x - self.media, full_matrices=False)
+        self.projecao = np.ascontiguousarray(componentes[:self.dimensao].T, dtype=np.float32)
+        self.dimensao = self.projecao.shape[1]
+
+    def __call__(self, janelas):
+        if self.projecao is None:
+            raise ValueError("Embedding de landmarks sem PCA: chame ajustar() na construção do índice")
+        return normalizar_linhas((self._vetores(janelas) - self.media) @ self.projecao)
+
+
+def criar_embedding(nome, caminho_modelo=config.MODEL_PATH, **estado):
+    if nome == EmbeddingModelo.nome:
+        return EmbeddingModelo(caminho_modelo)
+    if nome == EmbeddingLandmarks.nome:
+        return EmbeddingLandmarks(**estado)
+    raise ValueError(f"Embedding desconhecido: {nome} (opções: {', '.join(EMBEDDINGS)})")
+
+
+def embutir(embedding, frames, lote=512):
+    """Vetores (N, dimensao) de todas as amostras, lendo o memmap lote a lote"""
+    partes = [embedding(np.asarray(frames[i:i + lote])) for i in range(0, len(frames), lote)]
+    return np.concatenate(partes) if partes else np.zeros((0, embedding.dimensao), dtype=np.float32)
+
+
+class IndiceGestos:
+    """Amostras de gestos como vetores de norma 1 para busca do vizinho mais próximo.
+
+    Os vetores ficam numa matriz float32 pré-alocada (dobra quando enche), então
+    cadastrar amostras não copia o índice inteiro; remover um gesto compacta a
+    matriz com uma máscara. A busca é uma multiplicação de matrizes contra
+    todas as amostras seguida de `argpartition`, sem estrutura aproximada: o
+    resultado é exato e o custo cresce linearmente com o número de amostras.
+    """
+
+    def __init__(self, dimensao, capacidade=1024):
+        self.dimensao = dimensao
+        self._vetores = np.zeros((capacidade, dimensao), dtype=np.float32)
+        self._rotulos = np.zeros(capacidade, dtype=np.int32)
+        self.n = 0
+        self.classes = []
+
+    def __len__(self):
+        return self.n
+
+    @property
+    def vetores(self):
+        return self._vetores[:self.n]
+
+    @property
+    def rotulos(self):
+        return self._rotulos[:self.n]
+
+    def contagens(self):
+        """Amostras por gesto"""
+        return dict(zip(self.classes, np.bincount(self.rotulos, minlength=len(self.classes)).tolist()))
+
+    def _reservar(self, extra):
+        if self.n + extra <= len(self._vetores):
+            return
+        capacidade = max(2 * len(self._vetores), self.n + extra)
+        vetores = np.zeros((capacidade, self.dimensao), dtype=np.float32)
+        rotulos = np.zeros(capacidade, dtype=np.int32)
+        vetores[:self.n], rotulos[:self.n] = self.vetores, self.rotulos
+        self._vetores, self._rotulos = vetores, rotulos
+
+    def adicionar(self, nome, vetores):
+        """Acrescenta amostras (N, dimensao) do gesto `nome`, novo ou já cadastrado"""
+        vetores = normalizar_linhas(np.reshape(vetores, (-1, self.dimensao)))
+        if nome not in self.classes:
+            self.classes.append(nome)
+        self._reservar(len(vetores))
+        fim = self.n + len(vetores)
+        self._vetores[self.n:fim] = vetores
+        self._rotulos[self.n:fim] = self.classes.index(nome)
+        self.n = fim
+
+    def remover(self, nome):
+        """Tira todas as amostras do gesto; retorna quantas saíram"""
+        if nome not in self.classes:
+            return 0
+        classe = self.classes.index(nome)
+        manter = self.rotulos != classe
+        restantes = int(manter.sum())
+        rotulos = self.rotulos[manter]
+        self._vetores[:restantes] = self.vetores[manter]
+        self._rotulos[:restantes] = rotulos - (rotulos > classe)
+        removidas = self.n - restantes
+        self.n = restantes
+        del self.classes[classe]
+        return removidas
+
+    def buscar(self, consultas, k=config.INDICE_K):
+        """Consultas (B, dimensao) de norma 1 -> (similaridades (B, k), posições (B, k)),
+        da mais parecida para a menos"""
+        if not self.n:
+            raise ValueError("Índice de gestos vazio")
+        similaridades = np.asarray(consultas, dtype=np.float32).reshape(-1, self.dimensao) @ self.vetores.T
+        k = min(k, self.n)
+        if k < self.n:
+            posicoes = np.argpartition(similaridades, self.n - k, axis=1)[:, self.n - k:]
+        else:
+            posicoes = np.broadcast_to(np.arange(self.n), similaridades.shape)
+        melhores = np.take_along_axis(similaridades, posicoes, axis=1)
+        ordem = np.argsort(-melhores, axis=1)
+        return np.take_along_axis(melhores, ordem, axis=1), np.take_along_axis(posicoes, ordem, axis=1)
+
+    def probabilidades(self, consultas, k=config.INDICE_K, temperatura=TEMPERATURA):
+        """Voto dos `k` vizinhos mais próximos, cada um com peso pela similaridade:
+        (B, classes) somando 1, na ordem de `classes`"""
+        similaridades, posicoes = self.buscar(consultas, k)
+        pesos = np.exp((similaridades - similaridades[:, :1]) / temperatura)
+        probs = np.zeros((len(pesos), len(self.classes)), dtype=np.float32)
+        np.add.at(probs, (np.arange(len(pesos))[:, None], self.rotulos[posicoes]), pesos)
+        return probs / probs.sum(axis=1, keepdims=True)
+
+    def salvar(self, caminho, embedding):
+        """Vetores, rótulos, classes e o estado do embedding em um único .npz"""
+        estado = {f'embedding_{chave}': valor for chave, valor in embedding.estado().items() if valor is not None}
+        with open(caminho, 'wb') as f:  # np.savez acrescentaria .npz a outros nomes
+            np.savez(f, vetores=self.vetores, rotulos=self.rotulos, classes=np.array(self.classes, dtype=str),
+                     embedding=np.array(embedding.nome), **estado)
+
+    @classmethod
+    def carregar(cls, caminho, caminho_modelo=config.MODEL_PATH):
+        """Retorna (índice, embedding com que os vetores foram gerados)"""
+        with np.load(caminho, allow_pickle=False) as dados:
+            estado = {chave[len('embedding_'):]: dados[chave].item() if dados[chave].ndim == 0 else dados[chave]
+                      for chave in dados.files if chave.startswith('embedding_')}
+            embedding = criar_embedding(str(dados['embedding']), caminho_modelo, **estado)
+            vetores, rotulos, classes = dados['vetores'], dados['rotulos'], [str(c) for c in dados['classes']]
+        if vetores.shape[1] != embedding.dimensao:
+            raise ValueError(f"Índice com vetores de {vetores.shape[1]} valores, mas o embedding gera "
+                             f"{embedding.dimensao}: reconstrua com indexar_gestos.py --construir")
+        indice = cls(embedding.dimensao, capacidade=max(len(vetores), 1024))
+        indice._vetores[:len(vetores)], indice._rotulos[:len(rotulos)] = vetores, rotulos
+        indice.n, indice.classes = len(vetores), classes
+        return indice, embedding
+
+
+class MotorIndice:
+    """Reconhecimento pelos vizinhos mais próximos no índice de gestos.
+
+    As probabilidades são sobre as classes do índice (`classes`), que pode ter
+    gestos cadastrados ou removidos depois do treino (indexar_gestos.py) sem
+    retreinar o modelo. Com o embedding 'landmarks' o modelo .h5 nem é lido.
+    """
+
+    nome = 'indice'
+
+    def __init__(self, caminho_modelo=config.MODEL_PATH, caminho_indice=config.INDICE_PATH, k=config.INDICE_K):
+        if not Path(caminho_indice).exists():
+            raise FileNotFoundError(f"{caminho_indice} não encontrado: gere com "
+                                    f"app/treinamento/indexar_gestos.py --construir")
+        self.indice, self.embedding = IndiceGestos.carregar(caminho_indice, caminho_modelo)
+        self.tamanho_sequencia, self.largura = self.embedding.tamanho_sequencia, self.embedding.largura
+        self.k = k
+
+    @property
+    def classes(self):
+        return self.indice.classes
+
+    def prever_lote(self, entradas):
+        """(N, tamanho_sequencia, 126) -> probabilidades (N, classes do índice)"""
+        return self.indice.probabilidades(self.embedding(entradas), self.k)
+
+    def prever(self, entrada):
+        return self.prever_lote(entrada)[0]
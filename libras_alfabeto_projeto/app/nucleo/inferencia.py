@@ -0,0 +1,214 @@
+from pathlib import Path
+
+import numpy as np
+
+from app.nucleo import config
+from app.nucleo.caracteristicas import PreparadorEntrada
+from app.nucleo.indice import MotorIndice
+from app.nucleo.remoto import MotorRemoto
+from app.nucleo.streaming import MotorStreaming
+
+
+class MotorKeras:
+    """Referência: `model.predict` a cada chamada (monta pipeline tf.data sempre).
+
+    Como nos demais motores, a entrada são os últimos `tamanho_sequencia`
+    frames brutos do extrator (`largura` valores); a reamostragem no tempo e
+    a representação que o modelo espera (ver PreparadorEntrada em
+    nucleo/caracteristicas.py) vêm dos metadados salvos no treino.
+    """
+
+    nome = 'keras'
+
+    def __init__(self, caminho_modelo=config.MODEL_PATH):
+        from tensorflow.keras.models import load_model
+        self.modelo = load_model(caminho_modelo, compile=False)
+        _, passos_modelo, largura_modelo = self.modelo.input_shape
+        self.preparar = PreparadorEntrada(caminho_modelo, passos_modelo, largura_modelo)
+        self.tamanho_sequencia, self.largura = self.preparar.tamanho_sequencia, self.preparar.largura
+
+    def prever(self, entrada):
+        return self.modelo.predict(self.preparar(entrada), verbose=0)[0]
+
+
+class MotorTFFunction:
+    """Chamada direta ao modelo via `tf.function` com assinatura fixa (1, passos, 126)"""
+
+    nome = 'tf_function'
+
+    def __init__(self, caminho_modelo=config.MODEL_PATH):
+        import tensorflow as tf
+        self.modelo = tf.keras.models.load_model(caminho_modelo, compile=False)
+        _, passos_modelo, largura_modelo = self.modelo.input_shape
+        self.preparar = PreparadorEntrada(caminho_modelo, passos_modelo, largura_modelo)
+        self.tamanho_sequencia, self.largura = self.preparar.tamanho_sequencia, self.preparar.largura
+        assinatura = tf.TensorSpec((1, passos_modelo, largura_modelo), tf.float32)
+        self._chamar = tf.function(lambda x: self.modelo(x, training=False),
+                                   input_signature=[assinatura])
+        # Traça o grafo agora para que o primeiro frame não pague a compilação
+        self.prever(np.zeros((1, self.tamanho_sequencia, self.largura), dtype=np.float32))
+
+    def prever(self, entrada):
+        return self._chamar(self.preparar(entrada)).numpy()[0]
+
+
+class MotorLote:
+    """`tf.function` com lote variável: uma passada do modelo para várias janelas
+    (usado pelo servidor de reconhecimento)"""
+
+    nome = 'lote'
+
+    def __init__(self, caminho_modelo=config.MODEL_PATH, lote_maximo=config.LOTE_MAXIMO):
+        import tensorflow as tf
+        self.modelo = tf.keras.models.load_model(caminho_modelo, compile=False)
+        _, passos_modelo, largura_modelo = self.modelo.input_shape
+        self.preparar = PreparadorEntrada(caminho_modelo, passos_modelo, largura_modelo)
+        self.tamanho_sequencia, self.largura = self.preparar.tamanho_sequencia, self.preparar.largura
+        assinatura = tf.TensorSpec((None, passos_modelo, largura_modelo), tf.float32)
+        self._chamar = tf.function(lambda x: self.modelo(x, training=False),
+                                   input_signature=[assinatura])
+        # Um único traçado atende qualquer tamanho de lote
+        self.prever_lote(np.zeros((lote_maximo, self.tamanho_sequencia, self.largura), dtype=np.float32))
+
+    def prever_lote(self, entradas):
+        """(N, passos, 126) -> probabilidades (N, classes)"""
+        return self._chamar(self.preparar(entradas)).numpy()
+
+    def prever(self, entrada):
+        return self.prever_lote(entrada)[0]
+
+
+class MotorTFLite:
+    """Interpretador TFLite; exporta o .tflite a partir do .h5 se ainda não existir"""
+
+    nome = 'tflite'
+
+    def __init__(self, caminho_tflite=config.TFLITE_PATH, caminho_modelo=config.MODEL_PATH):
+        caminho_tflite = Path(caminho_tflite)
+        if not caminho_tflite.exists():
+            if caminho_tflite.stem.endswith('_int8'):
+                raise FileNotFoundError(
+                    f"{caminho_tflite} não encontrado: gere com app/treinamento/exportar_tflite.py")
+            quantizacao = 'fp16' if caminho_tflite.stem.endswith('_fp16') else None
+            exportar_tflite(caminho_modelo, caminho_tflite, quantizacao)
+
+        self.interpreter = carregar_interpreter(caminho_tflite)
+        self.interpreter.allocate_tensors()
+        entrada = self.interpreter.get_input_details()[0]
+        saida = self.interpreter.get_output_details()[0]
+        self._indice_entrada = entrada['index']
+        self._indice_saida = saida['index']
+        _, passos_modelo, largura_modelo = entrada['shape']
+        self.preparar = PreparadorEntrada(caminho_modelo, passos_modelo, largura_modelo)
+        self.tamanho_sequencia, self.largura = self.preparar.tamanho_sequencia, self.preparar.largura
+
+    def prever(self, entrada):
+        self.interpreter.set_tensor(self._indice_entrada, self.preparar(entrada))
+        self.interpreter.invoke()
+        return self.interpreter.get_tensor(self._indice_saida)[0]
+
+
+MOTORES = {
+    MotorKeras.nome: MotorKeras,
+    MotorTFFunction.nome: MotorTFFunction,
+    MotorTFLite.nome: MotorTFLite,
+    MotorStreaming.nome: MotorStreaming,
+    MotorLote.nome: MotorLote,
+    MotorRemoto.nome: MotorRemoto,
+    MotorIndice.nome: MotorIndice,
+}
+
+
+def criar_motor(backend=None, caminho_modelo=config.MODEL_PATH):
+    """Instancia o backend de inferência escolhido (padrão: config.BACKEND_INFERENCIA)"""
+    backend = backend or config.BACKEND_INFERENCIA
+    if backend not in MOTORES:
+        raise ValueError(f"Backend desconhecido: {backend} (opções: {', '.join(MOTORES)})")
+    if backend == MotorTFLite.nome:
+        return MotorTFLite(caminho_tflite(caminho_modelo), caminho_modelo)
+    return MOTORES[backend](caminho_modelo)
+
+
+def carregar_rotulador(motor, caminho=config.LABEL_PATH):
+    """Rotulador das probabilidades do motor: o do treino ou, se o motor tem
+    classes próprias (índice de gestos, servidor remoto), um com essas classes"""
+    import joblib
+    classes = getattr(motor, 'classes', None)
+    if classes is None:
+        return joblib.load(caminho)
+    from sklearn.preprocessing import LabelEncoder
+    le = LabelEncoder()
+    le.classes_ = np.array(classes)
+    return le
+
+
+def caminho_tflite(caminho_modelo=config.MODEL_PATH, variante=None):
+    """modelo_gestos.tflite, modelo_gestos_fp16.tflite ou modelo_gestos_int8.tflite"""
+    variante = variante or config.VARIANTE_TFLITE
+    caminho_modelo = Path(caminho_modelo)
+    sufixo = '' if variante == 'fp32' else f'_{variante}'
+    return caminho_modelo.with_name(f'{caminho_modelo.stem}{sufixo}.tflite')
+
+
+def carregar_interpreter(caminho_tflite):
+    """Usa um runtime TFLite leve quando instalado, senão o interpretador do TensorFlow"""
+    try:
+        from ai_edge_litert.interpreter import Interpreter
+    except ImportError:
+        try:
+            from tflite_runtime.interpreter import Interpreter
+        except ImportError:
+            import tensorflow as tf
+            Interpreter = tf.lite.Interpreter
+    return Interpreter(model_path=str(caminho_tflite))
+
+
+def exportar_tflite(caminho_modelo, destino, quantizacao=None, representativas=None):
+    """Converte o modelo Keras para TFLite com lote fixo de 1 janela.
+
+    `quantizacao`: None (float32), 'fp16' (pesos em float16) ou 'int8'
+    (pesos e ativações em int8, calibradas com `representativas`, um array
+    (N, passos, 126) de frames brutos, convertidos como no treino). Entrada
+    e saída continuam em float32.
+    """
+    import tensorflow as tf
+    modelo = tf.keras.models.load_model(caminho_modelo, compile=False)
+    _, passos, largura = modelo.input_shape
+
+    if quantizacao == 'int8':
+        if representativas is None:
+            raise ValueError("Quantização int8 exige amostras representativas")
+        # A calibração falha no laço da LSTM fundida; com unroll=True o grafo
+        # fica estático e os pesos são os mesmos
+        cfg = modelo.get_config()
+        for camada in cfg['layers']:
+            if camada['class_name'] in ('LSTM', 'GRU'):
+                camada['config']['unroll'] = True
+        desenrolado = modelo.__class__.from_config(cfg)
+        desenrolado.build((None, passos, largura))
+        desenrolado.set_weights(modelo.get_weights())
+        modelo = desenrolado
+
+    # Lote fixo em 1 para o conversor gerar a LSTM fundida sem variáveis de estado
+    entrada = tf.keras.Input(shape=(passos, largura), batch_size=1)
+    modelo_fixo = tf.keras.Model(entrada, modelo(entrada))
+
+    converter = tf.lite.TFLiteConverter.from_keras_model(modelo_fixo)
+    if quantizacao == 'fp16':
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        converter.target_spec.supported_types = [tf.float16]
+    elif quantizacao == 'int8':
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        amostras = PreparadorEntrada(caminho_modelo, passos, largura)(representativas)
+        converter.representative_dataset = lambda: ([amostra[None]] for amostra in amostras)
+    elif quantizacao is not None:
+        raise ValueError(f"Quantização desconhecida: {quantizacao}")
+    else:
+        # LSTM pode cair em ops do TF dependendo da versão; mantém o fallback habilitado
+        converter.target_spec.supported_ops = [
+            tf.lite.OpsSet.TFLITE_BUILTINS,
+            tf.lite.OpsSet.SELECT_TF_OPS,
+        ]
+    Path(destino).write_bytes(converter.convert())
+    print(f"✅ Modelo TFLite salvo em: {destino}")
+    return Path(destino)
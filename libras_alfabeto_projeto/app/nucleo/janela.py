@@ -0,0 +1,67 @@
+import numpy as np
+
+from app.nucleo import config
+from app.nucleo.landmarks import LARGURA
+
+
+class JanelaCircular:
+    """Janela deslizante de frames em um único array float32 (2 x tamanho, largura).
+
+    Cada frame é escrito na posição `p` e no espelho `p + tamanho`, então os
+    últimos `n` frames sempre formam um trecho contíguo do array e `janela()`
+    devolve uma view (1, n, largura) pronta para o modelo, sem cópia.
+
+    Também concentra a regra de reset: após mais de `reset_threshold` frames
+    seguidos sem mãos a janela é limpa (mesmo comportamento do deque antigo).
+    """
+
+    def __init__(self, tamanho=config.SEQUENCE_LENGTH, largura=LARGURA, reset_threshold=10):
+        self.tamanho = tamanho
+        self.reset_threshold = reset_threshold
+        self._dados = np.zeros((2 * tamanho, largura), dtype=np.float32)
+        self._pos = 0
+        self._n = 0
+        self.frames_sem_maos = 0
+
+    def __len__(self):
+        return self._n
+
+    @property
+    def cheia(self):
+        return self._n == self.tamanho
+
+    def adicionar(self, vetor):
+        """Copia o frame para a janela (o vetor de origem pode ser reutilizado)"""
+        self._dados[self._pos] = vetor
+        self._dados[self._pos + self.tamanho] = vetor
+        self._pos = (self._pos + 1) % self.tamanho
+        self._n = min(self._n + 1, self.tamanho)
+        self.frames_sem_maos = 0
+
+    def registrar_sem_maos(self):
+        """Conta um frame sem mãos; retorna True se isso limpou a janela"""
+        self.frames_sem_maos += 1
+        if self.frames_sem_maos > self.reset_threshold and self._n:
+            self.limpar()
+            return True
+        return False
+
+    def limpar(self):
+        self._pos = 0
+        self._n = 0
+
+    def janela(self):
+        """View contígua (1, n, largura) do frame mais antigo ao mais recente.
+
+        A view é sobrescrita pelos próximos `adicionar`; copie se for usá-la
+        em outra thread.
+        """
+        inicio = (self._pos - self._n) % self.tamanho
+        return self._dados[inicio:inicio + self._n][None]
+
+    def preenchida(self):
+        """Cópia (1, tamanho, largura) com os frames atuais no início e zeros no
+        fim, como `padronizar_frames` faz com as amostras curtas do dataset"""
+        saida = np.zeros((1,) + (self.tamanho, self._dados.shape[1]), dtype=np.float32)
+        saida[0, :self._n] = self.janela()[0]
+        return saida
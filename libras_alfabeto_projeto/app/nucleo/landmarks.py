@@ -0,0 +1,36 @@
+import numpy as np
+
+MAX_MAOS = 2
+LANDMARKS_POR_MAO = 21
+NUM_LANDMARKS = MAX_MAOS * LANDMARKS_POR_MAO  # 42
+LARGURA = NUM_LANDMARKS * 3                    # 126 valores por frame
+
+
+class ExtratorLandmarks:
+    """Preenche um buffer float32 (42, 3) pré-alocado a partir do resultado do MediaPipe.
+
+    Mesmo layout de antes (mão 1 depois mão 2, x/y/z por landmark, zeros para
+    mão ausente), mas sem listas intermediárias: cada coordenada é escrita
+    direto no buffer por um memoryview. O vetor retornado é reutilizado no
+    frame seguinte; quem precisa guardá-lo deve copiá-lo.
+    """
+
+    def __init__(self):
+        self.buffer = np.zeros((NUM_LANDMARKS, 3), dtype=np.float32)
+        self.vetor = self.buffer.reshape(-1)  # view (126,) do mesmo buffer
+        self._escrita = memoryview(self.vetor)
+
+    def extrair(self, results):
+        """Atualiza o buffer com as mãos de `results` e retorna o vetor (126,)"""
+        escrita = self._escrita
+        j = 0
+        if results.multi_hand_landmarks:
+            for hand in results.multi_hand_landmarks[:MAX_MAOS]:
+                for lm in hand.landmark:
+                    escrita[j] = lm.x
+                    escrita[j + 1] = lm.y
+                    escrita[j + 2] = lm.z
+                    j += 3
+        if j < LARGURA:
+            self.vetor[j:] = 0
+        return self.vetor
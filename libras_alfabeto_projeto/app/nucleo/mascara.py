@@ -0,0 +1,51 @@
+import numpy as np
+
+from app.nucleo import config
+from app.nucleo.suavizacao import nome_sem_mao
+
+
+class MascaraClasses:
+    """Restringe as predições a um subconjunto das classes do rotulador.
+
+    `permitidas` e `excluidas` são nomes de gestos sem o sufixo de mão
+    (permitir "A" libera A_DIR e A_ESQ). As probabilidades das classes fora
+    do subconjunto são zeradas e o resto é renormalizado, então limiares de
+    confiança continuam valendo. Substitui editar o rotulador para esconder
+    classes (ver .vscode/remover.py): o modelo não muda.
+
+    Se nenhuma classe do modelo sobrar, a máscara fica desligada.
+    """
+
+    def __init__(self, classes, permitidas=None, excluidas=config.CLASSES_EXCLUIDAS):
+        self.classes = [str(c) for c in classes]
+        self.definir(permitidas, excluidas)
+
+    def definir(self, permitidas=None, excluidas=()):
+        grupos = [nome_sem_mao(c) for c in self.classes]
+        mascara = np.ones(len(self.classes), dtype=bool)
+        if permitidas is not None:
+            permitidas = {nome_sem_mao(g) for g in permitidas}
+            mascara &= np.array([g in permitidas for g in grupos])
+            if not mascara.any():
+                print(f"⚠️ Nenhuma classe do modelo entre as permitidas {sorted(permitidas)}; máscara desligada")
+        if excluidas and mascara.any():
+            excluidas = {nome_sem_mao(g) for g in excluidas}
+            mascara &= np.array([g not in excluidas for g in grupos])
+            if not mascara.any():
+                print(f"⚠️ Todas as classes {'permitidas ' if permitidas is not None else ''}excluídas "
+                      f"({', '.join(sorted(excluidas))}); máscara desligada")
+        self.ativa = bool(mascara.any()) and not mascara.all()
+        self.mascara = mascara.astype(np.float32)
+        self.ausentes = sorted(set(permitidas or ()) - set(grupos))
+
+    @property
+    def permitidas(self):
+        return [c for c, m in zip(self.classes, self.mascara) if m]
+
+    def aplicar(self, preds):
+        """Probabilidades (C,) ou (N, C) só das classes permitidas, somando 1"""
+        if not self.ativa:
+            return preds
+        mascaradas = np.asarray(preds, dtype=np.float32) * self.mascara
+        total = mascaradas.sum(axis=-1, keepdims=True)
+        return mascaradas / np.maximum(total, np.finfo(np.float32).tiny)
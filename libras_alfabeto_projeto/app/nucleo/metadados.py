@@ -0,0 +1,28 @@
+import json
+from pathlib import Path
+
+# Modelos sem arquivo de metadados foram treinados com as coordenadas brutas,
+# vendo todos os frames da janela (passo 1)
+PADRAO = {'caracteristicas': 'brutas', 'passo': 1}
+
+
+def caminho_metadados(caminho_modelo):
+    """modelos/modelo_gestos.h5 -> modelos/modelo_gestos.json"""
+    return Path(caminho_modelo).with_suffix('.json')
+
+
+def carregar_metadados(caminho_modelo):
+    """Como o modelo foi treinado, com os padrões para campos ausentes:
+    `caracteristicas` (representação de entrada), `passos` (frames que o
+    modelo vê) e `passo` (um frame a cada `passo` capturados)"""
+    caminho = caminho_metadados(caminho_modelo)
+    meta = dict(PADRAO)
+    if caminho.exists():
+        meta.update(json.loads(caminho.read_text(encoding='utf-8')))
+    return meta
+
+
+def salvar_metadados(caminho_modelo, **campos):
+    caminho = caminho_metadados(caminho_modelo)
+    caminho.write_text(json.dumps({**PADRAO, **campos}, indent=2, ensure_ascii=False), encoding='utf-8')
+    return caminho
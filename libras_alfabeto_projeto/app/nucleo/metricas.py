@@ -0,0 +1,92 @@
+import sys
+import threading
+import time
+from collections import defaultdict, deque
+
+import numpy as np
+
+
+def pico_memoria_mb():
+    """Pico de memória residente (RSS) do processo em MB, ou None se indisponível"""
+    try:
+        import resource
+        pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux informa em KB, macOS em bytes
+        return pico / 2**20 if sys.platform == 'darwin' else pico / 2**10
+    except ImportError:
+        pass
+    try:
+        import psutil
+        memoria = psutil.Process().memory_info()
+        return getattr(memoria, 'peak_wset', memoria.rss) / 2**20
+    except ImportError:
+        return None
+
+
+def mediana_ms(chamar, entradas, repeticoes, aquecimento=10):
+    """Mediana do tempo por chamada de `chamar(entrada)` (ms), após aquecimento"""
+    for entrada in entradas[:aquecimento]:
+        chamar(entrada)
+    tempos = []
+    for i in range(repeticoes):
+        inicio = time.perf_counter()
+        chamar(entradas[i % len(entradas)])
+        tempos.append(time.perf_counter() - inicio)
+    return float(np.median(tempos) * 1000)
+
+
+class MetricasEstagios:
+    """Acumula latência por estágio e taxa de quadros exibidos (janela deslizante;
+    `janela=None` guarda todas as medidas, como nos benchmarks)"""
+
+    def __init__(self, janela=120):
+        self.janela = janela
+        self._lock = threading.Lock()
+        self._tempos = defaultdict(lambda: deque(maxlen=self.janela))
+        self._exibicoes = deque(maxlen=janela)
+
+    def registrar(self, estagio, duracao):
+        """Registra a duração (em segundos) de uma execução do estágio"""
+        with self._lock:
+            self._tempos[estagio].append(duracao)
+
+    def registrar_exibicao(self, t_captura):
+        """Marca um quadro exibido e sua latência desde a captura"""
+        agora = time.perf_counter()
+        with self._lock:
+            self._exibicoes.append(agora)
+            self._tempos['ponta_a_ponta'].append(agora - t_captura)
+
+    def limpar(self):
+        """Descarta as medidas acumuladas (ex.: após mudar a configuração)"""
+        with self._lock:
+            self._tempos.clear()
+            self._exibicoes.clear()
+
+    def fps(self):
+        """Quadros exibidos por segundo na janela atual"""
+        with self._lock:
+            if len(self._exibicoes) < 2:
+                return 0.0
+            intervalo = self._exibicoes[-1] - self._exibicoes[0]
+            return (len(self._exibicoes) - 1) / intervalo if intervalo > 0 else 0.0
+
+    def resumo(self, percentis=(95,)):
+        """Retorna média e percentis (ms) de cada estágio, mais o FPS exibido"""
+        with self._lock:
+            tempos = {estagio: np.array(valores) for estagio, valores in self._tempos.items() if valores}
+        resumo = {}
+        for estagio, valores in tempos.items():
+            resumo[estagio] = {'media_ms': float(valores.mean() * 1000), 'n': len(valores)}
+            for p in percentis:
+                resumo[estagio][f'p{p}_ms'] = float(np.percentile(valores, p) * 1000)
+        resumo['fps'] = self.fps()
+        return resumo
+
+    def formatar(self):
+        """Resumo em uma linha para log"""
+        resumo = self.resumo()
+        partes = [f"FPS {resumo.pop('fps'):.1f}"]
+        for estagio, valores in resumo.items():
+            partes.append(f"{estagio} {valores['media_ms']:.1f}/{valores['p95_ms']:.1f}ms")
+        return " | ".join(partes)
@@ -0,0 +1,320 @@
+import threading
+import time
+from collections import deque
+
+import cv2
+
+from app.nucleo.janela import JanelaCircular
+from app.nucleo.metricas import MetricasEstagios
+
+
+class FilaDescarte:
+    """Fila limitada que descarta o item mais antigo quando está cheia.
+
+    Com `bloquear=True` o produtor espera por espaço em vez de descartar
+    (usado com fontes gravadas no modo rápido, para não perder quadros).
+    """
+
+    def __init__(self, tamanho=1, bloquear=False):
+        self._itens = deque(maxlen=tamanho)
+        self._cond = threading.Condition()
+        self.bloquear = bloquear
+        self._fechada = False
+        self.descartados = 0
+
+    def put(self, item):
+        with self._cond:
+            if self.bloquear:
+                while len(self._itens) == self._itens.maxlen and not self._fechada:
+                    self._cond.wait(0.1)
+            if len(self._itens) == self._itens.maxlen:
+                self.descartados += 1
+            self._itens.append(item)
+            self._cond.notify_all()
+
+    def get(self, timeout=None):
+        """Retira o item mais antigo, esperando até `timeout` (None se vazio)"""
+        with self._cond:
+            if not self._itens:
+                self._cond.wait(timeout)
+            if not self._itens:
+                return None
+            item = self._itens.popleft()
+            self._cond.notify_all()
+            return item
+
+    def ultimo(self):
+        """Retira o item mais recente e descarta os demais (não bloqueia)"""
+        with self._cond:
+            if not self._itens:
+                return None
+            item = self._itens.pop()
+            self._itens.clear()
+            self._cond.notify_all()
+            return item
+
+    def esvaziar(self):
+        """Retira todos os itens em ordem de chegada (não bloqueia)"""
+        with self._cond:
+            itens = list(self._itens)
+            self._itens.clear()
+            self._cond.notify_all()
+            return itens
+
+    def limpar(self):
+        with self._cond:
+            self._itens.clear()
+            self._cond.notify_all()
+
+    def fechar(self):
+        """Libera produtores bloqueados (a fila volta a descartar)"""
+        with self._cond:
+            self._fechada = True
+            self._cond.notify_all()
+
+    def abrir(self):
+        with self._cond:
+            self._fechada = False
+
+
+class PipelineReconhecimento:
+    """Pipeline em estágios: captura -> landmarks -> inferência.
+
+    Cada estágio roda em sua própria thread e as filas entre eles descartam
+    o item mais antigo, então um estágio lento nunca acumula atraso. A thread
+    da interface só consome o último quadro desenhado e os eventos gerados.
+
+    Se a fonte for `deterministico` (gravação no modo rápido) as filas entre
+    os estágios bloqueiam em vez de descartar, então todo quadro chega à
+    inferência. Fontes que já trazem o `resultado` da detecção (landmarks
+    gravados) pulam o MediaPipe.
+
+    Com um `controlador` (ver nucleo/adaptativo.py) o MediaPipe recebe a
+    imagem reduzida pela `escala` atual e só roda a cada
+    `intervalo_deteccao` quadros; nos demais o último resultado é repetido,
+    então a janela do modelo continua com um vetor por quadro capturado.
+
+    Com `min_frames_parcial` a inferência começa antes de a janela encher:
+    a partir desse número de frames a janela vai completada com zeros e a
+    predição sai marcada como `parcial` (não vale para o modo streaming).
+
+    Com um classificador `estatico` (ver nucleo/estatico.py) cada frame com
+    mãos também gera uma predição marcada `estatico`, na própria thread de
+    landmarks. Com `usar_sequencia` em False (alvo estático no jogo) as
+    janelas deixam de ir para o modelo de sequência; a janela continua
+    enchendo, para voltar a ele sem esperar.
+    """
+
+    def __init__(self, cap, detectar, extrair_landmarks, inferir=None, desenhar=None,
+                 tamanho_sequencia=30, reset_threshold=10, metricas=None, streaming=None,
+                 controlador=None, min_frames_parcial=None, estatico=None):
+        self.cap = cap
+        self.detectar = detectar
+        self.extrair_landmarks = extrair_landmarks
+        self.inferir = inferir
+        # Motor com passo(vetor)/resetar(): um passo de LSTM por frame, feito
+        # na própria thread de landmarks (não pode perder frames nas filas)
+        self.streaming = streaming
+        self.desenhar = desenhar
+        self.tamanho_sequencia = tamanho_sequencia
+        self.reset_threshold = reset_threshold
+        self.metricas = metricas or MetricasEstagios()
+        self.controlador = controlador
+        self.min_frames_parcial = min_frames_parcial
+        self.estatico = estatico
+        self.usar_sequencia = True
+
+        sem_descarte = getattr(cap, 'deterministico', False)
+        self.fila_frames = FilaDescarte(2, bloquear=sem_descarte)
+        self.fila_janelas = FilaDescarte(1, bloquear=sem_descarte)
+        self.fila_exibicao = FilaDescarte(1)
+        self.fila_eventos = FilaDescarte(8, bloquear=sem_descarte)
+
+        self.buffer = JanelaCircular(tamanho_sequencia, reset_threshold=reset_threshold)
+        # Incrementada a cada reset: janelas e predições antigas são ignoradas
+        self.geracao = 0
+        self._geracao_buffer = 0
+        self._quadros_desde_deteccao = 0
+        self._ultimo_resultado = None
+        self._parar = threading.Event()
+        self._threads = []
+
+    def iniciar(self):
+        """Dispara as threads de captura, landmarks e inferência"""
+        self._parar.clear()
+        for fila in self._filas():
+            fila.abrir()
+        alvos = [self._loop_captura, self._loop_landmarks]
+        self._com_inferencia = self.inferir is not None and self.streaming is None
+        if self._com_inferencia:
+            alvos.append(self._loop_inferencia)
+        self._threads = [threading.Thread(target=alvo, daemon=True) for alvo in alvos]
+        for thread in self._threads:
+            thread.start()
+
+    def parar(self, timeout=1.0):
+        """Sinaliza parada e aguarda as threads (antes de liberar a câmera)"""
+        self._parar.set()
+        for fila in self._filas():
+            fila.fechar()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def _filas(self):
+        return (self.fila_frames, self.fila_janelas, self.fila_exibicao, self.fila_eventos)
+
+    def limpar_buffer(self):
+        """Descarta a janela atual e qualquer predição ainda em andamento"""
+        self.geracao += 1
+        self.fila_janelas.limpar()
+
+    def frame_mais_recente(self):
+        """Último quadro desenhado como (frame_rgb, t_captura), ou None"""
+        return self.fila_exibicao.ultimo()
+
+    def coletar_eventos(self):
+        """Eventos pendentes (predições, mãos ausentes, falha de captura, fim da fonte)"""
+        return [evento for evento in self.fila_eventos.esvaziar()
+                if evento.get('geracao', self.geracao) == self.geracao]
+
+    # Estágios
+    def _loop_captura(self):
+        while not self._parar.is_set():
+            inicio = time.perf_counter()
+            ret, frame = self.cap.read()
+            fim = time.perf_counter()
+            if not ret:
+                # Segue pelas filas para ser avisado só depois dos quadros pendentes
+                tipo = 'fim_fonte' if getattr(self.cap, 'offline', False) else 'erro_captura'
+                self.fila_frames.put((None, tipo, None))
+                return
+            self.metricas.registrar('captura', fim - inicio)
+            self.fila_frames.put((frame, fim, getattr(self.cap, 'resultado', None)))
+
+    def _loop_landmarks(self):
+        while not self._parar.is_set():
+            item = self.fila_frames.get(timeout=0.1)
+            if item is None:
+                continue
+            frame, t_captura, resultado = item
+            if frame is None:
+                self._encerrar(t_captura, self.fila_janelas if self._com_inferencia else None)
+                return
+
+            geracao = self.geracao
+            if geracao != self._geracao_buffer:
+                self._geracao_buffer = geracao
+                self._resetar_buffer()
+
+            inicio = time.perf_counter()
+            frame = cv2.flip(frame, 1)
+            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            if resultado is not None:
+                results = resultado
+                self.metricas.registrar('deteccao', time.perf_counter() - inicio)
+            else:
+                results = self._detectar(frame_rgb, inicio)
+
+            if results.multi_hand_landmarks:
+                if self.desenhar is not None:
+                    inicio = time.perf_counter()
+                    self.desenhar(frame_rgb, results)
+                    self.metricas.registrar('desenho', time.perf_counter() - inicio)
+
+                landmarks = self.extrair_landmarks(results)
+                self.buffer.adicionar(landmarks)
+                if self.estatico is not None:
+                    self._prever_estatico(landmarks, t_captura, geracao)
+                if self.streaming is not None:
+                    # O estado da LSTM precisa de todos os frames, mesmo sem usar a predição
+                    self._passo_streaming(landmarks, t_captura, geracao)
+                elif self.usar_sequencia and self.buffer.cheia:
+                    # Cópia única da janela: o anel segue sendo escrito por esta thread
+                    self.fila_janelas.put((self.buffer.janela().copy(), t_captura, geracao, False))
+                elif self.usar_sequencia and self.min_frames_parcial and len(self.buffer) >= self.min_frames_parcial:
+                    self.fila_janelas.put((self.buffer.preenchida(), t_captura, geracao, True))
+            elif self.buffer.registrar_sem_maos():
+                if self.streaming is not None:
+                    self.streaming.resetar()
+                self.fila_eventos.put({'tipo': 'sem_maos'})
+
+            self.fila_exibicao.put((frame_rgb, t_captura))
+
+    def _detectar(self, frame_rgb, inicio):
+        """Roda o detector (ou repete o último resultado) conforme o controlador"""
+        if self.controlador is None:
+            results = self.detectar(frame_rgb)
+            self.metricas.registrar('deteccao', time.perf_counter() - inicio)
+            return results
+
+        self._quadros_desde_deteccao += 1
+        if (self._ultimo_resultado is not None
+                and self._quadros_desde_deteccao < self.controlador.intervalo_deteccao):
+            return self._ultimo_resultado
+
+        escala = self.controlador.escala
+        entrada = frame_rgb
+        if escala < 1.0:
+            # Landmarks saem normalizados (0-1): desenhar e extrair não mudam
+            altura, largura = frame_rgb.shape[:2]
+            entrada = cv2.resize(frame_rgb, (int(largura * escala), int(altura * escala)),
+                                 interpolation=cv2.INTER_AREA)
+        self._ultimo_resultado = self.detectar(entrada)
+        self._quadros_desde_deteccao = 0
+        self.metricas.registrar('deteccao', time.perf_counter() - inicio)
+        return self._ultimo_resultado
+
+    def _encerrar(self, tipo, proxima_fila=None):
+        """Repassa o aviso de fim ao próximo estágio ou, no último, à interface"""
+        if proxima_fila is not None:
+            proxima_fila.put((None, tipo, None, None))
+        else:
+            self.fila_eventos.put({'tipo': tipo})
+
+    def _resetar_buffer(self):
+        self.buffer.limpar()
+        if self.streaming is not None:
+            self.streaming.resetar()
+
+    def _passo_streaming(self, landmarks, t_captura, geracao):
+        inicio = time.perf_counter()
+        preds = self.streaming.passo(landmarks)
+        fim = time.perf_counter()
+        self.metricas.registrar('inferencia', fim - inicio)
+        if preds is not None:
+            self.metricas.registrar('captura_ate_predicao', fim - t_captura)
+            self.fila_eventos.put({'tipo': 'predicao', 'preds': preds, 'parcial': False,
+                                   't_captura': t_captura, 'geracao': geracao})
+
+    def _prever_estatico(self, landmarks, t_captura, geracao):
+        inicio = time.perf_counter()
+        preds = self.estatico.prever(landmarks)
+        self.metricas.registrar('estatico', time.perf_counter() - inicio)
+        self.fila_eventos.put({'tipo': 'predicao', 'preds': preds, 'parcial': False, 'estatico': True,
+                               't_captura': t_captura, 'geracao': geracao})
+
+    def _loop_inferencia(self):
+        while not self._parar.is_set():
+            item = self.fila_janelas.get(timeout=0.1)
+            if item is None:
+                continue
+            entrada, t_captura, geracao, parcial = item
+            if entrada is None:
+                self._encerrar(t_captura)
+                return
+            if geracao != self.geracao:
+                continue
+
+            inicio = time.perf_counter()
+            try:
+                preds = self.inferir(entrada)
+            except Exception as e:
+                print(f"Erro ao reconhecer gesto: {str(e)}")
+                self.fila_eventos.put({'tipo': 'erro_inferencia', 'geracao': geracao})
+                continue
+            fim = time.perf_counter()
+            self.metricas.registrar('inferencia', fim - inicio)
+            self.metricas.registrar('captura_ate_predicao', fim - t_captura)
+            self.fila_eventos.put({'tipo': 'predicao', 'preds': preds, 'parcial': parcial,
+                                   't_captura': t_captura, 'geracao': geracao})
@@ -0,0 +1,57 @@
+import http.client
+import json
+from urllib.parse import urlsplit
+
+import numpy as np
+
+from app.nucleo import config
+
+# Protocolo do servidor de reconhecimento (app/servidor/servidor_reconhecimento.py):
+# POST /prever com a janela float32 (passos x 126) em bytes -> JSON com
+# classe, confiança e probabilidades; GET /info e GET /metricas em JSON.
+ROTA_PREVER = '/prever'
+ROTA_INFO = '/info'
+ROTA_METRICAS = '/metricas'
+
+
+class MotorRemoto:
+    """Envia cada janela ao servidor de reconhecimento, que junta os pedidos
+    de vários clientes em um único lote no modelo.
+
+    Mantém uma conexão HTTP persistente; não precisa do modelo local.
+    """
+
+    nome = 'remoto'
+
+    def __init__(self, caminho_modelo=None, url=None, timeout=5.0):
+        partes = urlsplit(url or config.SERVIDOR_URL)
+        self.url = url or config.SERVIDOR_URL
+        self._conexao = http.client.HTTPConnection(partes.hostname, partes.port or 80, timeout=timeout)
+        info = self.requisitar('GET', ROTA_INFO)
+        self.tamanho_sequencia = info['tamanho_sequencia']
+        self.largura = info['largura']
+        self.classes = info['classes']
+
+    def requisitar(self, metodo, rota, corpo=None):
+        """Faz a requisição e devolve o JSON da resposta (reconecta uma vez se a conexão caiu)"""
+        cabecalhos = {'Content-Type': 'application/octet-stream'} if corpo is not None else {}
+        for tentativa in range(2):
+            try:
+                self._conexao.request(metodo, rota, body=corpo, headers=cabecalhos)
+                resposta = self._conexao.getresponse()
+                dados = resposta.read()
+                break
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                self._conexao.close()
+                if tentativa:
+                    raise
+        if resposta.status != 200:
+            raise RuntimeError(f"Servidor respondeu {resposta.status}: {dados.decode(errors='replace')}")
+        return json.loads(dados)
+
+    def prever(self, entrada):
+        corpo = np.ascontiguousarray(entrada, dtype=np.float32).tobytes()
+        return np.asarray(self.requisitar('POST', ROTA_PREVER, corpo)['probs'], dtype=np.float32)
+
+    def fechar(self):
+        self._conexao.close()
@@ -0,0 +1,71 @@
+import time
+
+import cv2
+import numpy as np
+from PIL import Image
+
+# Ligações entre os 21 landmarks da mão (mesma topologia de mp.solutions.hands.HAND_CONNECTIONS)
+CONEXOES_MAO = (
+    (0, 1), (1, 2), (2, 3), (3, 4),
+    (0, 5), (5, 6), (6, 7), (7, 8),
+    (5, 9), (9, 10), (10, 11), (11, 12),
+    (9, 13), (13, 14), (14, 15), (15, 16),
+    (13, 17), (0, 17), (17, 18), (18, 19), (19, 20),
+)
+_ORIGENS = np.array([a for a, _ in CONEXOES_MAO])
+_DESTINOS = np.array([b for _, b in CONEXOES_MAO])
+
+COR_LIGACAO = (255, 255, 255)
+COR_PONTO = (230, 60, 60)  # RGB (o quadro exibido já está em RGB)
+
+
+def desenhar_maos_leve(frame_rgb, results, espessura=2, raio=3):
+    """Desenha esqueleto das mãos com uma chamada de linhas por mão.
+
+    Substitui `mp_drawing.draw_landmarks` com estilos por landmark, que custa
+    vários ms por mão; o resultado é um traçado mais simples.
+    """
+    altura, largura = frame_rgb.shape[:2]
+    escala = np.array([largura, altura], dtype=np.float32)
+    for mao in results.multi_hand_landmarks:
+        pontos = (np.array([(lm.x, lm.y) for lm in mao.landmark], dtype=np.float32) * escala).astype(np.int32)
+        segmentos = np.stack([pontos[_ORIGENS], pontos[_DESTINOS]], axis=1)
+        cv2.polylines(frame_rgb, segmentos, False, COR_LIGACAO, espessura, cv2.LINE_8)
+        for x, y in pontos:
+            cv2.circle(frame_rgb, (int(x), int(y)), raio, COR_PONTO, -1, cv2.LINE_8)
+
+
+class RenderizadorQuadros:
+    """Mostra quadros RGB num Label do Tk reaproveitando uma única PhotoImage.
+
+    Cada quadro é colado (`paste`) na mesma imagem em vez de criar uma
+    PhotoImage nova; só há reamostragem quando o quadro não tem o tamanho de
+    exibição, e aí com interpolação bilinear do OpenCV em vez de LANCZOS.
+    O tempo de cada quadro vai para o estágio 'renderizacao' das métricas.
+    """
+
+    def __init__(self, label, largura=640, altura=480, metricas=None):
+        self.label = label
+        self.largura = largura
+        self.altura = altura
+        self.metricas = metricas
+        self._foto = None
+
+    def mostrar(self, frame_rgb):
+        inicio = time.perf_counter()
+        if frame_rgb.shape[1] != self.largura or frame_rgb.shape[0] != self.altura:
+            frame_rgb = cv2.resize(frame_rgb, (self.largura, self.altura), interpolation=cv2.INTER_LINEAR)
+        imagem = Image.fromarray(frame_rgb)
+        if self._foto is None:
+            from PIL import ImageTk
+            self._foto = ImageTk.PhotoImage(image=imagem)
+            self.label.config(image=self._foto)
+            self.label.imgtk = self._foto  # Mantém a referência viva
+        else:
+            self._foto.paste(imagem)
+        if self.metricas is not None:
+            self.metricas.registrar('renderizacao', time.perf_counter() - inicio)
+
+    def limpar(self):
+        """Mostra um quadro preto"""
+        self.mostrar(np.zeros((self.altura, self.largura, 3), dtype=np.uint8))
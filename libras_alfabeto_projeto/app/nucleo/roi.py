@@ -0,0 +1,101 @@
+class RastreadorROI:
+    """Envolve o detector de mãos para rodar só na região das mãos do quadro anterior.
+
+    Depois que as mãos aparecem, o próximo quadro é recortado na caixa dos
+    landmarks anteriores com `margem` (fração do tamanho da caixa) e só o
+    recorte vai ao detector. Os landmarks voltam para as coordenadas
+    normalizadas do quadro inteiro, então o extrator e o modelo não mudam.
+    Se o recorte perde alguma mão, o mesmo quadro é refeito inteiro; a cada
+    `intervalo_completo` quadros também, para achar uma mão que acabou de entrar.
+
+    `resetar` (ex.: `hands.reset`) limpa o rastreamento interno do MediaPipe
+    ao trocar entre recorte e quadro inteiro, cujas coordenadas não batem.
+    """
+
+    def __init__(self, detectar, resetar=None, margem=0.3, tamanho_minimo=160, intervalo_completo=30):
+        self.detectar = detectar
+        self.resetar = resetar
+        self.margem = margem
+        self.tamanho_minimo = tamanho_minimo
+        self.intervalo_completo = intervalo_completo
+        self._caixa = None    # (x0, y0, x1, y1) normalizada do quadro anterior
+        self._num_maos = 0
+        self._no_recorte = False
+        self._quadros_recorte = 0
+        # Contadores para benchmark/log
+        self.quadros = 0
+        self.recortes = 0
+        self.perdas = 0
+
+    def __call__(self, frame_rgb):
+        self.quadros += 1
+        if self._caixa is not None and self._quadros_recorte < self.intervalo_completo:
+            results = self._detectar_recorte(frame_rgb)
+            if results is not None:
+                return results
+            self.perdas += 1
+        return self._detectar_inteiro(frame_rgb)
+
+    def limpar(self):
+        """Esquece a região anterior (próximo quadro é detectado inteiro)"""
+        self._caixa = None
+        self._quadros_recorte = 0
+
+    def _trocar_modo(self, no_recorte):
+        if no_recorte != self._no_recorte and self.resetar is not None:
+            self.resetar()
+        self._no_recorte = no_recorte
+
+    def _detectar_inteiro(self, frame_rgb):
+        self._trocar_modo(False)
+        results = self.detectar(frame_rgb)
+        self._quadros_recorte = 0
+        self._guardar(results)
+        return results
+
+    def _detectar_recorte(self, frame_rgb):
+        altura, largura = frame_rgb.shape[:2]
+        x0, y0, x1, y1 = self._recorte_em_pixels(largura, altura)
+        self._trocar_modo(True)
+        results = self.detectar(frame_rgb[y0:y1, x0:x1])
+        maos = results.multi_hand_landmarks
+        if not maos or len(maos) < self._num_maos:
+            return None
+
+        # Coordenadas do recorte -> quadro inteiro (z segue a escala de x)
+        fx, fy = (x1 - x0) / largura, (y1 - y0) / altura
+        ox, oy = x0 / largura, y0 / altura
+        for mao in maos:
+            for lm in mao.landmark:
+                lm.x = ox + lm.x * fx
+                lm.y = oy + lm.y * fy
+                lm.z *= fx
+        self.recortes += 1
+        self._quadros_recorte += 1
+        self._guardar(results)
+        return results
+
+    def _guardar(self, results):
+        maos = results.multi_hand_landmarks
+        if not maos:
+            self._caixa = None
+            self._num_maos = 0
+            return
+        xs = [lm.x for mao in maos for lm in mao.landmark]
+        ys = [lm.y for mao in maos for lm in mao.landmark]
+        self._caixa = (min(xs), min(ys), max(xs), max(ys))
+        self._num_maos = len(maos)
+
+    def _recorte_em_pixels(self, largura, altura):
+        """Caixa anterior com margem, no mínimo `tamanho_minimo` px e dentro do quadro"""
+        x0, y0, x1, y1 = self._caixa
+        cx, cy = (x0 + x1) / 2 * largura, (y0 + y1) / 2 * altura
+        lado_x = max((x1 - x0) * largura * (1 + 2 * self.margem), self.tamanho_minimo)
+        lado_y = max((y1 - y0) * altura * (1 + 2 * self.margem), self.tamanho_minimo)
+        lado_x, lado_y = min(lado_x, largura), min(lado_y, altura)
+        px0 = int(min(max(cx - lado_x / 2, 0), largura - lado_x))
+        py0 = int(min(max(cy - lado_y / 2, 0), altura - lado_y))
+        return px0, py0, px0 + int(lado_x), py0 + int(lado_y)
+
+    def taxa_recorte(self):
+        return self.recortes / self.quadros if self.quadros else 0.0
@@ -0,0 +1,70 @@
+# Seções e níveis do jogo: nome da seção -> {nível: gestos}. Os nomes são os
+# do rotulador sem o sufixo de mão (ver suavizacao.nome_sem_mao)
+SECOES = {
+    "Alfabeto": {
+        1: ["A", "E", "I", "O", "U"],
+        2: ["B", "C", "D", "G", "L"],
+        3: ["M", "N", "P", "Q", "R"],
+        4: ["S", "T", "V", "W"],
+        5: ["H", "J", "K", "X"],
+        6: ["W", "Y", "Z"]
+    },
+    "Números": {
+        1: ["1", "2", "3", "4", "5"],
+        2: ["6", "7", "8", "9", "10"]
+    },
+    "Dias da Semana": {
+        1: ["SEGUNDA-FEIRA", "TERÇA-FEIRA", "QUARTA-FEIRA"],
+        2: ["QUINTA-FEIRA", "SEXTA-FEIRA", "SABADO", "DOMINGO"]
+    },
+    "Tempo": {
+        1: ["HORAS", "MINUTOS"],
+        2: ["ONTEM","AMANHA", "AGORA"],
+        3: ["MES", "ANO"]
+    },
+    "Perguntas": {
+        1: ["QUANDO", "ONDE"],
+        2: ["O QUE", "POR QUE"]
+    },
+    "Saudações": {
+        1: ["OI", "TCHAU", "TUDO BEM"],
+        2: ["POR FAVOR", "OBRIGADO", "DESCULPA"]
+    },
+    "Família": {
+        1: ["PAI", "MÃE", "IRMÃO", "IRMÃ"],
+        2: ["AVÔ", "AVÓ", "PADRASTO", "MADRASTA"],
+        3: ["TIO", "TIA", "PRIMO", "PRIMA"],
+        4: ["CUNHADA", "CUNHADO", "SOGRO", "SOGRA"],
+        5: ["NAMORADO", "NAMORADA", "NOIVO", "NOIVA"],
+        6: ["ESPOSO", "ESPOSA", "FILHO", "FILHA"]
+    },
+    "Alimentos": {
+        1: ["MAÇÃ", "LARANJA", "UVA", "MELANCIA"],
+        2: ["LIMÃO", "MELÃO", "TOMATE", "ABACAXI"],
+        3: ["BATATA", "CENOURA", "BETERRABA", "CEBOLA"],
+        4: ["ABOBRINHA", "PEPINO", "ALHO", "MANDIOCA"],
+        5: ["ÁGUA", "SUCO", "LEITE", "CAFÉ", "REFRIGERANTE"]
+    },
+    "Cores": {
+        1: ["AZUL", "AMARELO", "VERDE", "VERMELHO"],
+        2: ["ROSA", "ROXO", "LARANJA", "BRANCO", "PRETO"]
+    },
+    "Animais": {
+        1: ["CÃO", "GATO", "PEIXE", "CAVALO", "PÁSSARO"],
+        2: ["MACACO", "LEÃO", "BALEIA"],
+        3: ["FORMIGA", "ABELHA", "BORBOLETA", "MINHOCA"]
+    },
+    "Adjetivos": {
+        1: ["BONITO", "FEIO", "ALTO", "BAIXO"],
+        2: ["GRANDE", "PEQUENO", "VELHO", "NOVO"],
+        3: ["RÁPIDO", "DEVAGAR", "QUENTE", "FRIO"]
+    }
+}
+
+
+def secao_do_gesto(gesto):
+    """Primeira seção em que o gesto aparece, ou None"""
+    for secao, niveis in SECOES.items():
+        if any(gesto in gestos for gestos in niveis.values()):
+            return secao
+    return None
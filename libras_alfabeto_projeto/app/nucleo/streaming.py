@@ -0,0 +1,147 @@
+import numpy as np
+
+from app.nucleo import config
+from app.nucleo.caracteristicas import PreparadorEntrada
+from app.nucleo.janela import JanelaCircular
+
+
+def _sigmoid(x):
+    return 1.0 / (1.0 + np.exp(-x))
+
+
+def _softmax(x):
+    e = np.exp(x - x.max())
+    return e / e.sum()
+
+
+ATIVACOES = {
+    'linear': lambda x: x,
+    'relu': lambda x: np.maximum(x, 0),
+    'tanh': np.tanh,
+    'sigmoid': _sigmoid,
+    'softmax': _softmax,
+}
+
+
+class MotorStreaming:
+    """LSTM com estado carregado entre frames: cada frame novo custa um passo.
+
+    O modelo treinado vê janelas de `tamanho_sequencia` frames partindo de
+    estado zero. Aqui o estado (h, c) de cada LSTM avança um passo por frame:
+
+    - A primeira predição só sai quando `tamanho_sequencia` frames foram vistos
+      desde o último reset, e ela é idêntica à da janela deslizante.
+    - Depois disso o estado acumula história além da janela. A cada
+      `intervalo_ressincronizacao` frames o estado é zerado e a janela atual é
+      reprocessada, então a predição volta a ser exata; entre ressincronizações
+      o modelo vê no máximo `tamanho_sequencia + intervalo - 1` frames (o portão
+      de esquecimento atenua os mais antigos).
+
+    Custo médio por frame: 1 + tamanho_sequencia / intervalo passos de LSTM.
+    As características (ver nucleo/caracteristicas.py) são calculadas frame a
+    frame, então cada passo converte só o frame novo. Em modelos com `passo`
+    maior que 1 só um a cada `passo` frames avança a LSTM (e gera predição);
+    os contadores acima valem em frames do modelo.
+    Também atende `prever(janela)`, reprocessando a janela inteira.
+    """
+
+    nome = 'streaming'
+    streaming = True
+
+    def __init__(self, caminho_modelo=config.MODEL_PATH,
+                 intervalo_ressincronizacao=config.INTERVALO_RESSINCRONIZACAO):
+        from tensorflow.keras.models import load_model
+        modelo = load_model(caminho_modelo, compile=False)
+        _, self.passos_modelo, largura_modelo = modelo.input_shape
+        self.preparar = PreparadorEntrada(caminho_modelo, self.passos_modelo, largura_modelo)
+        self.tamanho_sequencia, self.largura = self.preparar.tamanho_sequencia, self.preparar.largura
+        self.intervalo_ressincronizacao = intervalo_ressincronizacao
+
+        self.recorrentes = []
+        self.densas = []
+        for camada in modelo.layers:
+            tipo = camada.__class__.__name__
+            cfg = camada.get_config()
+            if tipo == 'LSTM':
+                if self.densas:
+                    raise ValueError("LSTM após camada densa não é suportada em streaming")
+                if cfg['activation'] != 'tanh' or cfg['recurrent_activation'] != 'sigmoid':
+                    raise ValueError(f"Ativações não suportadas em {camada.name}")
+                kernel, recorrente, bias = camada.get_weights()
+                self.recorrentes.append((kernel.astype(np.float32),
+                                         recorrente.astype(np.float32),
+                                         bias.astype(np.float32)))
+            elif tipo == 'Dense':
+                pesos, bias = camada.get_weights()
+                self.densas.append((pesos.astype(np.float32), bias.astype(np.float32),
+                                    ATIVACOES[cfg['activation']]))
+            elif tipo in ('Dropout', 'InputLayer'):
+                continue
+            else:
+                raise ValueError(f"Camada {tipo} não suportada em streaming")
+
+        if not self.recorrentes:
+            raise ValueError("O modelo não tem camadas LSTM")
+
+        self.janela = JanelaCircular(self.passos_modelo, largura_modelo)
+        self.resetar()
+
+    def resetar(self):
+        """Zera o estado e a janela (equivale a limpar o buffer de frames)"""
+        self.estados = [(np.zeros(rec.shape[0], dtype=np.float32),
+                         np.zeros(rec.shape[0], dtype=np.float32))
+                        for _, rec, _ in self.recorrentes]
+        self.janela.limpar()
+        self.frames_desde_reset = 0
+        self.passos_desde_reset = 0
+
+    def _avancar(self, vetor):
+        x = np.asarray(vetor, dtype=np.float32).reshape(-1)
+        for i, (kernel, recorrente, bias) in enumerate(self.recorrentes):
+            h, c = self.estados[i]
+            z = x @ kernel + h @ recorrente + bias
+            entrada, esquecimento, candidato, saida = np.split(z, 4)
+            c = _sigmoid(esquecimento) * c + _sigmoid(entrada) * np.tanh(candidato)
+            h = _sigmoid(saida) * np.tanh(c)
+            self.estados[i] = (h, c)
+            x = h
+        return x
+
+    def _cabeca(self, x):
+        for pesos, bias, ativacao in self.densas:
+            x = ativacao(x @ pesos + bias)
+        return x
+
+    def passo(self, vetor):
+        """Processa um frame; retorna as probabilidades ou None se a janela não
+        encheu ou o frame fica de fora da reamostragem"""
+        self.frames_desde_reset += 1
+        if self.frames_desde_reset % self.preparar.passo:
+            return None
+        vetor = self.preparar.frame(vetor)
+        self.janela.adicionar(vetor)  # Copia para o anel; o extrator reutiliza o vetor
+        self.passos_desde_reset += 1
+
+        if self.passos_desde_reset < self.passos_modelo:
+            self._avancar(vetor)
+            return None
+
+        excedente = self.passos_desde_reset - self.passos_modelo
+        if excedente and excedente % self.intervalo_ressincronizacao == 0:
+            return self._ressincronizar()
+        return self._cabeca(self._avancar(vetor))
+
+    def _ressincronizar(self):
+        """Reprocessa a janela atual a partir do estado zero (predição exata)"""
+        self.estados = [(np.zeros_like(h), np.zeros_like(c)) for h, c in self.estados]
+        for vetor in self.janela.janela()[0]:
+            x = self._avancar(vetor)
+        return self._cabeca(x)
+
+    def prever(self, entrada):
+        """Compatível com os demais motores: processa a janela inteira"""
+        entrada = self.preparar(np.asarray(entrada, dtype=np.float32).reshape(1, -1, self.largura))[0]
+        self.resetar()
+        for vetor in entrada:
+            x = self._avancar(vetor)
+        return self._cabeca(x)
@@ -0,0 +1,187 @@
+import numpy as np
+
+from app.nucleo import config
+
+
+def nome_sem_mao(gesto):
+    """Gesto sem o sufixo de mão (_DIR/_ESQ), como o jogo compara"""
+    return gesto.replace("_DIR", "").replace("_ESQ", "")
+
+
+class Suavizador:
+    """Base das estratégias: junta as probabilidades das classes do mesmo gesto
+    (A_DIR + A_ESQ -> A, se `agrupar_maos`) e mantém somas por gesto
+    atualizadas a cada predição, sem percorrer o histórico.
+
+    `atualizar(preds)` devolve (gesto, confiança suavizada) ou (None, 0.0).
+    """
+
+    def __init__(self, classes, agrupar_maos=True):
+        nomes = [nome_sem_mao(c) if agrupar_maos else c for c in map(str, classes)]
+        self.gestos = list(dict.fromkeys(nomes))
+        indice = {gesto: i for i, gesto in enumerate(self.gestos)}
+        self._grupo = np.array([indice[nome] for nome in nomes])
+        self.num_gestos = len(self.gestos)
+
+    def _agrupar(self, preds):
+        preds = np.asarray(preds, dtype=np.float32).reshape(-1)
+        return np.bincount(self._grupo, weights=preds, minlength=self.num_gestos)
+
+    def limpar(self):
+        raise NotImplementedError
+
+    def atualizar(self, preds):
+        raise NotImplementedError
+
+
+class SuavizadorMaioria(Suavizador):
+    """Votação nas últimas `janela` predições, cada voto com peso igual à
+    confiança (ou 1, sem `ponderado`). Contagens e somas de probabilidade
+    entram e saem do anel incrementalmente."""
+
+    nome = 'maioria'
+
+    def __init__(self, classes, janela=config.JANELA_SUAVIZACAO, ponderado=True, agrupar_maos=True):
+        super().__init__(classes, agrupar_maos)
+        self.janela = janela
+        self.ponderado = ponderado
+        self._probs = np.zeros((janela, self.num_gestos), dtype=np.float64)
+        self._votos = np.zeros(janela, dtype=np.int64)
+        self._pesos = np.zeros(janela, dtype=np.float64)
+        self.limpar()
+
+    def limpar(self):
+        self._contagem = np.zeros(self.num_gestos, dtype=np.float64)
+        self._soma_probs = np.zeros(self.num_gestos, dtype=np.float64)
+        self._pos = 0
+        self._n = 0
+
+    def atualizar(self, preds):
+        probs = self._agrupar(preds)
+        voto = int(np.argmax(probs))
+        peso = float(probs[voto]) if self.ponderado else 1.0
+
+        p = self._pos
+        if self._n == self.janela:  # Sai o mais antigo
+            self._contagem[self._votos[p]] -= self._pesos[p]
+            self._soma_probs -= self._probs[p]
+        else:
+            self._n += 1
+        self._votos[p], self._pesos[p] = voto, peso
+        self._probs[p] = probs
+        self._contagem[voto] += peso
+        self._soma_probs += probs
+        self._pos = (p + 1) % self.janela
+
+        gesto = int(np.argmax(self._contagem))
+        return self.gestos[gesto], float(self._soma_probs[gesto] / self._n)
+
+
+class SuavizadorEMA(Suavizador):
+    """Média exponencial das probabilidades: cada predição pesa `alfa`"""
+
+    nome = 'ema'
+
+    def __init__(self, classes, alfa=config.ALFA_SUAVIZACAO, agrupar_maos=True):
+        super().__init__(classes, agrupar_maos)
+        self.alfa = alfa
+        self.limpar()
+
+    def limpar(self):
+        self._media = None
+
+    def _atualizar_media(self, preds):
+        probs = self._agrupar(preds)
+        if self._media is None:
+            self._media = probs
+        else:
+            self._media += self.alfa * (probs - self._media)
+        return self._media
+
+    def atualizar(self, preds):
+        media = self._atualizar_media(preds)
+        gesto = int(np.argmax(media))
+        return self.gestos[gesto], float(media[gesto])
+
+
+class SuavizadorHisterese(SuavizadorEMA):
+    """EMA com dois limiares: um gesto só é aceito com média >= `entrar` e
+    continua aceito até cair abaixo de `sair`, evitando piscar na fronteira."""
+
+    nome = 'histerese'
+
+    def __init__(self, classes, alfa=config.ALFA_SUAVIZACAO, entrar=0.7, sair=0.4, agrupar_maos=True):
+        super().__init__(classes, alfa, agrupar_maos)
+        self.entrar = entrar
+        self.sair = sair
+
+    def limpar(self):
+        super().limpar()
+        self._atual = None
+
+    def atualizar(self, preds):
+        media = self._atualizar_media(preds)
+        if self._atual is not None and media[self._atual] < self.sair:
+            self._atual = None
+        melhor = int(np.argmax(media))
+        if melhor != self._atual and media[melhor] >= self.entrar:
+            self._atual = melhor
+        if self._atual is None:
+            return None, 0.0
+        return self.gestos[self._atual], float(media[self._atual])
+
+
+class DecisorAlvo(Suavizador):
+    """Aceite rápido quando já se sabe qual gesto é esperado.
+
+    Olha só a probabilidade do alvo e a margem sobre o segundo colocado:
+    aceita quando ambas passam de `confianca`/`margem` em `estabilidade`
+    predições seguidas. Serve também para janelas parciais, já que não
+    depende de votação acumulada.
+    """
+
+    def __init__(self, classes, confianca=config.ALVO_CONFIANCA, margem=config.ALVO_MARGEM,
+                 estabilidade=config.ALVO_ESTABILIDADE, agrupar_maos=True):
+        super().__init__(classes, agrupar_maos)
+        self.agrupar_maos = agrupar_maos
+        self.confianca = confianca
+        self.margem = margem
+        self.estabilidade = estabilidade
+        self._indice = {gesto: i for i, gesto in enumerate(self.gestos)}
+        self.limpar()
+
+    def limpar(self):
+        self._alvo = None
+        self._seguidas = 0
+
+    def atualizar(self, preds, alvo):
+        """True quando o alvo é aceito (zera a contagem se o alvo mudou)"""
+        alvo = self._indice.get(nome_sem_mao(alvo) if self.agrupar_maos else alvo)
+        if alvo != self._alvo:
+            self._alvo = alvo
+            self._seguidas = 0
+        if alvo is None:
+            return False
+        probs = self._agrupar(preds)
+        p_alvo = probs[alvo]
+        probs[alvo] = 0.0
+        if p_alvo >= self.confianca and p_alvo - probs.max() >= self.margem:
+            self._seguidas += 1
+        else:
+            self._seguidas = 0
+        return self._seguidas >= self.estabilidade
+
+
+SUAVIZADORES = {
+    SuavizadorMaioria.nome: SuavizadorMaioria,
+    SuavizadorEMA.nome: SuavizadorEMA,
+    SuavizadorHisterese.nome: SuavizadorHisterese,
+}
+
+
+def criar_suavizador(classes, estrategia=None, **kwargs):
+    """Instancia a estratégia escolhida (padrão: config.SUAVIZACAO)"""
+    estrategia = estrategia or config.SUAVIZACAO
+    if estrategia not in SUAVIZADORES:
+        raise ValueError(f"Suavização desconhecida: {estrategia} (opções: {', '.join(SUAVIZADORES)})")
+    return SUAVIZADORES[estrategia](classes, **kwargs)
@@ -0,0 +1,143 @@
+import re
+import time
+
+import numpy as np
+import tensorflow as tf
+
+from app.nucleo.caracteristicas import reamostrar, transformar
+from app.nucleo.metricas import pico_memoria_mb
+
+# Tamanho do modelo por representação: coordenadas normalizadas dispensam a
+# pilha grande, que só servia para aprender a ignorar posição e escala
+UNIDADES_PADRAO = {
+    'brutas': (128, 64),
+    'normalizadas': (64,),
+    'completas': (32,),
+}
+
+# Famílias de modelo (ver criar_modelo): recorrentes, convolução temporal e
+# MLP sobre média/máximo de cada valor ao longo da janela
+ARQUITETURAS = ('lstm', 'gru', 'conv', 'mlp')
+_ARQUITETURA = re.compile(r'^(?P<tipo>[a-z]+):(?P<unidades>\d+(?:,\d+)*)(?:@(?P<passos>\d+))?(?:/(?P<passo>\d+))?$')
+
+
+def ler_arquitetura(texto):
+    """'tipo:unidades[@passos][/passo]' -> dict, ex.: 'gru:64/2' (GRU de 64 sobre
+    frames alternados, janela de 30) ou 'lstm:64,32@15' (janela de 15 frames)"""
+    m = _ARQUITETURA.match(texto.strip())
+    if not m or m['tipo'] not in ARQUITETURAS:
+        raise ValueError(f"Arquitetura inválida: {texto} (formato tipo:unidades[@passos][/passo], "
+                         f"tipos: {', '.join(ARQUITETURAS)})")
+    return {
+        'nome': texto.strip(),
+        'tipo': m['tipo'],
+        'unidades': tuple(int(n) for n in m['unidades'].split(',')),
+        'passos': int(m['passos']) if m['passos'] else None,
+        'passo': int(m['passo'] or 1),
+    }
+
+
+def recortar_aleatorio(frames, passos, passo, rng):
+    """Como `reamostrar`, mas cada amostra começa em um frame sorteado entre os
+    que deixam a janela dentro do trecho com mãos: de uma amostra de 30
+    frames saem várias janelas curtas, como as que a janela deslizante vê
+    (reamostradas do mesmo jeito, até o último frame do recorte)"""
+    n, total, _ = frames.shape
+    extensao = passos * passo
+    # Frames com mãos: até o último não nulo (o coletor completa com zeros no fim)
+    com_maos = total - np.argmax(np.any(frames[:, ::-1] != 0, axis=2), axis=1)
+    maximo = np.clip(com_maos - extensao, 0, total - extensao)
+    inicio = (rng.random(n) * (maximo + 1)).astype(np.int64)
+    indices = inicio[:, None] + np.arange(passo - 1, extensao, passo)
+    return np.take_along_axis(frames, indices[:, :, None], axis=1)
+
+
+def criar_modelo(passos, largura, num_classes, unidades=(128, 64), densa=64, dropout=0.3, tipo='lstm'):
+    """Modelo `tipo` com `unidades` por camada + camada densa + softmax:
+    - lstm/gru: recorrentes empilhadas (Dropout entre elas)
+    - conv: Conv1D (núcleo 5) com MaxPool entre camadas e média global no fim
+    - mlp: média e máximo de cada valor na janela, seguidos de camadas densas
+    """
+    from tensorflow.keras import layers
+    entrada = layers.Input((passos, largura))
+    x = entrada
+    if tipo in ('lstm', 'gru'):
+        recorrente = layers.LSTM if tipo == 'lstm' else layers.GRU
+        for i, n in enumerate(unidades):
+            ultima = i == len(unidades) - 1
+            x = recorrente(n, return_sequences=not ultima)(x)
+            if not ultima:
+                x = layers.Dropout(dropout)(x)
+        x = layers.Dense(densa, activation='relu')(x)
+    elif tipo == 'conv':
+        for i, n in enumerate(unidades):
+            x = layers.Conv1D(n, 5, padding='same', activation='relu')(x)
+            if i < len(unidades) - 1:
+                x = layers.MaxPooling1D(2, padding='same')(x)
+        x = layers.GlobalAveragePooling1D()(x)
+        x = layers.Dense(densa, activation='relu')(x)
+    elif tipo == 'mlp':
+        x = layers.Concatenate()([layers.GlobalAveragePooling1D()(x), layers.GlobalMaxPooling1D()(x)])
+        for n in unidades:
+            x = layers.Dropout(dropout)(layers.Dense(n, activation='relu')(x))
+    else:
+        raise ValueError(f"Arquitetura desconhecida: {tipo} (opções: {', '.join(ARQUITETURAS)})")
+    saida = layers.Dense(num_classes, activation='softmax')(x)
+    modelo = tf.keras.Model(entrada, saida)
+    modelo.compile(optimizer='adam', loss='sparse_categorical_crossentropy', metrics=['accuracy'])
+    return modelo
+
+
+def criar_tf_dataset(frames, indices, rotulos, batch_size=32, embaralhar=True, caracteristicas='brutas',
+                     passos=None, passo=1):
+    """tf.data que lê lotes direto do memmap: só os índices ficam em memória.
+
+    Embaralha os índices (não as amostras), agrupa em lotes e busca cada lote
+    no memmap em paralelo com o treino, com prefetch. Cada lote lido é
+    convertido para `caracteristicas` (ver nucleo/caracteristicas.py) com a
+    mesma função usada na inferência e, com `passos`/`passo`, reamostrado no
+    tempo (ver reamostrar). Janelas mais curtas que as amostras são
+    recortadas em posição sorteada no treino e do início na validação.
+    """
+    exemplo = transformar(reamostrar(frames[:1], passos, passo), caracteristicas)
+    _, passos_modelo, largura = exemplo.shape
+    recortar = embaralhar and passos_modelo * passo < frames.shape[1]
+    rng = np.random.default_rng()
+
+    def ler_lote(indices_lote):
+        lote = np.asarray(frames[indices_lote])
+        if recortar:
+            return transformar(recortar_aleatorio(lote, passos_modelo, passo, rng), caracteristicas)
+        return transformar(reamostrar(lote[:, :passos_modelo * passo], passos, passo), caracteristicas)
+
+    def ler(indices_lote, rotulos_lote):
+        X = tf.numpy_function(ler_lote, [indices_lote], tf.float32)
+        X.set_shape((None, passos_modelo, largura))
+        return X, rotulos_lote
+
+    ds = tf.data.Dataset.from_tensor_slices((np.asarray(indices, dtype=np.int64),
+                                             np.asarray(rotulos)))
+    if embaralhar:
+        ds = ds.shuffle(len(indices), reshuffle_each_iteration=True)
+    return (ds.batch(batch_size)
+              .map(ler, num_parallel_calls=tf.data.AUTOTUNE)
+              .prefetch(tf.data.AUTOTUNE))
+
+
+class MonitorTreinamento(tf.keras.callbacks.Callback):
+    """Mostra amostras/segundo e pico de RSS ao fim de cada época"""
+
+    def __init__(self, amostras_por_epoca):
+        super().__init__()
+        self.amostras_por_epoca = amostras_por_epoca
+        self.historico = []
+
+    def on_epoch_begin(self, epoch, logs=None):
+        self._inicio = time.perf_counter()
+
+    def on_epoch_end(self, epoch, logs=None):
+        taxa = self.amostras_por_epoca / (time.perf_counter() - self._inicio)
+        pico = pico_memoria_mb()
+        self.historico.append({'amostras_s': taxa, 'pico_rss_mb': pico})
+        memoria = f"{pico:.0f}MB" if pico is not None else "indisponível"
+        print(f"  ⏱️ {taxa:,.0f} amostras/s | pico de RSS: {memoria}")
@@ -1,21 +1,45 @@
+import argparse
 import cv2
-import numpy as np
-from tensorflow.keras.models import load_model
-import joblib
-from collections import deque, defaultdict
+import sys
+import time
 import mediapipe as mp
 from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from app.nucleo import config
+from app.nucleo.estatico import AceiteEstatico, carregar_estatico
+from app.nucleo.fontes import adicionar_argumentos_fonte, fonte_dos_argumentos
+from app.nucleo.inferencia import carregar_rotulador, criar_motor
+from app.nucleo.janela import JanelaCircular
+from app.nucleo.landmarks import ExtratorLandmarks
+from app.nucleo.mascara import MascaraClasses
+from app.nucleo.roi import RastreadorROI
+from app.nucleo.suavizacao import criar_suavizador
+
 # Configurações
-MODEL_PATH = Path('modelos/modelo_gestos.h5')
-LABEL_PATH = Path('modelos/rotulador_gestos.pkl')
-SEQUENCE_LENGTH = 30
+MODEL_PATH = config.MODEL_PATH
+LABEL_PATH = config.LABEL_PATH
 MIN_CONFIDENCE = 0.7
 RESET_THRESHOLD = 10  # Frames sem mãos para resetar
 
-# Inicialização
-model = load_model(MODEL_PATH)
-le = joblib.load(LABEL_PATH)
+parser = adicionar_argumentos_fonte(argparse.ArgumentParser(description="Reconhecimento de gestos"))
+parser.add_argument('--sem-janela', action='store_true', help="Não abre janela (execução headless)")
+parser.add_argument('--classes', nargs='+', default=None,
+                    help="Só reconhece estes gestos (ex.: --classes A E I O U)")
+parser.add_argument('--excluir', nargs='+', default=list(config.CLASSES_EXCLUIDAS),
+                    help="Gestos ignorados (padrão: LIA_CLASSES_EXCLUIDAS)")
+parser.add_argument('--roi', action='store_true', default=config.ROI,
+                    help="Detecta só na região das mãos do frame anterior (ou LIA_ROI=1)")
+args = parser.parse_args()
+
+# Inicialização (backend escolhido por config.BACKEND_INFERENCIA / LIA_BACKEND)
+model = criar_motor(caminho_modelo=MODEL_PATH)
+streaming = getattr(model, 'streaming', False)  # Um passo de LSTM por frame
+SEQUENCE_LENGTH = model.tamanho_sequencia  # Frames por janela, dos metadados do modelo
+le = carregar_rotulador(model, LABEL_PATH)  # Classes do índice, se LIA_BACKEND=indice
+# Gestos parados são aceitos pelo classificador de um frame (LIA_ESTATICO); o
+# modelo de sequência fica com os demais
+estatico = carregar_estatico(le.classes_)
 mp_hands = mp.solutions.hands
 hands = mp_hands.Hands(
     static_image_mode=False,
@@ -23,51 +47,58 @@ hands = mp_hands.Hands(
     min_detection_confidence=0.7,
     min_tracking_confidence=0.5
 )
+detectar = RastreadorROI(hands.process, resetar=hands.reset) if args.roi else hands.process
 
 # Variáveis de estado
-buffer = deque(maxlen=SEQUENCE_LENGTH)
-frames_sem_maos = 0
-historico_predicoes = deque(maxlen=15)  # Suavização
+buffer = JanelaCircular(SEQUENCE_LENGTH, reset_threshold=RESET_THRESHOLD)  # Anel float32 pré-alocado
+suavizador = criar_suavizador(le.classes_, agrupar_maos=False)  # Estratégia em config.SUAVIZACAO
+mascara = MascaraClasses(le.classes_, permitidas=args.classes, excluidas=args.excluir)
+aceite_estatico = AceiteEstatico(estatico) if estatico is not None else None
 ultimo_gesto = None
+preds_streaming = None
 
-cap = cv2.VideoCapture(0)
-
-def processar_landmarks(results):
-    """Processa landmarks e retorna array padronizado"""
-    landmarks = []
-    if results.multi_hand_landmarks:
-        for hand in results.multi_hand_landmarks:
-            landmarks.extend([[lm.x, lm.y, lm.z] for lm in hand.landmark])
-    
-    # Padroniza para 2 mãos (42 landmarks)
-    landmarks = landmarks[:42]
-    if len(landmarks) < 42:
-        landmarks.extend([[0,0,0]] * (42 - len(landmarks)))
-    
-    return np.array(landmarks).flatten()
+cap = fonte_dos_argumentos(args)
+extrator = ExtratorLandmarks()  # Buffer float32 (42, 3) reutilizado a cada frame
 
 print("\n=== RECONHECIMENTO DE GESTOS ===")
-print(f"Gestos carregados: {', '.join(le.classes_)}")
+print(f"Gestos carregados: {', '.join(mascara.permitidas)}")
+if estatico is not None:
+    print(f"Estáticos (um frame): {', '.join(sorted(estatico.estaticos))}")
 print("Pressione ESC para sair\n")
 
+frames_processados = 0
+inicio = time.perf_counter()
 while cap.isOpened():
     ret, frame = cap.read()
     if not ret:
         continue
 
     frame = cv2.flip(frame, 1)
-    results = hands.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+    # Landmarks gravados já trazem o resultado da detecção
+    results = cap.resultado if cap.resultado is not None else detectar(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+    frames_processados += 1
 
     # Reset se não detectar mãos por muitos frames
     if not results.multi_hand_landmarks:
-        frames_sem_maos += 1
-        if frames_sem_maos > RESET_THRESHOLD and buffer:
-            buffer.clear()
+        if buffer.registrar_sem_maos():
+            if streaming:
+                model.resetar()
+            if aceite_estatico is not None:
+                aceite_estatico.limpar()
             print("▶️ Buffer resetado (mãos não detectadas)")
     else:
-        frames_sem_maos = 0
-        landmarks = processar_landmarks(results)
-        buffer.append(landmarks)
+        landmarks = extrator.extrair(results)
+        buffer.adicionar(landmarks)
+        preds_streaming = model.passo(landmarks) if streaming else None
+        gesto_estatico = None
+        if aceite_estatico is not None:
+            gesto_estatico = aceite_estatico.atualizar(mascara.aplicar(estatico.prever(landmarks)))
+        if gesto_estatico is not None and gesto_estatico != ultimo_gesto:
+            ultimo_gesto = gesto_estatico
+            print(f"Gesto reconhecido: {gesto_estatico} (estático)")
+            buffer.limpar()
+            if streaming:
+                model.resetar()
 
         # Desenha landmarks
         for hand_landmarks in results.multi_hand_landmarks:
@@ -78,27 +109,24 @@ while cap.isOpened():
             )
 
     # Reconhecimento quando buffer cheio
-    if len(buffer) == SEQUENCE_LENGTH:
-        entrada = np.array(buffer).reshape(1, SEQUENCE_LENGTH, 126)
-        preds = model.predict(entrada, verbose=0)[0]
-        classe_idx = np.argmax(preds)
-        confianca = preds[classe_idx]
-
-        if confianca >= MIN_CONFIDENCE:
-            gesto_atual = le.classes_[classe_idx]
-            historico_predicoes.append(gesto_atual)
-
-            # Suavização por votação majoritária
-            contagem = defaultdict(int)
-            for g in historico_predicoes:
-                contagem[g] += 1
-            gesto_final = max(contagem.items(), key=lambda x: x[1])[0]
-
+    if buffer.cheia and (not streaming or preds_streaming is not None):
+        if streaming:
+            preds = preds_streaming
+            preds_streaming = None
+        else:
+            preds = model.prever(buffer.janela())  # View (1, janela, 126), sem cópia
+        gesto_final, confianca = suavizador.atualizar(mascara.aplicar(preds))
+
+        # Com o classificador estático, a sequência só decide os gestos com movimento
+        dinamico = estatico is None or not estatico.eh_estatico(gesto_final)
+        if gesto_final is not None and confianca >= MIN_CONFIDENCE and dinamico:
             # Só atualiza se for um gesto novo
             if gesto_final != ultimo_gesto:
                 ultimo_gesto = gesto_final
                 print(f"Gesto reconhecido: {gesto_final} ({confianca:.0%})")
-                buffer.clear()  # Reset após reconhecimento
+                buffer.limpar()  # Reset após reconhecimento
+                if streaming:
+                    model.resetar()
 
     # Exibe informações
     cv2.putText(frame, f"Buffer: {len(buffer)}/{SEQUENCE_LENGTH}", (10, 30), 
@@ -107,9 +135,13 @@ while cap.isOpened():
         cv2.putText(frame, f"Ultimo: {ultimo_gesto}", (10, 60), 
                    cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
 
+    if args.sem_janela:
+        continue
     cv2.imshow("Reconhecimento de Gestos", frame)
     if cv2.waitKey(1) == 27:
         break
 
+duracao = time.perf_counter() - inicio
 cap.release()
-cv2.destroyAllWindows()
\ No newline at end of file
+cv2.destroyAllWindows()
+print(f"\nFrames processados: {frames_processados} em {duracao:.1f}s ({frames_processados / duracao:.1f} FPS)")
\ No newline at end of file
@@ -0,0 +1,206 @@
+import argparse
+import json
+import queue
+import sys
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from app.nucleo import config
+from app.nucleo.inferencia import MotorLote
+from app.nucleo.remoto import ROTA_INFO, ROTA_METRICAS, ROTA_PREVER
+
+
+class Pedido:
+    """Janela de um cliente aguardando a vez no lote"""
+
+    __slots__ = ('entrada', 'probs', 'erro', 'pronto')
+
+    def __init__(self, entrada):
+        self.entrada = entrada
+        self.probs = None
+        self.erro = None
+        self.pronto = threading.Event()
+
+
+class LoteDinamico:
+    """Junta pedidos concorrentes em lotes de até `lote_maximo` janelas.
+
+    O primeiro pedido abre o lote; os que chegarem em até `espera_maxima`
+    segundos entram nele. Cada cliente tem no máximo um pedido em curso, então
+    o lote nunca espera por mais janelas do que há clientes conectados: um
+    cliente sozinho é atendido na hora, e com muitos clientes o lote enche
+    antes do prazo e uma passada do modelo atende todos.
+    """
+
+    def __init__(self, motor, lote_maximo=config.LOTE_MAXIMO, espera_maxima=config.ESPERA_LOTE_MS / 1000):
+        self.motor = motor
+        self.lote_maximo = lote_maximo
+        self.espera_maxima = espera_maxima
+        self._fila = queue.Queue()
+        self._lock = threading.Lock()
+        self.tamanhos_lote = Counter()
+        self.tempo_inferencia = 0.0
+        self.clientes = 0
+        threading.Thread(target=self._loop, daemon=True).start()
+
+    def registrar_cliente(self, delta):
+        with self._lock:
+            self.clientes += delta
+
+    def prever(self, entrada):
+        """Bloqueia até o lote com esta janela ser processado"""
+        pedido = Pedido(entrada)
+        self._fila.put(pedido)
+        pedido.pronto.wait()
+        if pedido.erro is not None:
+            raise pedido.erro
+        return pedido.probs
+
+    def _loop(self):
+        while True:
+            lote = [self._fila.get()]
+            prazo = time.perf_counter() + self.espera_maxima
+            while len(lote) < min(self.lote_maximo, self.clientes):
+                restante = prazo - time.perf_counter()
+                try:
+                    lote.append(self._fila.get(timeout=restante) if restante > 0 else self._fila.get_nowait())
+                except queue.Empty:
+                    break
+
+            inicio = time.perf_counter()
+            try:
+                probs = self.motor.prever_lote(np.stack([pedido.entrada for pedido in lote]))
+            except Exception as e:
+                probs = [None] * len(lote)
+                for pedido in lote:
+                    pedido.erro = e
+            with self._lock:
+                self.tamanhos_lote[len(lote)] += 1
+                self.tempo_inferencia += time.perf_counter() - inicio
+            for pedido, prob in zip(lote, probs):
+                pedido.probs = prob
+                pedido.pronto.set()
+
+    def metricas(self):
+        with self._lock:
+            lotes = sum(self.tamanhos_lote.values())
+            pedidos = sum(tamanho * n for tamanho, n in self.tamanhos_lote.items())
+            return {
+                'pedidos': pedidos,
+                'lotes': lotes,
+                'tamanho_medio_lote': pedidos / lotes if lotes else 0.0,
+                'inferencia_media_ms': self.tempo_inferencia / lotes * 1000 if lotes else 0.0,
+                'clientes_conectados': self.clientes,
+                'histograma_lotes': {str(t): n for t, n in sorted(self.tamanhos_lote.items())},
+            }
+
+
+def criar_handler(lote, classes):
+    motor = lote.motor
+    tamanho_janela = motor.tamanho_sequencia * motor.largura * 4
+    info = {
+        'tamanho_sequencia': motor.tamanho_sequencia,
+        'largura': motor.largura,
+        'classes': classes,
+        'lote_maximo': lote.lote_maximo,
+        'espera_maxima_ms': lote.espera_maxima * 1000,
+    }
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'  # Conexões persistentes entre pedidos
+        # Cabeçalho e corpo saem em escritas separadas; sem TCP_NODELAY o
+        # Nagle + ACK atrasado somam ~40ms a cada resposta
+        disable_nagle_algorithm = True
+
+        def setup(self):
+            super().setup()
+            lote.registrar_cliente(1)
+
+        def finish(self):
+            lote.registrar_cliente(-1)
+            super().finish()
+
+        def _responder(self, status, dados):
+            corpo = json.dumps(dados, ensure_ascii=False).encode()
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(corpo)))
+            self.end_headers()
+            self.wfile.write(corpo)
+
+        def do_GET(self):
+            if self.path == ROTA_INFO:
+                self._responder(200, info)
+            elif self.path == ROTA_METRICAS:
+                self._responder(200, lote.metricas())
+            else:
+                self._responder(404, {'erro': 'rota desconhecida'})
+
+        def do_POST(self):
+            corpo = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+            if self.path != ROTA_PREVER:
+                self._responder(404, {'erro': 'rota desconhecida'})
+                return
+            if len(corpo) != tamanho_janela:
+                self._responder(400, {'erro': f'esperados {tamanho_janela} bytes (float32 '
+                                              f'{motor.tamanho_sequencia}x{motor.largura})'})
+                return
+            entrada = np.frombuffer(corpo, dtype=np.float32).reshape(motor.tamanho_sequencia, motor.largura)
+            try:
+                probs = lote.prever(entrada)
+            except Exception as e:
+                self._responder(500, {'erro': str(e)})
+                return
+            indice = int(np.argmax(probs))
+            self._responder(200, {
+                'classe': classes[indice] if classes else indice,
+                'indice': indice,
+                'confianca': float(probs[indice]),
+                'probs': probs.tolist(),
+            })
+
+        def log_message(self, formato, *args):
+            pass  # Um log por pedido custaria mais que a inferência
+
+    return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Servidor de reconhecimento com lotes dinâmicos")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--porta', type=int, default=8765)
+    parser.add_argument('--modelo', type=Path, default=config.MODEL_PATH)
+    parser.add_argument('--rotulos', type=Path, default=config.LABEL_PATH)
+    parser.add_argument('--lote-maximo', type=int, default=config.LOTE_MAXIMO)
+    parser.add_argument('--espera-ms', type=float, default=config.ESPERA_LOTE_MS,
+                        help="Quanto o primeiro pedido espera por outros para formar o lote")
+    args = parser.parse_args()
+
+    print("=== SERVIDOR DE RECONHECIMENTO ===")
+    motor = MotorLote(args.modelo, args.lote_maximo)
+    classes = []
+    if args.rotulos.exists():
+        import joblib
+        classes = [str(c) for c in joblib.load(args.rotulos).classes_]
+
+    lote = LoteDinamico(motor, args.lote_maximo, args.espera_ms / 1000)
+    servidor = ThreadingHTTPServer((args.host, args.porta), criar_handler(lote, classes))
+    servidor.daemon_threads = True
+    print(f"✅ Ouvindo em http://{args.host}:{args.porta} "
+          f"(lote até {args.lote_maximo}, espera {args.espera_ms:g}ms)")
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\n⏹️ Encerrado | {lote.metricas()}")
+    finally:
+        servidor.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from app.nucleo import config
+from app.nucleo.dataset import ArmazemGestos
+from app.nucleo.inferencia import MotorKeras, MotorTFLite, caminho_tflite, exportar_tflite
+
+VARIANTES = ['fp32', 'fp16', 'int8']
+
+
+def carregar_janelas(caminho_dados, limite, semente=0):
+    """Sorteia até `limite` amostras do dataset coletado (N, passos, 126)"""
+    frames = ArmazemGestos(caminho_dados).frames()
+    if len(frames) == 0:
+        raise FileNotFoundError(f"Nenhuma amostra em {caminho_dados}")
+    rng = np.random.default_rng(semente)
+    indices = rng.permutation(len(frames))[:limite]
+    return np.array(frames[indices])
+
+
+def medir_latencia(motor, janelas, repeticoes):
+    """Latência por chamada (ms), após aquecimento"""
+    for janela in janelas[:10]:
+        motor.prever(janela[None])
+    tempos = []
+    for i in range(repeticoes):
+        inicio = time.perf_counter()
+        motor.prever(janelas[i % len(janelas)][None])
+        tempos.append((time.perf_counter() - inicio) * 1000)
+    return {'media_ms': float(np.mean(tempos)),
+            'p50_ms': float(np.percentile(tempos, 50)),
+            'p95_ms': float(np.percentile(tempos, 95))}
+
+
+def comparar(probs, referencia):
+    """Concordância top-1 e deriva de confiança em relação ao Keras"""
+    classes_ref = referencia.argmax(axis=1)
+    linhas = np.arange(len(referencia))
+    deriva = np.abs(probs[linhas, classes_ref] - referencia[linhas, classes_ref])
+    return {
+        'concordancia_top1': float((probs.argmax(axis=1) == classes_ref).mean()),
+        'deriva_confianca_media': float(deriva.mean()),
+        'deriva_confianca_max': float(deriva.max()),
+        'diferenca_prob_max': float(np.abs(probs - referencia).max()),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Exporta o modelo para TFLite (fp32/fp16/int8) e gera relatório de paridade")
+    parser.add_argument('--modelo', type=Path, default=config.MODEL_PATH)
+    parser.add_argument('--dados', type=Path, default=config.DATASET_PATH)
+    parser.add_argument('--variantes', nargs='+', default=VARIANTES, choices=VARIANTES)
+    parser.add_argument('--amostras-calibracao', type=int, default=200)
+    parser.add_argument('--amostras-avaliacao', type=int, default=1000)
+    parser.add_argument('--repeticoes', type=int, default=300)
+    parser.add_argument('--relatorio', type=Path, default=Path('modelos/relatorio_tflite.json'))
+    args = parser.parse_args()
+
+    print("=== EXPORTAÇÃO TFLITE ===")
+    inicio = time.perf_counter()
+    keras = MotorKeras(args.modelo)
+    carga_keras = time.perf_counter() - inicio
+
+    total = args.amostras_calibracao + args.amostras_avaliacao
+    janelas = carregar_janelas(args.dados, total)
+    calibracao = janelas[:args.amostras_calibracao]
+    avaliacao = janelas[args.amostras_calibracao:] if len(janelas) > args.amostras_calibracao else janelas
+    print(f"Amostras: {len(calibracao)} para calibração, {len(avaliacao)} para avaliação")
+
+    referencia = keras.modelo.predict(keras.preparar(avaliacao), batch_size=64, verbose=0)
+    relatorio = {
+        'keras': {
+            'arquivo': str(args.modelo),
+            'tamanho_bytes': args.modelo.stat().st_size,
+            'carga_s': carga_keras,
+            'latencia': medir_latencia(keras, avaliacao, args.repeticoes),
+        }
+    }
+
+    for variante in args.variantes:
+        destino = caminho_tflite(args.modelo, variante)
+        quantizacao = None if variante == 'fp32' else variante
+        exportar_tflite(args.modelo, destino, quantizacao, representativas=calibracao)
+
+        inicio = time.perf_counter()
+        motor = MotorTFLite(destino, args.modelo)
+        carga = time.perf_counter() - inicio
+
+        probs = np.array([motor.prever(janela[None]) for janela in avaliacao])
+        relatorio[variante] = {
+            'arquivo': str(destino),
+            'tamanho_bytes': destino.stat().st_size,
+            'carga_s': carga,
+            'latencia': medir_latencia(motor, avaliacao, args.repeticoes),
+            **comparar(probs, referencia),
+        }
+
+    args.relatorio.write_text(json.dumps(relatorio, indent=2, ensure_ascii=False))
+
+    print(f"\n{'variante':>8} | {'tamanho':>9} | {'carga':>6} | {'latência':>9} | {'top-1':>6} | deriva média/máx")
+    for nome, dados in relatorio.items():
+        linha = (f"{nome:>8} | {dados['tamanho_bytes'] / 1024:7.0f}KB | {dados['carga_s']:5.2f}s | "
+                 f"{dados['latencia']['media_ms']:7.3f}ms")
+        if 'concordancia_top1' in dados:
+            linha += (f" | {dados['concordancia_top1']:6.1%} | "
+                      f"{dados['deriva_confianca_media']:.4f}/{dados['deriva_confianca_max']:.4f}")
+        print(linha)
+    print(f"\n✅ Relatório salvo em: {args.relatorio}")
+    print("Use LIA_BACKEND=tflite LIA_TFLITE=<variante> para carregar a variante no app")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from app.nucleo import config
+from app.nucleo.dataset import ArmazemGestos
+from app.nucleo.indice import EMBEDDINGS, EmbeddingLandmarks, IndiceGestos, criar_embedding, embutir
+
+
+def amostras_do_gesto(frames, nomes, gesto):
+    """Frames das amostras de `gesto` no dataset (sem mínimo de amostras)"""
+    indices = np.flatnonzero(nomes == gesto)
+    return np.asarray(frames[indices])
+
+
+def construir(frames, nomes, embedding):
+    """Índice com todas as amostras do dataset"""
+    if isinstance(embedding, EmbeddingLandmarks):
+        embedding.ajustar(frames)
+    vetores = embutir(embedding, frames)
+    indice = IndiceGestos(embedding.dimensao, capacidade=max(len(vetores), 1024))
+    for gesto in np.unique(nomes):
+        indice.adicionar(str(gesto), vetores[nomes == gesto])
+    return indice
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cadastra e remove gestos do índice de vizinhos mais próximos "
+                                                 "(backend 'indice'), sem retreinar o modelo")
+    parser.add_argument('--dataset', type=Path, default=config.DATASET_PATH)
+    parser.add_argument('--modelo', type=Path, default=config.MODEL_PATH)
+    parser.add_argument('--indice', type=Path, default=config.INDICE_PATH)
+    parser.add_argument('--construir', action='store_true', help="Recria o índice com todo o dataset")
+    parser.add_argument('--embedding', default=config.EMBEDDING_INDICE, choices=EMBEDDINGS,
+                        help="Na construção: penúltima camada do modelo ou landmarks normalizados (padrão: "
+                             "LIA_EMBEDDING)")
+    parser.add_argument('--adicionar', nargs='+', default=[], metavar='GESTO',
+                        help="(Re)cadastra as amostras destes gestos que estão no dataset (ex.: após coletar_gestos.py)")
+    parser.add_argument('--remover', nargs='+', default=[], metavar='GESTO', help="Tira estes gestos do índice")
+    args = parser.parse_args()
+
+    if not args.construir and not args.indice.exists():
+        parser.error(f"{args.indice} não existe: use --construir")
+
+    print("=== ÍNDICE DE GESTOS ===")
+    if args.construir or args.adicionar:
+        frames, nomes, _ = ArmazemGestos(args.dataset).carregar()
+
+    if args.construir:
+        inicio = time.perf_counter()
+        embedding = criar_embedding(args.embedding, args.modelo)
+        indice = construir(frames, nomes, embedding)
+        print(f"Construído com {len(indice)} amostras em {time.perf_counter() - inicio:.1f}s "
+              f"(embedding: {embedding.nome}, {embedding.dimensao} valores)")
+    else:
+        indice, embedding = IndiceGestos.carregar(args.indice, args.modelo)
+
+    for gesto in args.adicionar:
+        janelas = amostras_do_gesto(frames, nomes, gesto)
+        if not len(janelas):
+            print(f"⚠️ Nenhuma amostra de {gesto} em {args.dataset}")
+            continue
+        vetores = embedding(janelas)
+        inicio = time.perf_counter()
+        indice.remover(gesto)
+        indice.adicionar(gesto, vetores)
+        print(f"➕ {gesto}: {len(janelas)} amostras em {(time.perf_counter() - inicio) * 1000:.2f}ms")
+
+    for gesto in args.remover:
+        inicio = time.perf_counter()
+        removidas = indice.remover(gesto)
+        if removidas:
+            print(f"➖ {gesto}: {removidas} amostras em {(time.perf_counter() - inicio) * 1000:.2f}ms")
+        else:
+            print(f"⚠️ {gesto} não está no índice")
+
+    args.indice.parent.mkdir(exist_ok=True)
+    indice.salvar(args.indice, embedding)
+    contagens = indice.contagens()
+    print(f"\n✅ Índice salvo em: {args.indice} ({len(indice)} amostras, {len(contagens)} gestos)")
+    print(", ".join(f"{gesto} ({n})" for gesto, n in contagens.items()))
+    print("Para reconhecer com ele: LIA_BACKEND=indice")
+
+
+if __name__ == "__main__":
+    main()
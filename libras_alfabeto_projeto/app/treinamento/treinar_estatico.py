@@ -0,0 +1,117 @@
+import argparse
+import sys
+from pathlib import Path
+
+import joblib
+import numpy as np
+from sklearn.model_selection import train_test_split
+from sklearn.neural_network import MLPClassifier
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from app.nucleo import config
+from app.nucleo.caracteristicas import TIPOS, transformar
+from app.nucleo.dataset import ArmazemGestos
+from app.nucleo.suavizacao import nome_sem_mao
+
+MIN_AMOSTRAS = 15  # Como em treinar_modelo_gestos.py
+LOTE = 256  # Amostras lidas do memmap por vez
+
+
+def frames_com_maos(frames, indices, rotulos, caracteristicas):
+    """Frames com alguma mão das amostras `indices`, já convertidos, e o rótulo de cada um"""
+    ordem = np.argsort(indices)  # Leitura do memmap em ordem
+    indices, rotulos = indices[ordem], rotulos[ordem]
+    x, y = [], []
+    for inicio in range(0, len(indices), LOTE):
+        brutos = np.asarray(frames[indices[inicio:inicio + LOTE]])
+        com_maos = np.any(brutos != 0, axis=-1)
+        x.append(transformar(brutos[com_maos], caracteristicas))
+        y.append(np.repeat(rotulos[inicio:inicio + LOTE], com_maos.sum(axis=1)))
+    return np.concatenate(x), np.concatenate(y)
+
+
+def metricas_por_classe(y_real, y_previsto, num_classes):
+    """(precisão, revocação) por classe, frame a frame"""
+    acertos = np.bincount(y_real[y_real == y_previsto], minlength=num_classes)
+    previstos = np.bincount(y_previsto, minlength=num_classes)
+    reais = np.bincount(y_real, minlength=num_classes)
+    return acertos / np.maximum(previstos, 1), acertos / np.maximum(reais, 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Treina o classificador de um frame para os gestos parados")
+    parser.add_argument('--dataset', type=Path, default=config.DATASET_PATH)
+    parser.add_argument('--rotulos', type=Path, default=config.LABEL_PATH,
+                        help="Rotulador do modelo de sequência (mesmas classes)")
+    parser.add_argument('--saida', type=Path, default=config.ESTATICO_PATH)
+    parser.add_argument('--caracteristicas', default='completas', choices=TIPOS)
+    parser.add_argument('--unidades', type=int, nargs='+', default=[64])
+    parser.add_argument('--limiar', type=float, default=0.9,
+                        help="Precisão e revocação por frame mínimas para um gesto ser tratado como estático")
+    parser.add_argument('--dinamicos', nargs='*', default=list(config.GESTOS_DINAMICOS),
+                        help="Gestos com movimento, nunca estáticos (padrão: LIA_GESTOS_DINAMICOS)")
+    parser.add_argument('--semente', type=int, default=0)
+    args = parser.parse_args()
+
+    print("=== TREINAMENTO DO CLASSIFICADOR ESTÁTICO ===")
+    frames, nomes, _ = ArmazemGestos(args.dataset).carregar()
+    classes = [str(c) for c in joblib.load(args.rotulos).classes_]
+    indice = {c: i for i, c in enumerate(classes)}
+    gestos, contagens = np.unique(nomes, return_counts=True)
+    validos = np.flatnonzero(np.isin(nomes, gestos[contagens >= MIN_AMOSTRAS]) &
+                             np.isin(nomes, classes))
+    rotulos = np.array([indice[str(n)] for n in nomes[validos]])
+
+    # Divisão por amostra: frames da mesma gravação não ficam dos dois lados
+    idx_treino, idx_teste, y_treino, y_teste = train_test_split(
+        validos, rotulos, test_size=0.2, random_state=args.semente, stratify=rotulos)
+    x_treino, y_treino = frames_com_maos(frames, idx_treino, y_treino, args.caracteristicas)
+    x_teste, y_teste = frames_com_maos(frames, idx_teste, y_teste, args.caracteristicas)
+    media = x_treino.mean(axis=0)
+    escala = np.maximum(x_treino.std(axis=0), 1e-6)
+    print(f"Frames com mãos: {len(x_treino)} treino | {len(x_teste)} validação | "
+          f"características: {args.caracteristicas}")
+
+    modelo = MLPClassifier(hidden_layer_sizes=tuple(args.unidades), activation='relu',
+                           early_stopping=True, max_iter=200, random_state=args.semente)
+    modelo.fit((x_treino - media) / escala, y_treino)
+    previsto = modelo.predict((x_teste - media) / escala)
+    precisao, revocacao = metricas_por_classe(y_teste, previsto, len(classes))
+
+    # Um gesto é estático se um frame basta para reconhecê-lo e separá-lo dos outros
+    dinamicos = {nome_sem_mao(g) for g in args.dinamicos}
+    por_gesto = {}
+    for i, classe in enumerate(classes):
+        if i in y_teste:
+            por_gesto.setdefault(nome_sem_mao(classe), []).append(i)
+    estaticos = sorted(g for g, idx in por_gesto.items()
+                       if g not in dinamicos
+                       and min(precisao[idx].min(), revocacao[idx].min()) >= args.limiar)
+
+    print(f"\n{'classe':<16} {'precisão':>9} {'revocação':>10}  tipo")
+    for i, classe in enumerate(classes):
+        if i not in y_teste:
+            continue
+        gesto = nome_sem_mao(classe)
+        tipo = 'estático' if gesto in estaticos else ('dinâmico' if gesto in dinamicos else 'sequência')
+        print(f"{classe:<16} {precisao[i]:>9.1%} {revocacao[i]:>10.1%}  {tipo}")
+
+    args.saida.parent.mkdir(exist_ok=True)
+    joblib.dump({
+        'modelo': modelo,
+        'classes': [classes[c] for c in modelo.classes_],
+        'estaticos': estaticos,
+        'caracteristicas': args.caracteristicas,
+        'media': media,
+        'escala': escala,
+        'metricas': {classes[i]: {'precisao': float(precisao[i]), 'revocacao': float(revocacao[i])}
+                     for i in np.unique(y_teste)},
+    }, args.saida)
+    print(f"\n✅ Classificador salvo em: {args.saida}")
+    print(f"Acurácia por frame: {np.mean(previsto == y_teste):.2%}")
+    print(f"Gestos estáticos ({len(estaticos)}): {', '.join(estaticos) or 'nenhum'}")
+    print("Os demais seguem no modelo de sequência")
+
+
+if __name__ == "__main__":
+    main()
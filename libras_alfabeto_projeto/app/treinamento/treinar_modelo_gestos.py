@@ -1,85 +1,222 @@
-import pandas as pd
 import numpy as np
+import argparse
+import json
+import sys
+import tempfile
 from sklearn.preprocessing import LabelEncoder
-from tensorflow.keras.models import Sequential
-from tensorflow.keras.layers import LSTM, Dense, Dropout
 from sklearn.model_selection import train_test_split
 import joblib
 from pathlib import Path
-import ast
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from app.nucleo import config
+from app.nucleo.caracteristicas import TIPOS, largura_caracteristicas
+from app.nucleo.dataset import ArmazemGestos
+from app.nucleo.metadados import salvar_metadados
+from app.nucleo.metricas import mediana_ms, pico_memoria_mb
+from app.nucleo.treino import UNIDADES_PADRAO, MonitorTreinamento, criar_modelo, criar_tf_dataset, ler_arquitetura
 
 # Configurações
-CSV_PATH = Path('dados/gestos_libras.csv')
+DATASET_PATH = config.DATASET_PATH
 MODEL_DIR = Path('modelos')
 MODEL_DIR.mkdir(exist_ok=True)
-SEQUENCE_LENGTH = 30
+SEQUENCE_LENGTH = config.SEQUENCE_LENGTH  # Frames por amostra; a janela do modelo vai nos metadados
 MIN_AMOSTRAS = 15
+BATCH_SIZE = 32
+CARACTERISTICAS = config.CARACTERISTICAS  # Mesma conversão na inferência, via metadados
+
+# Arquiteturas da varredura (--varredura sem argumentos); formato em treino.ler_arquitetura
+VARREDURA_PADRAO = [
+    'lstm:128,64', 'lstm:64', 'lstm:32', 'gru:64', 'gru:32',
+    'conv:64,64', 'conv:32', 'mlp:128', 'mlp:64',
+    'lstm:64/2', 'gru:32/2', 'conv:32/2', 'lstm:64@15', 'gru:32@15', 'mlp:64@15',
+]
+
 
 def carregar_dados():
-    """Carrega e valida os dados garantindo shape consistente"""
-    df = pd.read_csv(CSV_PATH)
-    df['frames'] = df['frames'].apply(ast.literal_eval)
-    
+    """Abre o dataset binário como memmap e seleciona as amostras dos gestos válidos.
+
+    Retorna (frames memmap (N, 30, 126), índices das amostras válidas, nomes);
+    os frames só são lidos do disco lote a lote durante o treino.
+    """
+    armazem = ArmazemGestos(DATASET_PATH)
+    if not armazem.existe():
+        raise FileNotFoundError(f"Dataset não encontrado em {DATASET_PATH}")
+    frames, nomes, _ = armazem.carregar()
+
     # Filtra gestos com poucas amostras
-    contagens = df['nome'].value_counts()
-    gestos_validos = contagens[contagens >= MIN_AMOSTRAS].index
-    df = df[df['nome'].isin(gestos_validos)]
-    
-    # Garante shape (30, 126)
-    X = []
-    for frames in df['frames']:
-        arr = np.array(frames)
-        if arr.shape != (SEQUENCE_LENGTH, 126):
-            arr = np.pad(arr, ((0, SEQUENCE_LENGTH - arr.shape[0]), (0, 0)), 
-                        mode='constant')
-        X.append(arr)
-    
-    return np.array(X), df['nome'].values
-
-# Main
-print("=== TREINAMENTO DE MODELO ===")
-try:
-    X, y = carregar_dados()
-    
-    # Codificação
-    le = LabelEncoder()
-    y_encoded = le.fit_transform(y)
-
-    # Modelo LSTM
-    model = Sequential([
-        LSTM(128, input_shape=(SEQUENCE_LENGTH, 126), return_sequences=True),
-        Dropout(0.3),
-        LSTM(64),
-        Dense(64, activation='relu'),
-        Dense(len(le.classes_), activation='softmax')
-    ])
-
-    model.compile(
-        optimizer='adam',
-        loss='sparse_categorical_crossentropy',
-        metrics=['accuracy']
-    )
+    gestos, contagens = np.unique(nomes, return_counts=True)
+    validos = np.flatnonzero(np.isin(nomes, gestos[contagens >= MIN_AMOSTRAS]))
+
+    return frames, validos, nomes[validos]
 
-    # Treinamento
-    X_train, X_test, y_train, y_test = train_test_split(X, y_encoded, test_size=0.2)
+
+def salvar_modelo(model, caminho, arquitetura, caracteristicas):
+    """Salva o .h5 e os metadados que os motores de inferência leem (representação,
+    frames que o modelo vê e passo entre eles)"""
+    model.save(caminho)
+    _, passos, _ = model.input_shape
+    salvar_metadados(caminho, caracteristicas=caracteristicas, passos=passos,
+                     passo=arquitetura['passo'], arquitetura=arquitetura['nome'])
+
+
+def treinar(frames, divisao, num_classes, arquitetura, caracteristicas, epocas, callbacks=(), verbose=1):
+    """Treina a `arquitetura` (ver treino.ler_arquitetura) na divisão treino/validação dada"""
+    idx_train, idx_test, y_train, y_test = divisao
+    # Sem @passos, a janela cobre a amostra inteira
+    passos = arquitetura['passos'] or frames.shape[1] // arquitetura['passo']
+    model = criar_modelo(passos, largura_caracteristicas(caracteristicas), num_classes,
+                         arquitetura['unidades'], tipo=arquitetura['tipo'])
+    dados = {'caracteristicas': caracteristicas, 'passos': passos, 'passo': arquitetura['passo']}
     history = model.fit(
-        X_train, y_train,
-        validation_data=(X_test, y_test),
-        epochs=30,
-        batch_size=32,
-        verbose=1
+        criar_tf_dataset(frames, idx_train, y_train, BATCH_SIZE, **dados),
+        validation_data=criar_tf_dataset(frames, idx_test, y_test, BATCH_SIZE, embaralhar=False, **dados),
+        epochs=epocas,
+        callbacks=list(callbacks),
+        verbose=verbose
     )
+    return model, history
+
+
+def fronteira_pareto(resultados):
+    """Nomes das arquiteturas que nenhuma outra supera em latência e acurácia ao mesmo tempo"""
+    fronteira = []
+    for nome, r in resultados.items():
+        dominada = any(o['latencia_ms'] <= r['latencia_ms'] and o['acuracia'] >= r['acuracia']
+                       and (o['latencia_ms'] < r['latencia_ms'] or o['acuracia'] > r['acuracia'])
+                       for outro, o in resultados.items() if outro != nome)
+        if not dominada:
+            fronteira.append(nome)
+    return fronteira
+
+
+def varredura(frames, divisao, num_classes, arquiteturas, args):
+    """Treina cada arquitetura na mesma divisão e mede acurácia, latência de uma
+    janela na CPU (tf_function, com a conversão das características) e tamanho"""
+    import tensorflow as tf
+    from app.nucleo.inferencia import MotorTFFunction
+
+    janelas = np.asarray(frames[divisao[1][:200]])
+    resultados = {}
+    with tempfile.TemporaryDirectory() as pasta:
+        for arquitetura in arquiteturas:
+            nome = arquitetura['nome']
+            print(f"Treinando {nome}...")
+            tf.keras.utils.set_random_seed(args.semente)
+            model, history = treinar(frames, divisao, num_classes, arquitetura,
+                                     args.caracteristicas, args.epocas, verbose=0)
+            caminho = Path(pasta) / 'modelo.h5'
+            salvar_modelo(model, caminho, arquitetura, args.caracteristicas)
+            motor = MotorTFFunction(caminho)
+            entradas = janelas[:, None, :motor.tamanho_sequencia]
+            resultados[nome] = {
+                'acuracia': float(history.history['val_accuracy'][-1]),
+                'acuracia_maxima': float(max(history.history['val_accuracy'])),
+                'latencia_ms': mediana_ms(motor.prever, entradas, args.repeticoes),
+                'parametros': model.count_params(),
+                'tamanho_kb': caminho.stat().st_size / 1024,
+                'passos': motor.preparar.passos_modelo,
+                'janela': motor.tamanho_sequencia,
+            }
+            tf.keras.backend.clear_session()
+
+    fronteira = fronteira_pareto(resultados)
+    aceitas = [n for n in resultados if resultados[n]['acuracia'] >= args.piso]
+    escolhida = min(aceitas, key=lambda n: resultados[n]['latencia_ms']) if aceitas else None
+
+    print(f"\n{'arquitetura':<14} {'acurácia':>9} {'máx':>6} {'latência':>9} {'parâmetros':>10} "
+          f"{'tamanho':>8} {'janela':>6}  pareto")
+    for nome in sorted(resultados, key=lambda n: resultados[n]['latencia_ms']):
+        r = resultados[nome]
+        marca = '★' if nome in fronteira else ''
+        if nome == escolhida:
+            marca += ' <- mais rápida com acurácia ≥ piso'
+        print(f"{nome:<14} {r['acuracia']:>9.1%} {r['acuracia_maxima']:>6.1%} {r['latencia_ms']:>7.3f}ms "
+              f"{r['parametros']:>10,} {r['tamanho_kb']:>6.0f}KB {r['janela']:>6}  {marca}")
+    print(f"(características: {args.caracteristicas}; latência: mediana de uma janela na CPU; "
+          f"janela: frames até a primeira predição)")
+
+    args.relatorio.write_text(json.dumps({
+        'caracteristicas': args.caracteristicas,
+        'epocas': args.epocas,
+        'piso': args.piso,
+        'pareto': fronteira,
+        'escolhida': escolhida,
+        'arquiteturas': resultados,
+    }, indent=2, ensure_ascii=False))
+    print(f"\n✅ Relatório salvo em: {args.relatorio}")
+    if escolhida is None:
+        print(f"⚠️ Nenhuma arquitetura atingiu o piso de {args.piso:.0%}")
+    else:
+        print(f"Para treinar a escolhida: python treinar_modelo_gestos.py --arquitetura {escolhida}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Treina o modelo de gestos ou compara arquiteturas")
+    parser.add_argument('--caracteristicas', default=CARACTERISTICAS, choices=TIPOS)
+    parser.add_argument('--arquitetura', default=None,
+                        help="tipo:unidades, ex.: lstm:64 ou gru:32 (padrão: LSTM conforme as "
+                             "características, ver treino.UNIDADES_PADRAO)")
+    parser.add_argument('--epocas', type=int, default=30)
+    parser.add_argument('--varredura', nargs='*', default=None, metavar='ARQUITETURA',
+                        help="Treina cada arquitetura e gera a tabela acurácia x latência "
+                             f"(sem argumentos: {' '.join(VARREDURA_PADRAO)})")
+    parser.add_argument('--piso', type=float, default=0.9, help="Acurácia mínima para escolher na varredura")
+    parser.add_argument('--repeticoes', type=int, default=300, help="Janelas medidas por arquitetura")
+    parser.add_argument('--semente', type=int, default=0)
+    parser.add_argument('--relatorio', type=Path, default=MODEL_DIR / 'varredura.json')
+    args = parser.parse_args()
+    try:
+        arquitetura = ler_arquitetura(args.arquitetura or
+                                      f"lstm:{','.join(map(str, UNIDADES_PADRAO[args.caracteristicas]))}")
+        arquiteturas = [ler_arquitetura(a) for a in args.varredura or VARREDURA_PADRAO]
+    except ValueError as e:
+        parser.error(str(e))
+    for a in [arquitetura] + arquiteturas:
+        if (a['passos'] or 1) * a['passo'] > SEQUENCE_LENGTH:
+            parser.error(f"A janela de {a['nome']} passa dos {SEQUENCE_LENGTH} frames das amostras")
+
+    print("=== TREINAMENTO DE MODELO ===")
+    try:
+        frames, indices, y = carregar_dados()
+        print(f"Amostras: {len(indices)} ({frames.nbytes / 2**20:.0f}MB em disco, lidas sob demanda)")
+
+        # Codificação
+        le = LabelEncoder()
+        y_encoded = le.fit_transform(y)
+
+        if args.varredura is not None:
+            divisao = train_test_split(indices, y_encoded, test_size=0.2, random_state=args.semente)
+            varredura(frames, divisao, len(le.classes_), arquiteturas, args)
+            return
+
+        # Treinamento (divisão feita só sobre os índices)
+        divisao = train_test_split(indices, y_encoded, test_size=0.2)
+        monitor = MonitorTreinamento(len(divisao[0]))
+        model, history = treinar(frames, divisao, len(le.classes_), arquitetura,
+                                 args.caracteristicas, args.epocas, callbacks=[monitor])
+        _, passos, _ = model.input_shape
+        print(f"Características: {args.caracteristicas} | {arquitetura['nome']} | "
+              f"{model.count_params():,} parâmetros | janela de {passos * arquitetura['passo']} frames")
+
+        # Salva modelo
+        salvar_modelo(model, MODEL_DIR / 'modelo_gestos.h5', arquitetura, args.caracteristicas)
+        joblib.dump(le, MODEL_DIR / 'rotulador_gestos.pkl')
+
+        print(f"\n✅ Treinamento concluído!")
+        print(f"Gestos reconhecíveis: {list(le.classes_)}")
+        print(f"Acurácia de validação: {history.history['val_accuracy'][-1]:.2%}")
+        taxa_media = np.mean([epoca['amostras_s'] for epoca in monitor.historico])
+        pico = pico_memoria_mb()
+        print(f"Vazão média: {taxa_media:,.0f} amostras/s | pico de RSS: "
+              f"{f'{pico:.0f}MB' if pico is not None else 'indisponível'}")
 
-    # Salva modelo
-    model.save(MODEL_DIR / 'modelo_gestos.h5')
-    joblib.dump(le, MODEL_DIR / 'rotulador_gestos.pkl')
+    except Exception as e:
+        print(f"\n❌ Erro durante o treinamento: {str(e)}")
+        print("Verifique:")
+        print("- Se coletou dados suficientes (python coletar_gestos.py)")
+        print("- Se migrou o CSV antigo (python migrar_csv.py)")
 
-    print(f"\n✅ Treinamento concluído!")
-    print(f"Gestos reconhecíveis: {list(le.classes_)}")
-    print(f"Acurácia de validação: {history.history['val_accuracy'][-1]:.2%}")
 
-except Exception as e:
-    print(f"\n❌ Erro durante o treinamento: {str(e)}")
-    print("Verifique:")
-    print("- Se coletou dados suficientes (python coletar_gestos.py)")
-    print("- Se o CSV está no formato correto")
\ No newline at end of file
+if __name__ == "__main__":
+    main()